@@ -4,18 +4,34 @@ import logging
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QComboBox, QTableWidget, QTableWidgetItem, QAbstractItemView, QMessageBox,
-    QListWidget, QDialog, QDialogButtonBox, QTreeWidget, QTreeWidgetItem, 
+    QListWidget, QDialog, QDialogButtonBox, QTreeView, 
     QMenu, QInputDialog, QFileDialog, QStackedWidget, QScrollArea, QFrame,
     QSizePolicy, QHeaderView
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
 
 # Force matplotlib backend BEFORE importing matplotlib components
-import openpyxl
 from datetime import datetime
 import os
+import time
 import GUI.styles as styles
+from managers.delta_export import DeltaExporter, DeliveryConflict, DELTA_FORMATS
+from managers.delivery_bundle import DeliveryBundler
+from managers.cold_storage import ColdStorage, COLD_STORAGE_DAYS, stored_exists, is_stored_path, extract_copy
+from managers.xlsx_manager import TIMESTAMP_FORMAT
+from managers.dashboard_snapshot import file_stamp
+from GUI.table_models import (
+    RowTableModel, SearchFilterProxy, StatusDelegate, create_table_view, current_source_row,
+)
+from GUI.background import BackgroundLoader
+from GUI.order_watcher import OrderWatcher
+from GUI.company_tree_model import CompanyTreeModel, CompanyTreeFilter
+from GUI.change_events import (
+    ChangeBus, CompanyEvent, CompanyAdded, CompanyUpdated, CompanyArchived, CompanyRestored, CompanyDeleted,
+    BoardEvent, BoardAdded, BoardRenamed, BoardArchived, BoardRestored, BoardDeleted,
+    OrderEvent, OrderCreated, OrderStatusChanged, OrderDeleted,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +41,55 @@ try:
 except Exception:
     DEFAULT_VISIBLE_ROWS = 15
 
+# Table searches run this long after the last keystroke
+SEARCH_DEBOUNCE_MS = 150
+
+# Shown in the awaiting table until an order's file has been scanned
+STATUS_COMPUTING = "Computing…"
+
+# Status column colours of the awaiting-confirmation table
+AWAIT_STATUS_COLOURS = {"Complete": "green", "Active": "#ccc", "Pending": "orange", STATUS_COMPUTING: "#888"}
+
+# content_stack order of the panels; each is built by build_<name>_panel the first time it is shown
+PANELS = ("create_order", "companies", "boards", "awaiting", "archive", "users")
+
+# Background loads that only feed one panel: content_stack index of that panel.
+# They are cancelled when the admin navigates elsewhere and rerun on return.
+PANEL_LOADS = {"company_tree": 1, "awaiting": 3, "awaiting_status": 3, "archive": 4, "users": 5}
+
+# What the sidebar loading indicator calls each background load
+LOAD_LABELS = {"company_tree": "companies", "dropdowns": "companies", "awaiting": "orders",
+               "awaiting_status": "order status", "order_status": "order status", "archive": "archive",
+               "users": "users"}
+
+def _timestamp_sort_key(text):
+    return datetime.strptime(text, TIMESTAMP_FORMAT).isoformat()
+
+
+def _debounced_search(line_edit, proxy, parent):
+    """Filter proxy by line_edit's text SEARCH_DEBOUNCE_MS after typing stops; returns the timer."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(SEARCH_DEBOUNCE_MS)
+    timer.timeout.connect(lambda: proxy.set_search(line_edit.text()))
+    line_edit.textChanged.connect(timer.start)
+    return timer
+
+
+def open_order_file(parent, file_path):
+    """Open an order workbook in Excel; one in cold storage opens as a read-only extracted copy."""
+    try:
+        if not stored_exists(file_path):
+            QMessageBox.warning(parent, "File Not Found", f"File not found:\n{file_path}")
+            return
+        if is_stored_path(file_path):
+            logger.info(f"Opening a read-only copy of {file_path} (restore the order to edit it)")
+        os.startfile(extract_copy(file_path))
+    except Exception as e:
+        logger.error(f"Failed to open file {file_path}: {e}")
+        QMessageBox.warning(parent, "Open Failed", f"Could not open file:\n{e}")
+
+
 class SidebarButton(QPushButton):
     """Custom sidebar navigation button"""
     def __init__(self, icon, text, parent=None):
@@ -121,24 +186,34 @@ class BlockingOrdersDialog(QDialog):
         text = sel.text()
         parts = text.split(' — ', 1)
         if len(parts) == 2:
-            file_path = parts[1]
-            try:
-                if os.path.exists(file_path):
-                    os.startfile(file_path)
-                else:
-                    QMessageBox.warning(self, "File Not Found", f"File not found:\n{file_path}")
-            except Exception as e:
-                QMessageBox.warning(self, "Open Failed", f"Could not open file:\n{e}")
+            open_order_file(self, parts[1])
 
 
 class AdminWindow(QWidget):
-    def __init__(self, username: str, user_id: int, db_manager, xlsx_manager, on_logout=None):
+    def __init__(self, username: str, user_id: int, db_manager, xlsx_manager, on_logout=None,
+                 dashboard_snapshot=None):
         super().__init__()
         self.username = username
         self.user_id = user_id
         self.db_manager = db_manager
         self.xlsx_manager = xlsx_manager
         self.on_logout = on_logout
+        self.delta_exporter = DeltaExporter(db_manager, xlsx_manager)
+        self.bundler = DeliveryBundler(db_manager, xlsx_manager)
+        self.cold_storage = ColdStorage(db_manager, xlsx_manager)
+        # Optional DashboardSnapshot: shown at login until fresh data arrives, saved on close
+        self.dashboard_snapshot = dashboard_snapshot
+        self._snapshot = None
+        # order_id -> (file_path, (size, mtime_ns), status) as of each order's last scan
+        self._order_state = {}
+        # DB and order-file reads for the panels run here, off the GUI thread
+        self.loader = BackgroundLoader(parent=self)
+        self._stale_loads = set()
+        # Admin actions publish what they changed here; each view patches only what it shows
+        self.changes = ChangeBus(self)
+        # Pushes saves by operators (order files, serial results) into the awaiting panel while it is shown
+        self.order_watcher = OrderWatcher(db_manager, self)
+        self.order_watcher.orders_changed.connect(self.on_orders_changed)
         
         self.setWindowTitle("Label Tracker - Admin")
         self.setMinimumSize(1200, 700)
@@ -148,7 +223,6 @@ class AdminWindow(QWidget):
 
         logger.info(f"Admin window initialized for user: {username}")
         self.setup_ui()
-        self.load_initial_data()
 
     def setup_ui(self):
         main_layout = QHBoxLayout(self)
@@ -174,9 +248,9 @@ class AdminWindow(QWidget):
         sidebar_layout.addWidget(title_label)
         
         # User info
-        user_label = QLabel(f"Admin: {self.username}")
-        user_label.setStyleSheet("color: #aaa; padding: 0 20px 20px 20px;")
-        sidebar_layout.addWidget(user_label)
+        self.user_label = QLabel(f"Admin: {self.username}")
+        self.user_label.setStyleSheet("color: #aaa; padding: 0 20px 20px 20px;")
+        sidebar_layout.addWidget(self.user_label)
         
         # Navigation buttons
         self.nav_buttons = []
@@ -198,6 +272,11 @@ class AdminWindow(QWidget):
             btn.clicked.connect(self.on_nav_clicked)
         
         sidebar_layout.addStretch()
+
+        self.loading_label = QLabel("")
+        self.loading_label.setStyleSheet("color: #aaa; padding: 0 20px 10px 20px;")
+        sidebar_layout.addWidget(self.loading_label)
+        self.loader.busy_changed.connect(self.on_loading_changed)
         
         # Logout button
         self.logout_button = QPushButton("Logout")
@@ -209,20 +288,10 @@ class AdminWindow(QWidget):
         self.content_stack = QStackedWidget()
         self.content_stack.setStyleSheet("background-color: #0f1419;")
         
-        # Create panels
-        self.panel_create_order = self.build_create_order_panel()
-        self.panel_companies = self.build_companies_panel()
-        self.panel_boards = self.build_boards_panel()
-        self.panel_awaiting = self.build_awaiting_panel()
-        self.panel_archive = self.build_archive_panel()
-        self.panel_users = self.build_users_panel()
-        
-        self.content_stack.addWidget(self.panel_create_order)
-        self.content_stack.addWidget(self.panel_companies)
-        self.content_stack.addWidget(self.panel_boards)
-        self.content_stack.addWidget(self.panel_awaiting)
-        self.content_stack.addWidget(self.panel_archive)
-        self.content_stack.addWidget(self.panel_users)
+        # Panels are built on first navigation; until then each slot holds an empty placeholder
+        self._built_panels = set()
+        for _ in PANELS:
+            self.content_stack.addWidget(QWidget())
         
         # Add to main layout
         main_layout.addWidget(sidebar)
@@ -230,8 +299,39 @@ class AdminWindow(QWidget):
         
         # Set initial view
         self.btn_create_order.setChecked(True)
+        self.ensure_panel(0)
         self.content_stack.setCurrentIndex(0)
 
+    def ensure_panel(self, index) -> bool:
+        """Build the panel at content_stack index (and start its loads) unless it exists; True if just built"""
+        name = PANELS[index]
+        if name in self._built_panels:
+            return False
+        started = time.perf_counter()
+        panel = getattr(self, f"build_{name}_panel")()
+        setattr(self, f"panel_{name}", panel)
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, panel)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._built_panels.add(name)
+        self._load_panel(name)
+        logger.info(f"Built {name} panel in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return True
+
+    def panel_built(self, name) -> bool:
+        return name in self._built_panels
+
+    def show_panel(self, index):
+        """Switch to the panel at content_stack index, building it the first time"""
+        self.ensure_panel(index)
+        self.content_stack.setCurrentIndex(index)
+        if index == 3:
+            self.load_awaiting_confirmation_orders()
+        elif index == 4:
+            self.load_all_orders()
+        self.on_panel_changed(index)
+
     def on_nav_clicked(self):
         """Handle navigation button clicks"""
         sender = self.sender()
@@ -240,20 +340,36 @@ class AdminWindow(QWidget):
             if btn != sender:
                 btn.setChecked(False)
         
-        if sender == self.btn_create_order:
-            self.content_stack.setCurrentIndex(0)
-        elif sender == self.btn_companies:
-            self.content_stack.setCurrentIndex(1)
-        elif sender == self.btn_boards:
-            self.content_stack.setCurrentIndex(2)
-        elif sender == self.btn_awaiting:
-            self.content_stack.setCurrentIndex(3)
-            self.load_awaiting_confirmation_orders()
-        elif sender == self.btn_archive:
-            self.content_stack.setCurrentIndex(4)
-            self.load_all_orders()
-        elif sender == self.btn_users:
-            self.content_stack.setCurrentIndex(5)
+        self.show_panel(self.nav_buttons.index(sender))
+
+    def on_panel_changed(self, index):
+        """Cancel loads for panels that are no longer shown and rerun any cancelled ones for this panel"""
+        for name, panel_index in PANEL_LOADS.items():
+            if panel_index != index and self.loader.is_loading(name):
+                self.loader.cancel(name)
+                self._stale_loads.add(name)
+        reloads = {"company_tree": self.refresh_company_tree, "awaiting": self.load_awaiting_confirmation_orders,
+                   "awaiting_status": self.load_awaiting_confirmation_orders, "archive": self.load_all_orders,
+                   "users": self.load_users}
+        for name in [n for n in self._stale_loads if PANEL_LOADS[n] == index]:
+            self._stale_loads.discard(name)
+            if not self.loader.is_loading(name):
+                reloads[name]()
+        if index == PANEL_LOADS["awaiting"]:
+            self.order_watcher.start()
+        else:
+            self.order_watcher.stop()
+
+    def on_loading_changed(self, names):
+        # Per-order loads are named "order_status:<order_id>"
+        labels = sorted({LOAD_LABELS.get(n.split(":")[0], n) for n in names})
+        self.loading_label.setText(f"Loading {', '.join(labels)}…" if labels else "")
+
+    def closeEvent(self, event):
+        self.save_snapshot()
+        self.loader.cancel_all()
+        self.order_watcher.stop()
+        super().closeEvent(event)
 
     def build_create_order_panel(self):
         """Build the create order content panel"""
@@ -406,8 +522,18 @@ class AdminWindow(QWidget):
         self.show_archived_checkbox.setStyleSheet(styles.BUTTON_STYLE)
         panel.content_layout.addWidget(self.show_archived_checkbox)
         
-        self.company_tree = QTreeWidget()
-        self.company_tree.setHeaderLabels(["Company", "Orders & Boards"])
+        self.company_filter_input = QLineEdit()
+        self.company_filter_input.setPlaceholderText("Filter companies, part numbers and loaded orders...")
+        panel.content_layout.addWidget(self.company_filter_input)
+
+        self.company_tree_model = CompanyTreeModel(self.db_manager, self)
+        self.company_tree_proxy = CompanyTreeFilter(self.company_tree_model, self)
+        self.company_filter_timer = _debounced_search(self.company_filter_input, self.company_tree_proxy, self)
+        self.company_tree = QTreeView()
+        self.company_tree.setModel(self.company_tree_proxy)
+        self.company_tree.setUniformRowHeights(True)
+        self.company_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.company_tree.clicked.connect(self.on_company_tree_clicked)
         self.company_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.company_tree.customContextMenuRequested.connect(self.open_context_menu)
         self.company_tree.setMinimumHeight(DEFAULT_VISIBLE_ROWS * 24 + 48)
@@ -455,6 +581,12 @@ class AdminWindow(QWidget):
         info.setStyleSheet("color: #aaa; margin-bottom: 10px;")
         left_layout.addWidget(info)
 
+        # Shown while the list is still the snapshot saved at the last logout
+        self.snapshot_label = QLabel("")
+        self.snapshot_label.setStyleSheet("color: orange; margin-bottom: 6px;")
+        self.snapshot_label.setVisible(False)
+        left_layout.addWidget(self.snapshot_label)
+
         # Filter buttons
         filter_layout = QHBoxLayout()
         self.filter_all_btn = QPushButton("All")
@@ -474,15 +606,18 @@ class AdminWindow(QWidget):
         self.filter_all_btn.setChecked(True)
         left_layout.addLayout(filter_layout)
 
-        self.await_table = QTableWidget()
-        self.await_table.setColumnCount(5)
-        self.await_table.setHorizontalHeaderLabels([
-            "Order ID", "Order Number", "Company", "Board", "Status"
-        ])
-        self.await_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.await_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.await_table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.await_table.itemSelectionChanged.connect(self.on_order_selected)
+        self.await_search_input = QLineEdit()
+        self.await_search_input.setPlaceholderText("Search orders...")
+        left_layout.addWidget(self.await_search_input)
+
+        self.await_model = RowTableModel(["Order ID", "Order Number", "Company", "Board", "Status"], self,
+                                         search_columns=(0, 1, 2, 3), sort_keys={0: int})
+        self.await_proxy = SearchFilterProxy(self.await_model, self)
+        self.await_search_timer = _debounced_search(self.await_search_input, self.await_proxy, self)
+        self.await_table = create_table_view(
+            self.await_proxy, status_column=4, delegate=StatusDelegate(AWAIT_STATUS_COLOURS, bold=True),
+            sortable=True)
+        self.await_table.selectionModel().selectionChanged.connect(self.on_order_selected)
         try:
             self.await_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         except Exception:
@@ -535,6 +670,12 @@ class AdminWindow(QWidget):
         self.confirm_archive_btn.setStyleSheet(styles.BUTTON_STYLE)
         self.confirm_archive_btn.setEnabled(False)
         btn_row.addWidget(self.confirm_archive_btn)
+
+        self.export_changes_btn = QPushButton("Export Changes")
+        self.export_changes_btn.clicked.connect(self.export_changes_selected)
+        self.export_changes_btn.setStyleSheet(styles.BUTTON_STYLE)
+        self.export_changes_btn.setEnabled(False)
+        btn_row.addWidget(self.export_changes_btn)
         btn_row.addStretch()
 
         right_layout.addLayout(btn_row)
@@ -556,6 +697,7 @@ class AdminWindow(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search orders...")
         self.search_input.returnPressed.connect(self.search_archived_orders)
+        # Filtering happens as you type; Enter/Search just skip the debounce
         search_layout.addWidget(self.search_input)
         
         search_btn = QPushButton("Search")
@@ -564,7 +706,7 @@ class AdminWindow(QWidget):
         search_layout.addWidget(search_btn)
         
         load_btn = QPushButton("Load All")
-        load_btn.clicked.connect(self.load_all_orders)
+        load_btn.clicked.connect(self.show_all_archived_orders)
         load_btn.setStyleSheet(styles.BUTTON_LINK_STYLE)
         search_layout.addWidget(load_btn)
         
@@ -584,18 +726,26 @@ class AdminWindow(QWidget):
         delete_order_btn.clicked.connect(self.delete_selected_order_permanently)
         delete_order_btn.setStyleSheet(styles.BUTTON_LOGOUT_STYLE)
         order_btn_row.addWidget(delete_order_btn)
+
+        bundle_btn = QPushButton("Create Client Bundle")
+        bundle_btn.clicked.connect(self.create_client_bundle)
+        bundle_btn.setStyleSheet(styles.BUTTON_STYLE)
+        order_btn_row.addWidget(bundle_btn)
+
+        compact_btn = QPushButton("Move Old Orders to Cold Storage")
+        compact_btn.clicked.connect(self.compact_archived_orders)
+        compact_btn.setStyleSheet(styles.BUTTON_STYLE)
+        order_btn_row.addWidget(compact_btn)
         order_btn_row.addStretch()
         
         panel.content_layout.addLayout(order_btn_row)
         
-        self.archived_table = QTableWidget()
-        self.archived_table.setColumnCount(6)
-        self.archived_table.setHorizontalHeaderLabels([
+        self.archived_model = RowTableModel([
             "Order Number", "Company", "Board", "Status", "File Path", "Creation Date", "Created By",
-        ])
-        self.archived_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.archived_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.archived_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        ], self, search_columns=(0, 1, 2), sort_keys={5: _timestamp_sort_key})
+        self.archived_proxy = SearchFilterProxy(self.archived_model, self)
+        self.search_timer = _debounced_search(self.search_input, self.archived_proxy, self)
+        self.archived_table = create_table_view(self.archived_proxy, sortable=True)
         try:
             self.archived_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         except Exception:
@@ -736,17 +886,116 @@ class AdminWindow(QWidget):
         
         return panel
 
-    def load_initial_data(self):
-        """Load all data from database on startup"""
-        try:
-            self.refresh_company_tree()
+    def _load_panel(self, name):
+        """Subscribe a newly built panel to admin changes and start loading what it shows"""
+        if name == "create_order":
+            self.changes.subscribe(self._patch_dropdowns, CompanyEvent, BoardEvent)
             self.refresh_dropdowns()
+        elif name == "companies":
+            self.changes.subscribe(self._patch_company_tree)
+            companies = self._saved_dashboard().get("companies")
+            if companies:
+                self.company_tree_model.set_companies([c[:2] for c in companies],
+                                                      {c[0]: (c[2], c[3]) for c in companies})
+            self.refresh_company_tree()
+        elif name == "boards":
+            # Same companies as the create order dropdown, which is kept current
+            for row in range(1, self.company_dropdown.count()):
+                self.company_for_board_dropdown.addItem(self.company_dropdown.itemText(row),
+                                                        self.company_dropdown.itemData(row))
+        elif name == "awaiting":
+            self.changes.subscribe(self._patch_awaiting, OrderEvent, CompanyDeleted, BoardRenamed)
+            self._show_saved_orders()
+        elif name == "archive":
+            self.changes.subscribe(self._patch_archive_tab)
+        elif name == "users":
             self.load_users()
-            self.load_awaiting_confirmation_orders()
-            logger.info("Initial data loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load initial data: {e}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Failed to load data:\n{str(e)}")
+
+    def _saved_dashboard(self) -> dict:
+        """The dashboard saved at the last logout (read once), or {}"""
+        if self._snapshot is None:
+            self._snapshot = {}
+            if self.dashboard_snapshot is not None:
+                self._snapshot = self.dashboard_snapshot.load(self.db_manager.full_db_path) or {}
+        return self._snapshot
+
+    def _show_saved_orders(self):
+        """Show the awaiting orders saved at the last logout, marked stale, until the fresh load replaces them"""
+        snapshot = self._saved_dashboard()
+        if not snapshot.get("orders"):
+            return
+        orders = snapshot["orders"]
+        self.await_model.set_rows((o[:5] for o in orders), keys=[o[0] for o in orders])
+        self._order_state = {o[0]: (o[5], (o[6], o[7]), o[4]) for o in orders if o[6] is not None}
+        self.snapshot_label.setText(f"Showing orders as of {snapshot['saved_at']:%b %d, %I:%M %p} - refreshing…")
+        self.snapshot_label.setVisible(True)
+        logger.info(f"Showing dashboard snapshot of {len(orders)} orders from {snapshot['saved_at']}")
+
+    def save_snapshot(self):
+        """Save the awaiting list and company badges for the next login"""
+        if self.dashboard_snapshot is None:
+            return
+        # A panel never opened this session keeps what was saved last time
+        saved = self._saved_dashboard()
+        orders = saved.get("orders", [])
+        if self.panel_built("awaiting"):
+            orders = []
+            for row in range(self.await_model.rowCount()):
+                order_id = self.await_model.key(row)
+                file_path, stamp, status = self._order_state.get(order_id, (None, None, STATUS_COMPUTING))
+                size, mtime_ns = stamp or (None, None)
+                orders.append((order_id, *(self.await_model.value(row, c) for c in (1, 2, 3)), status, file_path,
+                               size, mtime_ns))
+        companies = saved.get("companies", [])
+        if self.panel_built("companies"):
+            companies = self.company_tree_model.companies()
+        if not (self.panel_built("awaiting") or self.panel_built("companies")):
+            return
+        if self.dashboard_snapshot.save(self.db_manager.full_db_path, orders, companies):
+            logger.info(f"Saved dashboard snapshot of {len(orders)} orders")
+
+    def start_session(self, username: str, user_id: int):
+        """Reuse this window for the next admin login.
+
+        The previous admin's form input, searches and selection are cleared;
+        built panels, loaded rows and order fingerprints are kept, and the
+        shared data is refreshed as each panel is next shown.
+        """
+        self.username = username
+        self.user_id = user_id
+        self.user_label.setText(f"Admin: {username}")
+        logger.info(f"Admin window reused for user: {username}")
+
+        for field in (self.order_number_input, self.total_boards_input, self.cust_code_input,
+                      self.prefix_input, self.output_path_input):
+            field.clear()
+        self.preview_table.setRowCount(0)
+        self.preview_table.setVisible(False)
+        if self.panel_built("companies"):
+            self.company_filter_input.clear()
+            self.new_company_input.clear()
+            self.new_company_cust_input.clear()
+        if self.panel_built("boards"):
+            self.new_board_input.clear()
+        if self.panel_built("awaiting"):
+            self.await_search_input.clear()
+            self.await_table.clearSelection()
+        if self.panel_built("archive"):
+            self.search_input.clear()
+            self.archived_table.clearSelection()
+        if self.panel_built("users"):
+            self.new_user_input.clear()
+            self.new_user_password.clear()
+
+        # Other stations kept working while nobody was logged in here
+        if self.panel_built("companies"):
+            self._stale_loads.add("company_tree")
+        if self.panel_built("users"):
+            self._stale_loads.add("users")
+        self.refresh_dropdowns()
+        for btn in self.nav_buttons:
+            btn.setChecked(btn is self.btn_create_order)
+        self.show_panel(0)
 
     def handle_logout(self):
         try:
@@ -756,25 +1005,191 @@ class AdminWindow(QWidget):
         except Exception as e:
             logger.error(f"Error during logout: {e}", exc_info=True)
 
+    def _include_archived(self):
+        return bool(getattr(self, 'show_archived_checkbox', None) and self.show_archived_checkbox.isChecked())
+
+    def _fetch_companies(self, include_archived):
+        try:
+            return self.db_manager.get_companies_all(include_archived=include_archived)
+        except Exception:
+            return self.db_manager.get_companies()
+
+    def _company_row(self, company_id):
+        return next((c for c in self._fetch_companies(True) if c[0] == company_id), None)
+
+    def _patch_company_tree(self, event):
+        model = self.company_tree_model
+        if isinstance(event, (CompanyAdded, CompanyRestored)):
+            company = self._company_row(event.company_id)
+            if company is not None:
+                counts = self.db_manager.get_company_order_counts()
+                model.insert_company(company, counts.get(event.company_id, (0, 0)))
+            # A restored company shown with the archived ones gets its boards back
+            model.reload_company(event.company_id)
+        elif isinstance(event, CompanyArchived):
+            if self._include_archived():
+                model.reload_company(event.company_id)
+            else:
+                model.remove_company(event.company_id)
+        elif isinstance(event, CompanyDeleted):
+            model.remove_company(event.company_id)
+        elif isinstance(event, BoardAdded):
+            model.insert_board(event.company_id, event.board_id, event.board_name)
+        elif isinstance(event, BoardRenamed):
+            model.rename_board(event.company_id, event.board_id, event.board_name)
+        elif isinstance(event, (BoardArchived, BoardRestored)):
+            # The board's orders move between it and the company's own list
+            model.reload_company(event.company_id)
+        elif isinstance(event, OrderEvent):
+            if isinstance(event, OrderCreated):
+                order = self.db_manager.get_order(event.order_id)
+                if order is not None:
+                    model.insert_order(order)
+            elif isinstance(event, OrderStatusChanged):
+                model.update_order(event.order_id, event.status)
+            else:
+                model.remove_order(event.order_id)
+            model.set_counts(self.db_manager.get_company_order_counts())
+
+    def _company_dropdowns(self):
+        if self.panel_built("boards"):
+            return self.company_dropdown, self.company_for_board_dropdown
+        return self.company_dropdown,
+
+    def _patch_dropdowns(self, event):
+        dropdowns = self._company_dropdowns()
+        if isinstance(event, (CompanyAdded, CompanyRestored)):
+            company = self._company_row(event.company_id)
+            for dropdown in dropdowns if company is not None else ():
+                if dropdown.findData(event.company_id) < 0:
+                    # Same company_id order refresh_dropdowns lists them in, after "Select Company"
+                    row = next((r for r in range(1, dropdown.count()) if dropdown.itemData(r) > event.company_id),
+                               dropdown.count())
+                    dropdown.insertItem(row, company[1], event.company_id)
+        elif isinstance(event, CompanyDeleted) or (isinstance(event, CompanyArchived) and not self._include_archived()):
+            for dropdown in dropdowns:
+                row = dropdown.findData(event.company_id)
+                if row > 0:
+                    dropdown.removeItem(row)
+        elif isinstance(event, BoardEvent) and self.company_dropdown.currentData() == event.company_id:
+            row = self.board_dropdown.findData(event.board_id)
+            if isinstance(event, (BoardAdded, BoardRestored)) and row < 0:
+                self.board_dropdown.addItem(event.board_name, event.board_id)
+            elif isinstance(event, BoardRenamed) and row >= 0:
+                self.board_dropdown.setItemText(row, event.board_name)
+            elif isinstance(event, (BoardArchived, BoardDeleted)) and row >= 0:
+                self.board_dropdown.removeItem(row)
+
+    def _patch_archive_tab(self, event):
+        model = self.archived_model
+        if isinstance(event, OrderCreated):
+            order = self.db_manager.get_order(event.order_id)
+            if order is not None and model.row_for_key(event.order_id) < 0:
+                model.insert_row(self._archive_rows([order])[0][:7], key=event.order_id)
+        elif isinstance(event, OrderStatusChanged):
+            row = model.row_for_key(event.order_id)
+            if row >= 0:
+                model.update_row(row, {3: event.status})
+        elif isinstance(event, OrderDeleted):
+            self._remove_model_rows(model, [event.order_id])
+        elif isinstance(event, BoardEvent):
+            company = self._company_row(event.company_id)
+            if isinstance(event, BoardRenamed) and company is not None:
+                for row in model.rows_where({1: company[1], 2: event.old_name}):
+                    model.update_row(row, {2: event.board_name})
+            elif isinstance(event, BoardArchived) and company is not None:
+                self._add_table_row(self.archived_boards_table, (event.board_id, event.board_name, company[1]),
+                                    event.company_id)
+            elif isinstance(event, (BoardRestored, BoardDeleted)):
+                self._remove_table_rows(self.archived_boards_table, lambda r, t: t.item(r, 0).text() == str(event.board_id))
+                if isinstance(event, BoardDeleted) and company is not None:
+                    for row in model.rows_where({1: company[1], 2: event.board_name}):
+                        model.update_row(row, {2: "Unknown"})
+        elif isinstance(event, CompanyArchived):
+            company = self._company_row(event.company_id)
+            if company is not None:
+                self._add_table_row(self.archived_companies_table, (company[0], company[1], company[2]))
+            # Archived boards are only listed for active companies
+            self._remove_company_boards(event.company_id)
+        elif isinstance(event, CompanyRestored):
+            self._remove_table_rows(self.archived_companies_table,
+                                    lambda r, t: t.item(r, 0).text() == str(event.company_id))
+        elif isinstance(event, CompanyDeleted):
+            self._remove_model_rows(model, event.order_ids)
+            self._remove_table_rows(self.archived_companies_table,
+                                    lambda r, t: t.item(r, 0).text() == str(event.company_id))
+            self._remove_company_boards(event.company_id)
+
+    def _patch_awaiting(self, event):
+        model = self.await_model
+        if isinstance(event, CompanyDeleted):
+            self._remove_model_rows(model, event.order_ids)
+            for order_id in event.order_ids:
+                self.order_watcher.unwatch(order_id)
+        elif isinstance(event, BoardRenamed):
+            company = self._company_row(event.company_id)
+            for row in model.rows_where({2: company[1], 3: event.old_name}) if company is not None else ():
+                model.update_row(row, {3: event.board_name})
+        elif isinstance(event, OrderDeleted) or (isinstance(event, OrderStatusChanged) and event.status == 'Archived'):
+            self._remove_model_rows(model, [event.order_id])
+            self.order_watcher.unwatch(event.order_id)
+        else:
+            # New or restored order: list it now and fill in its status once its file is scanned
+            order = self.db_manager.get_order(event.order_id)
+            if order is None:
+                return
+            row = model.row_for_key(event.order_id)
+            if row < 0:
+                model.insert_row(self._awaiting_row(order, *self._awaiting_names()), key=event.order_id)
+            else:
+                model.update_row(row, {4: STATUS_COMPUTING})
+            self.order_watcher.watch_order(event.order_id, order[5])
+            self._rescan_order(event.order_id, order[5])
+
+    @staticmethod
+    def _remove_model_rows(model, keys):
+        for key in keys:
+            row = model.row_for_key(key)
+            if row >= 0:
+                model.remove_row(row)
+
+    @staticmethod
+    def _add_table_row(table, values, company_id=None):
+        row = table.rowCount()
+        table.insertRow(row)
+        for column, value in enumerate(values):
+            item = QTableWidgetItem("" if value is None else str(value))
+            if column == 2 and company_id is not None:
+                item.setData(Qt.UserRole, company_id)
+            table.setItem(row, column, item)
+
+    @staticmethod
+    def _remove_table_rows(table, matches):
+        for row in reversed(range(table.rowCount())):
+            if matches(row, table):
+                table.removeRow(row)
+
+    def _remove_company_boards(self, company_id):
+        self._remove_table_rows(self.archived_boards_table,
+                                lambda r, t: t.item(r, 2).data(Qt.UserRole) == company_id)
+
     def refresh_dropdowns(self):
         """Refresh company and board dropdowns from database"""
+        include_archived = self._include_archived()
+        self.loader.submit("dropdowns", lambda job: self._fetch_companies(include_archived), self._apply_dropdowns)
+
+    def _apply_dropdowns(self, companies):
         try:
-            include_archived = getattr(self, 'show_archived_checkbox', None) and self.show_archived_checkbox.isChecked()
-            try:
-                companies = self.db_manager.get_companies_all(include_archived=include_archived)
-            except Exception:
-                companies = self.db_manager.get_companies()
-            
             # Clear and repopulate company dropdowns
-            self.company_dropdown.clear()
-            self.company_dropdown.addItem("Select Company", None)
-            self.company_for_board_dropdown.clear()
-            self.company_for_board_dropdown.addItem("Select Company", None)
+            dropdowns = self._company_dropdowns()
+            for dropdown in dropdowns:
+                dropdown.clear()
+                dropdown.addItem("Select Company", None)
             
             for company in companies:
                 company_id, company_name = company[0], company[1]
-                self.company_dropdown.addItem(company_name, company_id)
-                self.company_for_board_dropdown.addItem(company_name, company_id)
+                for dropdown in dropdowns:
+                    dropdown.addItem(company_name, company_id)
             
             logger.info("Dropdowns refreshed")
         except Exception as e:
@@ -853,63 +1268,72 @@ class AdminWindow(QWidget):
 
     def on_order_selected(self):
         """Handle order selection - show details and pie chart"""
-        row = self.await_table.currentRow()
+        row = current_source_row(self.await_table)
         if row < 0:
             self.order_info_widget.setVisible(False)
             self.stats_widget.setVisible(False)
             self.view_await_btn.setEnabled(False)
             self.confirm_archive_btn.setEnabled(False)
+            self.export_changes_btn.setEnabled(False)
             self.order_details_label.setText("Select an order to view details")
             return
 
         try:
-            order_id = int(self.await_table.item(row, 0).text())
-            order_number = self.await_table.item(row, 1).text()
-            company = self.await_table.item(row, 2).text()
-            board = self.await_table.item(row, 3).text()
+            order_id = self.await_model.key(row)
+            order_number, company, board = (self.await_model.value(row, c) for c in (1, 2, 3))
 
-            # Get file path from database
-            orders = self.db_manager.get_orders()
-            order = next((o for o in orders if o[0] == order_id), None)
+            order = self.db_manager.get_order(order_id)
             if not order:
                 logger.warning(f"Order {order_id} not found in database")
                 return
-
-            file_path = order[5]
-
-            # IMPORTANT: Calculate status directly from file (NOT from table display)
-            status_str, pass_count, fail_count, pending_count, total_count = self.calculate_order_status(file_path)
-
-            logger.info(f"Order {order_number} stats: {status_str} - Pass:{pass_count}, Fail:{fail_count}, Pending:{pending_count}, Total:{total_count}")
+            status_str = self.await_model.value(row, 4)
 
             # Update labels
             self.order_details_label.setText(f"Order Details: {order_number}")
             self.order_number_label.setText(f"Order #: {order_number}")
             self.order_company_label.setText(f"Company: {company}")
             self.order_board_label.setText(f"Board: {board}")
-            self.order_total_label.setText(f"Total Quantity: {total_count}")
 
             self.order_info_widget.setVisible(True)
             self.view_await_btn.setEnabled(True)
-
-            # Enable archive button only if complete
+            self.export_changes_btn.setEnabled(True)
+            # The row's status now; the counts follow from a recount off the GUI thread (_apply_order_counts)
             self.confirm_archive_btn.setEnabled(status_str == "Complete")
-
-            # Draw pie chart with actual counts from file
-            self.draw_pie_chart(pass_count, fail_count, pending_count)
+            self.order_total_label.setText("Total Quantity: …")
+            self._show_counting()
+            self._rescan_order(order_id, order[5])
 
         except Exception as e:
             logger.error(f"Failed to display order details: {e}", exc_info=True)
             QMessageBox.warning(self, "Error", f"Failed to load order details:\n{str(e)}")
         
-    def draw_pie_chart(self, pass_count, fail_count, pending_count):
-        """Display pass/fail/pending statistics"""
-        # Clear previous widgets
+    def _clear_stats(self):
         while self.stats_layout.count():
             child = self.stats_layout.takeAt(0)
             if child.widget():
                 child.widget().deleteLater()
 
+    def _show_counting(self):
+        self._clear_stats()
+        counting = QLabel("Counting results…")
+        counting.setStyleSheet("color: #aaa; font-size: 14pt;")
+        counting.setAlignment(Qt.AlignCenter)
+        self.stats_layout.addWidget(counting)
+        self.stats_widget.setVisible(True)
+
+    def _show_order_counts(self, status_str, pass_count, fail_count, pending_count, total_count):
+        self.order_total_label.setText(f"Total Quantity: {total_count}")
+
+        # Enable archive button only if complete
+        self.confirm_archive_btn.setEnabled(status_str == "Complete")
+
+        # Draw pie chart with actual counts from file
+        self.draw_pie_chart(pass_count, fail_count, pending_count)
+
+    def draw_pie_chart(self, pass_count, fail_count, pending_count):
+        """Display pass/fail/pending statistics"""
+        self._clear_stats()
+
         total = pass_count + fail_count + pending_count
 
         if total == 0:
@@ -950,86 +1374,56 @@ class AdminWindow(QWidget):
         self.stats_widget.setVisible(True)
 
     def refresh_company_tree(self):
-        """Refresh company/board tree from database"""
+        """Refresh the company list and order badges; boards and orders load as companies are expanded"""
+        include_archived = self._include_archived()
+        self.loader.submit("company_tree", lambda job: self._fetch_company_tree(job, include_archived),
+                           self._apply_company_tree)
+
+    def _fetch_company_tree(self, job, include_archived):
+        """(companies, {company_id: (total, open)}) for the tree (runs off the GUI thread)"""
+        companies = self._fetch_companies(include_archived)
+        job.check()
+        return companies, self.db_manager.get_company_order_counts()
+
+    def _apply_company_tree(self, tree):
         try:
-            self.company_tree.clear()
-            include_archived = getattr(self, 'show_archived_checkbox', None) and self.show_archived_checkbox.isChecked()
-            try:
-                companies = self.db_manager.get_companies_all(include_archived=include_archived)
-            except Exception:
-                companies = self.db_manager.get_companies()
-            
-            for company in companies:
-                company_id = company[0]
-                company_name = company[1]
-                company_item = QTreeWidgetItem([company_name, ""])
-                company_item.setData(0, Qt.UserRole, company_id)
-                
-                # Load boards
-                boards = self.db_manager.get_boards_by_company(company_id)
-                board_items = {}
-                for b in boards:
-                    board_id = b[0]
-                    board_name = b[1]
-                    archived = b[2] if len(b) > 2 else 0
-                    if archived:
-                        continue
-                    board_item = QTreeWidgetItem(["", board_name])
-                    board_item.setData(1, Qt.UserRole, board_id)
-                    company_item.addChild(board_item)
-                    board_items[board_id] = board_item
-
-                # Load orders
-                all_orders = self.db_manager.get_orders(company_id=company_id)
-                for order in all_orders:
-                    order_id, order_number, c_id, board_id, status, file_path, created_at, created_by = order
-                    order_text = f"Order: {order_number} [{status}]"
-                    order_item = QTreeWidgetItem(["", order_text])
-                    order_item.setData(0, Qt.UserRole + 1, ("order", order_id))
-                    order_item.setData(0, Qt.UserRole + 2, file_path)
-                    
-                    if board_id and board_id in board_items:
-                        board_items[board_id].addChild(order_item)
-                    else:
-                        company_item.addChild(order_item)
-                
-                self.company_tree.addTopLevelItem(company_item)
-                company_item.setExpanded(True)
-            
+            companies, counts = tree
+            expanded = self.company_tree_model.expanded_company_ids(self.company_tree, self.company_tree_proxy)
+            self.company_tree_model.set_companies(companies, counts)
+            # Re-expanding refetches just those companies' boards and first order pages
+            for company_id in expanded:
+                index = self.company_tree_proxy.mapFromSource(self.company_tree_model.company_index(company_id))
+                if index.isValid():
+                    self.company_tree.expand(index)
             logger.info("Company tree refreshed")
         except Exception as e:
             logger.error(f"Failed to refresh company tree: {e}", exc_info=True)
 
+    def on_company_tree_clicked(self, index):
+        source = self.company_tree_proxy.mapToSource(index)
+        if self.company_tree_model.node(source).kind == "more":
+            self.company_tree_model.load_more(source)
+
     def open_context_menu(self, position):
-        item = self.company_tree.itemAt(position)
-        if not item:
+        index = self.company_tree.indexAt(position)
+        if not index.isValid():
             return
-            
+        node = self.company_tree_model.node(self.company_tree_proxy.mapToSource(index))
+        if node.kind == "more":
+            return
+
         menu = QMenu()
-        
-        # Check if order node
-        try:
-            data_order = item.data(0, Qt.UserRole + 1)
-        except Exception:
-            data_order = None
 
-        if data_order and isinstance(data_order, tuple) and data_order[0] == 'order':
-            order_id = data_order[1]
+        if node.kind == "order":
+            order_id = node.id
             view_action = menu.addAction("View Order File")
             archive_action = menu.addAction("Archive Order")
             action = menu.exec_(self.company_tree.viewport().mapToGlobal(position))
             
             if action == view_action:
-                file_path = item.data(0, Qt.UserRole + 2)
+                file_path = node.file_path
                 if file_path:
-                    import os
-                    try:
-                        if os.path.exists(file_path):
-                            os.startfile(file_path)
-                        else:
-                            QMessageBox.warning(self, "File not found", f"File not found:\n{file_path}")
-                    except Exception as e:
-                        QMessageBox.warning(self, "Open Failed", f"Could not open file:\n{e}")
+                    open_order_file(self, file_path)
                 else:
                     QMessageBox.warning(self, "No file", "No file path recorded for this order.")
 
@@ -1037,16 +1431,15 @@ class AdminWindow(QWidget):
                 try:
                     self.db_manager.archive_order(order_id)
                     QMessageBox.information(self, "Archived", "Order archived and moved to Archive tab.")
-                    self.load_all_orders()
-                    self.refresh_company_tree()
+                    self.changes.publish(OrderStatusChanged(order_id, 'Archived'))
                 except Exception as e:
                     logger.error(f"Failed to archive order: {e}", exc_info=True)
                     QMessageBox.critical(self, "Error", f"Failed to archive order:\n{e}")
             return
 
-        if not item.parent():  # Company
-            company_name = item.text(0)
-            company_id = item.data(0, Qt.UserRole)
+        if node.kind == "company":
+            company_name = node.name
+            company_id = node.id
             
             edit_action = menu.addAction("Edit Company Path")
             delete_action = menu.addAction("Archive Company")
@@ -1057,11 +1450,10 @@ class AdminWindow(QWidget):
             elif action == delete_action:
                 self.delete_company(company_id, company_name)
         else:  # Board
-            board_name = item.text(1)
-            board_id = item.data(1, Qt.UserRole)
-            company_item = item.parent()
-            company_name = company_item.text(0)
-            company_id = company_item.data(0, Qt.UserRole)
+            board_name = node.name
+            board_id = node.id
+            company_name = node.parent.name
+            company_id = node.parent.id
             
             edit_action = menu.addAction("Edit Board")
             archive_action = menu.addAction("Archive Board")
@@ -1197,6 +1589,9 @@ class AdminWindow(QWidget):
             )
 
             logger.info(f"Order {order_number} created with {count} serial numbers using prefix: {serial_prefix}")
+            order_id = self.db_manager.get_order_id_by_file(file_path)
+            if order_id is not None:
+                self.changes.publish(OrderCreated(order_id))
             QMessageBox.information(
                 self, 
                 "Order Created", 
@@ -1247,12 +1642,11 @@ class AdminWindow(QWidget):
             return
         
         try:
-            self.db_manager.add_company(company_name, client_path, cust_code.upper())
+            company_id = self.db_manager.add_company(company_name, client_path, cust_code.upper())
             logger.info(f"Company added: {company_name} (cust_id={cust_code.upper()})")
             QMessageBox.information(self, "Success", f"Company '{company_name}' added successfully!")
             
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
+            self.changes.publish(CompanyAdded(company_id))
             self.new_company_input.clear()
             self.new_company_cust_input.clear()
             
@@ -1290,8 +1684,7 @@ class AdminWindow(QWidget):
 
             logger.info(f"Company updated for {company_name}")
             QMessageBox.information(self, "Success", "Company updated!")
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
+            self.changes.publish(CompanyUpdated(company_id))
 
         except Exception as e:
             logger.error(f"Failed to update company: {e}", exc_info=True)
@@ -1311,8 +1704,7 @@ class AdminWindow(QWidget):
                 self.db_manager.archive_company(company_id)
                 logger.info(f"Company archived: {company_name}")
                 QMessageBox.information(self, "Archived", "Company archived and hidden from normal lists.")
-                self.refresh_company_tree()
-                self.refresh_dropdowns()
+                self.changes.publish(CompanyArchived(company_id))
             except Exception as e:
                 logger.error(f"Failed to archive company: {e}", exc_info=True)
                 QMessageBox.critical(self, "Error", f"Failed to archive company:\n{str(e)}")
@@ -1348,12 +1740,11 @@ class AdminWindow(QWidget):
             return
 
         try:
-            self.db_manager.add_board(company_id, board_name, board_path)
+            board_id = self.db_manager.add_board(company_id, board_name, board_path)
             logger.info(f"Board: {board_name} added with path {board_path}")
             QMessageBox.information(self, "Success", f"Board '{board_name}' added successfully!")
             
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
+            self.changes.publish(BoardAdded(company_id, board_id, board_name))
             self.new_board_input.clear()
             
         except Exception as e:
@@ -1380,8 +1771,7 @@ class AdminWindow(QWidget):
                 
                 logger.info(f"Board updated: {board_name}")
                 QMessageBox.information(self, "Success", "Board updated!")
-                self.refresh_company_tree()
-                self.refresh_dropdowns()
+                self.changes.publish(BoardRenamed(company_id, board_id, new_name.strip(), board_name))
                 
             except Exception as e:
                 logger.error(f"Failed to update board: {e}", exc_info=True)
@@ -1403,90 +1793,33 @@ class AdminWindow(QWidget):
             self.db_manager.archive_board(board_id)
             logger.info(f"Board archived: {board_name}")
             QMessageBox.information(self, "Archived", "Board archived successfully.")
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
+            self.changes.publish(BoardArchived(company_id, board_id, board_name))
         except Exception as e:
             logger.error(f"Failed to archive board: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to archive board:\n{str(e)}")
 
     def load_all_orders(self):
-        """Load all orders from database"""
-        try:
-            orders = self.db_manager.get_orders()
-            self.populate_archive_orders(orders)
-            try:
-                self.populate_archived_boards()
-                try:
-                    self.populate_archived_companies()
-                except Exception:
-                    logger.exception("Failed to populate archived companies")
-            except Exception:
-                logger.exception("Failed to populate archived boards")
-            logger.info(f"Loaded {len(orders)} orders")
-            
-        except Exception as e:
-            logger.error(f"Failed to load orders: {e}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Failed to load orders:\n{str(e)}")
-
-    def load_awaiting_confirmation_orders(self):
-        """Load all orders with calculated status"""
-        try:
-            self.await_table.setRowCount(0)
-            orders = self.db_manager.get_orders()
-
-            companies = {c[0]: c[1] for c in self.db_manager.get_companies()}
-            boards = {}
-            for company_id in companies:
-                for b in self.db_manager.get_boards_by_company(company_id):
-                    board_id = b[0]
-                    board_name = b[1]
-                    archived = b[2] if len(b) > 2 else 0
-                    if archived:
-                        continue
-                    boards[board_id] = board_name
-            
-            row_idx = 0
-            for order in orders:
-                order_id, order_number, company_id, board_id, db_status, file_path, created_at, created_by = order
-
-                if db_status == "Archived":
-                    continue  # Skip archived orders
-
-                status_str, pass_count, fail_count, pending_count, total_count = self.calculate_order_status(file_path)
-
-                company_name = companies.get(company_id, "Unknown")
-                board_name = boards.get(board_id, "N/A") if board_id else "N/A"
-
-                self.await_table.insertRow(row_idx)
-                self.await_table.setItem(row_idx, 0, QTableWidgetItem(str(order_id)))
-                self.await_table.setItem(row_idx, 1, QTableWidgetItem(order_number))
-                self.await_table.setItem(row_idx, 2, QTableWidgetItem(company_name))
-                self.await_table.setItem(row_idx, 3, QTableWidgetItem(board_name))
-
-                status_item = QTableWidgetItem(status_str)
-                if status_str == "Complete - All Pass":
-                    status_item.setForeground(QColor("green"))
-                    status_item.setFont(QFont("", weight=QFont.Bold))
-                elif status_str == "Active":
-                    status_item.setForeground(QColor("blue"))
-                    status_item.setFont(QFont("", weight=QFont.Bold))
-                elif status_str == "Pending":
-                    status_item.setForeground(QColor("yellow"))
-                    status_item.setFont(QFont("", weight=QFont.Bold))
-
-                self.await_table.setItem(row_idx, 4, status_item)
-                row_idx += 1
-            logger.info(f"Loaded {row_idx} awaiting confirmation orders")
-        except Exception as e:
-            logger.error(f"Failed to load awaiting confirmation orders: {e}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Failed to load orders:\n{str(e)}")
-        
-        finally:
-            try:
-                self.await_table.resizeRowsToContents()
-            except Exception:
-                logger.exception("Failed to resize await table rows")
-                pass
+        """Load the archive tab's orders, archived boards and archived companies"""
+        self.loader.submit("archive", self._fetch_archive, self._apply_archive)
+
+    def _fetch_archive(self, job):
+        orders = self.db_manager.get_orders()
+        archived_orders = self._archive_rows(orders) if orders else self.db_manager.get_archived_orders_with_username()
+        job.check()
+        companies = self.db_manager.get_companies_all(include_archived=True)
+        open_companies = {c[0]: c[1] for c in self.db_manager.get_companies()}
+        boards = [(board_id, board_name, company_id, open_companies[company_id])
+                  for board_id, board_name, company_id in self.db_manager.get_archived_boards()
+                  if company_id in open_companies]
+        archived_companies = [(c[0], c[1], c[2] if len(c) > 2 else "") for c in companies if len(c) > 4 and c[4]]
+        return archived_orders, boards, archived_companies
+
+    def _apply_archive(self, result):
+        archived_orders, boards, companies = result
+        self.populate_archive_orders(archived_orders)
+        self.populate_archived_boards(boards)
+        self.populate_archived_companies(companies)
+        logger.info(f"Loaded {len(archived_orders)} orders")
 
     def apply_order_filter(self):
         """Filter Orders based on seleted status"""
@@ -1500,111 +1833,50 @@ class AdminWindow(QWidget):
         sender.setChecked(True)
 
         filter_text = sender.text()
-
-        for row in range(self.await_table.rowCount()):
-            status_item = self.await_table.item(row, 4)
-            if filter_text == "All":
-                self.await_table.setRowHidden(row, False)
-            else:
-                status = status_item.text() if status_item else ""
-                self.await_table.setRowHidden(row, status != filter_text)
+        self.await_proxy.set_column_filter(4, None if filter_text == "All" else filter_text)
 
     def search_archived_orders(self):
-        """Search orders by order number or company"""
-        search_term = self.search_input.text().strip().lower()
-        
-        if not search_term:
-            self.load_all_orders()
-            return
-        
-        try:
-            all_orders = self.db_manager.get_orders()
-            companies = {c[0]: c[1] for c in self.db_manager.get_companies()}
-            boards = {}
-            for company_id in companies:
-                for b in self.db_manager.get_boards_by_company(company_id):
-                    board_id = b[0]
-                    board_name = b[1]
-                    archived = b[2] if len(b) > 2 else 0
-                    if archived:
-                        continue
-                    boards[board_id] = board_name
-            
-            filtered_orders = []
-            for order in all_orders:
-                order_id, order_number, company_id, board_id, status, file_path, created_at, created_by = order
-                company_name = companies.get(company_id, "Unknown")
-                board_name = boards.get(board_id, "N/A") if board_id else "N/A"
-                
-                if (search_term in order_number.lower() or 
-                    search_term in company_name.lower() or
-                    search_term in board_name.lower()):
-                    filtered_orders.append(order)
-            
-            self.populate_archive_orders(filtered_orders)
-            logger.info(f"Search found {len(filtered_orders)} orders")
-            
-        except Exception as e:
-            logger.error(f"Failed to search orders: {e}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Failed to search:\n{str(e)}")
-
-    def populate_archive_orders(self, orders):
-        """Populate the archive table with orders"""
-        self.archived_boards_table.clearContents()
-        self.archived_table.setRowCount(0)
-        
-        try:
-            if not orders: 
-                archived_orders = self.db_manager.get_archived_orders_with_username()
-            else:
-                archived_orders = orders
-            
-            if not archived_orders:
-                return
-            
-            for row_idx, (order_number, company_name, board_name, status, file_path, created_at, username) in enumerate(archived_orders):
-                self.archived_table.insertRow(row_idx)
-                self.archived_table.setItem(row_idx, 0, QTableWidgetItem(order_number or ""))
-                self.archived_table.setItem(row_idx, 1, QTableWidgetItem(company_name or "Unknown"))
-                self.archived_table.setItem(row_idx, 2, QTableWidgetItem(board_name or "Unknown"))
-                self.archived_table.setItem(row_idx, 3, QTableWidgetItem(status or ""))
-                self.archived_table.setItem(row_idx, 4, QTableWidgetItem(file_path or ""))
-                self.archived_table.setItem(row_idx, 5, QTableWidgetItem(created_at or ""))
-                self.archived_table.setItem(row_idx, 6, QTableWidgetItem(str(username or "Unknown")))
-
-                
-        except Exception as e:
-            logger.error(f"Failed to populate archive table: {e}", exc_info=True)
-        finally:
-            # Adjust row heights to fit content
-            try:
-                fm = self.archived_table.fontMetrics()
-                default_h = int(fm.height() * 1.3)
-                if default_h < 20:
-                    default_h = 20
-                self.archived_table.verticalHeader().setDefaultSectionSize(default_h)
-                self.archived_table.resizeRowsToContents()
-            except Exception:
-                pass
+        """Filter the archive table by order number, company or board right away"""
+        self.search_timer.stop()
+        self.archived_proxy.set_search(self.search_input.text())
+
+    def show_all_archived_orders(self):
+        """Clear the search and reload the archive from the database"""
+        self.search_input.clear()
+        self.search_archived_orders()
+        self.load_all_orders()
+
+    def populate_archive_orders(self, archived_orders):
+        """Populate the archive table with rows shaped like get_archived_orders_with_username"""
+        self.archived_model.set_rows(
+            ((order_number, company_name or "Unknown", board_name or "Unknown", status, file_path, created_at,
+              username or "Unknown")
+             for order_number, company_name, board_name, status, file_path, created_at, username, _ in archived_orders),
+            keys=[row[7] for row in archived_orders])
+
+    def _archive_rows(self, orders):
+        """Convert raw orders rows into the archive table's row shape (see get_archived_orders_with_username)"""
+        companies = {c[0]: c[1] for c in self.db_manager.get_companies_all(include_archived=True)}
+        boards = {b[0]: b[1] for b in self.db_manager.get_boards(include_archived=True)}
+        with self.db_manager.get_connection() as conn:
+            users = dict(conn.execute("SELECT user_id, username FROM users").fetchall())
+        return [
+            (order_number, companies.get(company_id), boards.get(board_id), status, file_path, created_at,
+             users.get(created_by), order_id)
+            for order_id, order_number, company_id, board_id, status, file_path, created_at, created_by in orders
+        ]
 
-    def populate_archived_boards(self):
-        """Populate archived boards table"""
+    def populate_archived_boards(self, boards):
+        """Populate archived boards table from (board_id, board_name, company_id, company_name) rows"""
         try:
             self.archived_boards_table.setRowCount(0)
-            companies = {c[0]: c[1] for c in self.db_manager.get_companies()}
-            row_idx = 0
-            for company_id, company_name in companies.items():
-                boards = self.db_manager.get_boards_by_company(company_id)
-                for b in boards:
-                    board_id = b[0]
-                    board_name = b[1]
-                    archived = b[2] if len(b) > 2 else 0
-                    if archived:
-                        self.archived_boards_table.insertRow(row_idx)
-                        self.archived_boards_table.setItem(row_idx, 0, QTableWidgetItem(str(board_id)))
-                        self.archived_boards_table.setItem(row_idx, 1, QTableWidgetItem(board_name))
-                        self.archived_boards_table.setItem(row_idx, 2, QTableWidgetItem(company_name))
-                        row_idx += 1
+            for row_idx, (board_id, board_name, company_id, company_name) in enumerate(boards):
+                self.archived_boards_table.insertRow(row_idx)
+                self.archived_boards_table.setItem(row_idx, 0, QTableWidgetItem(str(board_id)))
+                self.archived_boards_table.setItem(row_idx, 1, QTableWidgetItem(board_name))
+                company_item = QTableWidgetItem(company_name)
+                company_item.setData(Qt.UserRole, company_id)
+                self.archived_boards_table.setItem(row_idx, 2, company_item)
         except Exception as e:
             logger.error(f"Failed to populate archived boards: {e}", exc_info=True)
         finally:
@@ -1618,23 +1890,15 @@ class AdminWindow(QWidget):
             except Exception:
                 pass
 
-    def populate_archived_companies(self):
-        """Populate archived companies table"""
+    def populate_archived_companies(self, companies):
+        """Populate archived companies table from (company_id, company_name, client_path) rows"""
         try:
             self.archived_companies_table.setRowCount(0)
-            companies = self.db_manager.get_companies_all(include_archived=True)
-            row_idx = 0
-            for c in companies:
-                company_id = c[0]
-                company_name = c[1]
-                client_path = c[2] if len(c) > 2 else ""
-                archived_flag = c[4] if len(c) > 4 else 0
-                if archived_flag:
-                    self.archived_companies_table.insertRow(row_idx)
-                    self.archived_companies_table.setItem(row_idx, 0, QTableWidgetItem(str(company_id)))
-                    self.archived_companies_table.setItem(row_idx, 1, QTableWidgetItem(company_name))
-                    self.archived_companies_table.setItem(row_idx, 2, QTableWidgetItem(client_path))
-                    row_idx += 1
+            for row_idx, (company_id, company_name, client_path) in enumerate(companies):
+                self.archived_companies_table.insertRow(row_idx)
+                self.archived_companies_table.setItem(row_idx, 0, QTableWidgetItem(str(company_id)))
+                self.archived_companies_table.setItem(row_idx, 1, QTableWidgetItem(company_name))
+                self.archived_companies_table.setItem(row_idx, 2, QTableWidgetItem(client_path))
         except Exception as e:
             logger.error(f"Failed to populate archived companies: {e}", exc_info=True)
         finally:
@@ -1649,13 +1913,51 @@ class AdminWindow(QWidget):
                 pass
 
     def get_selected_order_id(self):
-        row = self.archived_table.currentRow()
-        if row < 0:
-            return None
+        return self.archived_model.key(current_source_row(self.archived_table))
+
+    def create_client_bundle(self):
+        """Zip a company's archived orders with a checksummed manifest for sending to the client"""
         try:
-            return int(self.archived_table.item(row, 0).text())
-        except Exception:
-            return None
+            companies = self.db_manager.get_companies()
+            if not companies:
+                QMessageBox.warning(self, "No companies", "There are no companies to bundle orders for.")
+                return
+            names = [c[1] for c in companies]
+            name, ok = QInputDialog.getItem(self, "Create Client Bundle", "Company:", names, 0, False)
+            if not ok:
+                return
+            company = companies[names.index(name)]
+
+            order_ids = self.bundler.select_orders(company_id=company[0])
+            if not order_ids:
+                QMessageBox.information(self, "Create Client Bundle", f"{name} has no archived orders.")
+                return
+
+            default_path = os.path.join(company[2], f"{name}_{datetime.now().strftime('%Y%m%d')}.zip")
+            dest_path, _ = QFileDialog.getSaveFileName(self, "Save Bundle", default_path, "Zip files (*.zip)")
+            if not dest_path:
+                return
+
+            self.bundler.build_bundle(dest_path, order_ids)
+            QMessageBox.information(self, "Create Client Bundle",
+                                    f"Bundled {len(order_ids)} orders to:\n{dest_path}")
+        except Exception as e:
+            logger.error(f"Failed to create client bundle: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to create bundle:\n{e}")
+
+    def compact_archived_orders(self):
+        """Move files of long-archived orders into per-month cold storage containers"""
+        days, ok = QInputDialog.getInt(self, "Cold Storage", "Move archived orders older than (days):",
+                                       COLD_STORAGE_DAYS, 0, 3650)
+        if not ok:
+            return
+        try:
+            moved = self.cold_storage.compact(older_than_days=days)
+            QMessageBox.information(self, "Cold Storage", f"Moved {moved} archived order files to cold storage.")
+            self.load_all_orders()
+        except Exception as e:
+            logger.error(f"Failed to compact archived orders: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to move orders to cold storage:\n{e}")
 
     def restore_selected_order(self):
         order_id = self.get_selected_order_id()
@@ -1663,9 +1965,11 @@ class AdminWindow(QWidget):
             QMessageBox.warning(self, "No selection", "Please select an order to restore.")
             return
         try:
+            # Bring the file back out of cold storage before the order becomes live again
+            self.cold_storage.restore(order_id)
             self.db_manager.unarchive_order(order_id)
             QMessageBox.information(self, "Restored", "Order restored successfully.")
-            self.load_all_orders()
+            self.changes.publish(OrderStatusChanged(order_id, 'Pending'))
         except Exception as e:
             logger.error(f"Failed to restore order: {e}")
             QMessageBox.critical(self, "Error", f"Failed to restore order: {e}")
@@ -1683,7 +1987,7 @@ class AdminWindow(QWidget):
         try:
             self.db_manager.delete_order_permanently(order_id)
             QMessageBox.information(self, "Deleted", "Order permanently deleted.")
-            self.load_all_orders()
+            self.changes.publish(OrderDeleted(order_id))
         except Exception as e:
             logger.error(f"Failed to permanently delete order: {e}")
             QMessageBox.critical(self, "Error", f"Failed to permanently delete order: {e}")
@@ -1694,12 +1998,12 @@ class AdminWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please select an archived board first.")
             return
         board_id = int(self.archived_boards_table.item(row, 0).text())
+        board_name = self.archived_boards_table.item(row, 1).text()
+        company_id = self.archived_boards_table.item(row, 2).data(Qt.UserRole)
         try:
             self.db_manager.unarchive_board(board_id)
             QMessageBox.information(self, "Restored", "Board restored successfully.")
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
-            self.load_all_orders()
+            self.changes.publish(BoardRestored(company_id, board_id, board_name))
         except Exception as e:
             logger.error(f"Failed to restore board: {e}")
             QMessageBox.critical(self, "Error", f"Failed to restore board: {e}")
@@ -1710,6 +2014,8 @@ class AdminWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please select an archived board first.")
             return
         board_id = int(self.archived_boards_table.item(row, 0).text())
+        board_name = self.archived_boards_table.item(row, 1).text()
+        company_id = self.archived_boards_table.item(row, 2).data(Qt.UserRole)
         confirm = QMessageBox.question(self, "Confirm Permanent Delete", 
                                        "This will permanently delete the board and cannot be undone. Continue?", 
                                        QMessageBox.Yes | QMessageBox.No)
@@ -1718,9 +2024,7 @@ class AdminWindow(QWidget):
         try:
             self.db_manager.delete_board_permanently(board_id)
             QMessageBox.information(self, "Deleted", "Board permanently deleted.")
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
-            self.load_all_orders()
+            self.changes.publish(BoardDeleted(company_id, board_id, board_name))
         except Exception as e:
             logger.error(f"Failed to permanently delete board: {e}")
             QMessageBox.critical(self, "Error", f"Failed to delete board: {e}")
@@ -1739,9 +2043,7 @@ class AdminWindow(QWidget):
         try:
             self.db_manager.unarchive_company(company_id)
             QMessageBox.information(self, "Restored", "Company restored successfully.")
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
-            self.load_all_orders()
+            self.changes.publish(CompanyRestored(company_id))
         except Exception as e:
             logger.error(f"Failed to restore company: {e}")
             QMessageBox.critical(self, "Error", f"Failed to restore company: {e}")
@@ -1764,90 +2066,149 @@ class AdminWindow(QWidget):
             return
 
         try:
+            order_ids = [o[0] for o in self.db_manager.get_orders(company_id=company_id)]
             self.db_manager.delete_company_permanently(company_id)
             QMessageBox.information(self, "Deleted", "Company permanently deleted.")
-            self.refresh_company_tree()
-            self.refresh_dropdowns()
-            self.load_all_orders()
+            self.changes.publish(CompanyDeleted(company_id, order_ids))
         except Exception as e:
             logger.error(f"Failed to permanently delete company: {e}")
             QMessageBox.critical(self, "Error", f"Failed to delete company: {e}")
 
     def load_awaiting_confirmation_orders(self):
-        """Load all orders with calculated status"""
-        try:
-            self.await_table.setRowCount(0)
-            orders = self.db_manager.get_orders()
-
-            companies = {c[0]: c[1] for c in self.db_manager.get_companies()}
-            boards = {}
-            for company_id in companies:
-                for b in self.db_manager.get_boards_by_company(company_id):
-                    board_id = b[0]
-                    board_name = b[1]
-                    boards[board_id] = board_name
-
-            row_idx = 0
-            for order in orders:
-                order_id, order_number, company_id, board_id, db_status, file_path, created_at, created_by = order
-
-                # Skip archived orders
-                if db_status == 'Archived':
-                    continue
-                
-                # Calculate actual status from file
-                status_str, pass_count, fail_count, pending_count, total_count = self.calculate_order_status(file_path)
-
-                company_name = companies.get(company_id, "Unknown")
-                board_name = boards.get(board_id, "N/A") if board_id else "N/A"
-
-                self.await_table.insertRow(row_idx)
-                self.await_table.setItem(row_idx, 0, QTableWidgetItem(str(order_id)))
-                self.await_table.setItem(row_idx, 1, QTableWidgetItem(order_number))
-                self.await_table.setItem(row_idx, 2, QTableWidgetItem(company_name))
-                self.await_table.setItem(row_idx, 3, QTableWidgetItem(board_name))
-
-                # Color code status
-                status_item = QTableWidgetItem(status_str)
-                if status_str == "Complete":
-                    status_item.setForeground(QColor("green"))
-                    status_item.setFont(QFont("", weight=QFont.Bold))
-                elif status_str == "Active":
-                    status_item.setForeground(QColor("#ccc"))
-                    status_item.setFont(QFont("", weight=QFont.Bold))
-                elif status_str == "Pending":
-                    status_item.setForeground(QColor("orange"))
-                    status_item.setFont(QFont("", weight=QFont.Bold))
-
-                self.await_table.setItem(row_idx, 4, status_item)
-                row_idx += 1
-
-        except Exception as e:
-            logger.error(f"Failed to load orders: {e}", exc_info=True)
-        finally:
+        """Show all unarchived orders from the DB at once, then fill in each status as its file is scanned"""
+        self.loader.cancel("awaiting_status")
+        known = dict(self._order_state)
+        self.loader.submit("awaiting", lambda job: self._fetch_awaiting_orders(job, known),
+                           self._apply_awaiting_orders)
+
+    def _fetch_awaiting_orders(self, job, known=None):
+        """Rows for the awaiting table, the (order_id, file_path) scan list (most active orders first) and
+        every listed order's (order_id, file_path).
+
+        known: _order_state entries; an order whose file still has the fingerprint it had when last
+        scanned keeps that status and is not rescanned.
+        """
+        known = known or {}
+        orders = self.db_manager.get_orders()
+        companies, boards = self._awaiting_names()
+        last_results = self.db_manager.get_last_result_times()
+
+        rows, keys, scans, files = [], [], [], []
+        for order in orders:
+            order_id, order_number, company_id, board_id, db_status, file_path, created_at, created_by = order
+
+            # Skip archived orders
+            if db_status == 'Archived':
+                continue
+
+            keys.append(order_id)
+            files.append((order_id, file_path))
+            state = known.get(order_id)
+            if state and state[0] == file_path and tuple(state[1]) == file_stamp(file_path):
+                rows.append(self._awaiting_row(order, companies, boards, state[2]))
+                continue
+
+            # Status colours come from the table's delegate
+            rows.append(self._awaiting_row(order, companies, boards))
+
+            # Scan orders with the latest activity (new, or serials recently tested) first
             try:
-                self.await_table.resizeRowsToContents()
-            except Exception:
-                pass
+                created = datetime.strptime(created_at, TIMESTAMP_FORMAT).isoformat()
+            except (TypeError, ValueError):
+                created = ""
+            scans.append((max(created, last_results.get(order_id) or ""), order_id, file_path))
+
+        scans.sort(reverse=True)
+        return rows, keys, [(order_id, file_path) for _, order_id, file_path in scans], files
+
+    def _awaiting_names(self):
+        """{company_id: name} and {board_id: name}, archived ones included, for awaiting rows"""
+        companies = {c[0]: c[1] for c in self.db_manager.get_companies_all(include_archived=True)}
+        boards = {b[0]: b[1] for b in self.db_manager.get_boards(include_archived=True)}
+        return companies, boards
+
+    @staticmethod
+    def _awaiting_row(order, companies, boards, status=STATUS_COMPUTING):
+        order_id, order_number, company_id, board_id = order[:4]
+        board_name = boards.get(board_id, "N/A") if board_id else "N/A"
+        return order_id, order_number, companies.get(company_id, "Unknown"), board_name, status
+
+    def _apply_awaiting_orders(self, result):
+        rows, keys, scans, files = result
+        self.await_model.set_rows(rows, keys)
+        self.snapshot_label.setVisible(False)
+        self._order_state = {k: self._order_state[k] for k in keys if k in self._order_state}
+        self.order_watcher.watch(files)
+        for order_id, (_path, stamp, _status) in self._order_state.items():
+            self.order_watcher.mark_seen(order_id, stamp)
+        self.on_order_selected()  # The reset cleared the selection
+        self.loader.submit("awaiting_status", lambda job: self._scan_awaiting_orders(job, scans),
+                           self._finish_awaiting_scan, on_progress=self._apply_order_status)
+
+    def _scan_awaiting_orders(self, job, scans):
+        """Scan order files in priority order, reporting (order_id, status, file_path, stamp) as each one finishes"""
+        for order_id, file_path in scans:
+            job.check()
+            job.report(self._scan_order(order_id, file_path, status_only=True))
+        return len(scans)
+
+    def _scan_order(self, order_id, file_path, status_only=False):
+        # Stamp first: a save during the scan then looks like a change next time instead of being missed
+        stamp = file_stamp(file_path)
+        counts = self.calculate_order_status(file_path)
+        return order_id, counts[0] if status_only else counts, file_path, stamp
+
+    def _apply_order_status(self, update):
+        order_id, status_str, file_path, stamp = update
+        row = self.await_model.row_for_key(order_id)
+        if row < 0:
+            return
+        self.await_model.update_row(row, {4: status_str})
+        if stamp is not None:
+            self._order_state[order_id] = (file_path, stamp, status_str)
+            # Changes after the version this status came from are reported by the watcher
+            self.order_watcher.mark_seen(order_id, stamp)
+
+    def on_orders_changed(self, order_ids):
+        """Recount just the awaiting orders the watcher saw change"""
+        for order_id in order_ids:
+            file_path = self.order_watcher.file_path(order_id)
+            if file_path and self.await_model.row_for_key(order_id) >= 0:
+                self._rescan_order(order_id, file_path)
+
+    def _rescan_order(self, order_id, file_path):
+        """Recount one order's file off the GUI thread, then update its row and, if selected, its details"""
+        self.loader.submit(f"order_status:{order_id}", lambda job: self._scan_order(order_id, file_path),
+                           self._apply_order_counts)
+
+    def _apply_order_counts(self, update):
+        order_id, counts, file_path, stamp = update
+        self._apply_order_status((order_id, counts[0], file_path, stamp))
+        if order_id == self.get_selected_awaiting_order_id():
+            self._show_order_counts(*counts)
+
+    def _finish_awaiting_scan(self, count):
+        logger.info(f"Scanned {count} awaiting confirmation orders")
+        status_cache = getattr(self.xlsx_manager, 'status_cache', None)
+        if status_cache is not None:
+            stats = status_cache.stats()
+            logger.info(f"Status cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+        mirror = getattr(self.xlsx_manager, 'mirror', None)
+        if mirror is not None:
+            stats = mirror.stats()
+            logger.info(f"Order mirror: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
 
     def get_selected_awaiting_order_id(self):
-        row = self.await_table.currentRow()
-        if row < 0:
-            return None
-        try:
-            return int(self.await_table.item(row, 0).text())
-        except Exception:
-            return None
+        return self.await_model.key(current_source_row(self.await_table))
 
     def view_selected_awaiting_file(self):
         """Open the selected order's XLSX file"""
-        row = self.await_table.currentRow()
-        if row < 0:
+        order_id = self.get_selected_awaiting_order_id()
+        if order_id is None:
             QMessageBox.warning(self, "No selection", "Please select an order first.")
             return
 
         try:
-            order_id = int(self.await_table.item(row, 0).text())
             orders = self.db_manager.get_orders()
             order = next((o for o in orders if o[0] == order_id), None)
 
@@ -1855,26 +2216,20 @@ class AdminWindow(QWidget):
                 QMessageBox.warning(self, "No file", "Selected order has no file recorded.")
                 return
 
-            file_path = order[5]
-
-            if os.path.exists(file_path):
-                os.startfile(file_path)
-            else:
-                QMessageBox.warning(self, "File not found", f"File not found:\n{file_path}")
+            open_order_file(self, order[5])
         except Exception as e:
             logger.error(f"Failed to open file: {e}")
             QMessageBox.warning(self, "Open Failed", f"Could not open file:\n{e}")
         
     def confirm_and_archive_selected(self):
         """Archive selected order (only enabled for Complete orders)"""
-        row = self.await_table.currentRow()
-        if row < 0:
+        order_id = self.get_selected_awaiting_order_id()
+        if order_id is None:
             QMessageBox.warning(self, "No selection", "Please select an order first.")
             return
 
         try:
-            order_id = int(self.await_table.item(row, 0).text())
-            order_number = self.await_table.item(row, 1).text()
+            order_number = self.await_model.value(self.await_model.row_for_key(order_id), 1)
 
             ok = QMessageBox.question(
                 self, 
@@ -1887,79 +2242,67 @@ class AdminWindow(QWidget):
                 return
 
             self.db_manager.archive_order(order_id)
-            QMessageBox.information(self, "Archived", "Order archived successfully.")
-            self.load_awaiting_confirmation_orders()
-            self.on_order_selected()  # Refresh details panel
+
+            # The client deliverable is built from the DB, so an operator holding the working file open doesn't matter
+            try:
+                deliverable, _ = self.xlsx_manager.export_deliverable(order_id)
+                QMessageBox.information(self, "Archived",
+                                        f"Order archived successfully.\n\nClient file:\n{deliverable}")
+            except Exception as e:
+                logger.error(f"Failed to export deliverable for order {order_id}: {e}", exc_info=True)
+                QMessageBox.warning(self, "Archived",
+                                    f"Order archived, but the client file could not be created:\n{e}")
+            self.changes.publish(OrderStatusChanged(order_id, 'Archived'))
 
         except Exception as e:
             logger.error(f"Failed to archive order: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to archive order:\n{e}")
     
+    def export_changes_selected(self):
+        """Write the serials changed since the order's last delivery to a client progress file"""
+        order_id = self.get_selected_awaiting_order_id()
+        if order_id is None:
+            QMessageBox.warning(self, "No selection", "Please select an order first.")
+            return
+
+        fmt, ok = QInputDialog.getItem(self, "Export Changes", "File format:", list(DELTA_FORMATS), 0, False)
+        if not ok:
+            return
+
+        try:
+            path, count = self.delta_exporter.export_changes(order_id, fmt=fmt)
+            if path is None:
+                QMessageBox.information(self, "Export Changes", "Nothing changed since the last delivery.")
+            else:
+                QMessageBox.information(self, "Export Changes", f"Exported {count} changed serials to:\n{path}")
+        except DeliveryConflict as e:
+            QMessageBox.warning(self, "Export Changes", str(e))
+        except Exception as e:
+            logger.error(f"Failed to export changes: {e}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to export changes:\n{e}")
+
     def calculate_order_status(self, file_path):
         """
         Calculate order status based on XLSX contents
         Returns: (status_string, pass_count, fail_count, pending_count, total_count)
         """
-        if not file_path or not os.path.exists(file_path):
-            return ("Unknown", 0, 0, 0, 0)
-
-        try:
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            ws = wb.active
-
-            pass_count = 0
-            fail_count = 0
-            pending_count = 0
-            total_count = 0
-
-            # Skip header row, start from row 2
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if not row or len(row) < 7:
-                    continue
-                
-                total_count += 1
-                status_value = row[6]
-
-                if status_value is None:
-                    status = "Pending"
-                else:
-                    status = str(status_value).strip().lower()
-
-
-                if status == "pass":
-                    pass_count += 1
-                elif status == "fail":
-                    fail_count += 1
-                else:
-                    pending_count += 1
-
-            wb.close()
+        # Shared single-pass scanner (also backs is_order_ready_for_confirmation)
+        scan = self.xlsx_manager.scan_order_file(file_path)
+        return (scan["status"], scan["pass_count"], scan["fail_count"],
+                scan["pending_count"], scan["total_count"])
 
-            # Determine overall status
-            if total_count == 0:
-                status_str = "Pending"
-            elif pending_count == total_count:
-                status_str = "Pending"
-            elif pass_count == total_count:
-                status_str = "Complete"
-            else:
-                status_str = "Active"
-
-            logger.debug(f"Calculated status for {file_path}: {status_str}(P:{pass_count}, F:{fail_count}, Pend:{pending_count})")
-            return (status_str, pass_count, fail_count, pending_count, total_count)
-
-        except Exception as e:
-            logger.error(f"Failed to calculate order status: {e}")
-            return ("Error", 0, 0, 0, 0)
-     
     def load_users(self):
         """Load all users from database"""
+        self.loader.submit("users", lambda job: self._fetch_users(), self._apply_users)
+
+    def _fetch_users(self):
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT user_id, username, role FROM users")
+            return cursor.fetchall()
+
+    def _apply_users(self, users):
         try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT user_id, username, role FROM users")
-                users = cursor.fetchall()
-            
             self.user_table.setRowCount(0)
             for row_idx, (user_id, username, role) in enumerate(users):
                 self.user_table.insertRow(row_idx)
@@ -1,6 +1,7 @@
 # app.py
 
 import sys
+import time
 import logging
 from PyQt5.QtWidgets import QApplication
 
@@ -12,18 +13,27 @@ logger = logging.getLogger(__name__)
 
 
 class AppController:
-    def __init__(self, db_manager, xlsx_manager):
+    def __init__(self, db_manager, xlsx_manager, result_journal=None, dashboard_snapshot=None):
         self.app = QApplication(sys.argv)
         self.db_manager = db_manager
         self.xlsx_manager = xlsx_manager
+        self.result_journal = result_journal
+        self.dashboard_snapshot = dashboard_snapshot
         self.current_window = None
         self.current_user = None  # Store user info (user_id, username, role)
+        # One login window and one window per role, reused across logout/login (see start_session)
+        self.login_window = None
+        self.role_windows = {}
         
         logger.info("AppController initialized with backend managers")
         self.show_login()
 
     def show_login(self):
-        self.current_window = LoginWindow(self.handle_login_success, self.db_manager)
+        if self.login_window is None:
+            self.login_window = LoginWindow(self.handle_login_success, self.db_manager)
+        else:
+            self.login_window.reset()
+        self.current_window = self.login_window
         self.current_window.show()
         logger.info("Login window displayed")
 
@@ -38,13 +48,21 @@ class AppController:
         
         self.current_window.close()
 
-        if role == "admin":
+        # Login-to-visible time, logged so window startup changes can be measured on real stations
+        started = time.perf_counter()
+        window_role = "admin" if role == "admin" else "user"
+        pooled = self.role_windows.get(window_role)
+        if pooled is not None:
+            pooled.start_session(username, user_id)
+            self.current_window = pooled
+        elif role == "admin":
             self.current_window = AdminWindow(
                 username=username,
                 user_id=user_id,
                 db_manager=self.db_manager,
                 xlsx_manager=self.xlsx_manager,
-                on_logout=self.show_login
+                on_logout=self.show_login,
+                dashboard_snapshot=self.dashboard_snapshot
             )
         else:
             self.current_window = UserWindow(
@@ -52,11 +70,14 @@ class AppController:
                 user_id=user_id,
                 db_manager=self.db_manager,
                 xlsx_manager=self.xlsx_manager,
-                on_logout=self.show_login
+                on_logout=self.show_login,
+                result_journal=self.result_journal
             )
+        self.role_windows[window_role] = self.current_window
 
         self.current_window.show()
-        logger.info(f"{role.capitalize()} window displayed for {username}")
+        logger.info(f"{role.capitalize()} window {'reused' if pooled else 'displayed'} for {username} "
+                    f"{(time.perf_counter() - started) * 1000:.0f} ms after login")
 
     def run(self):
         logger.info("Starting application event loop")
@@ -0,0 +1,147 @@
+import logging
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class LoadCancelled(Exception):
+    """Raised inside a fetch function to stop a load that is no longer wanted."""
+
+
+class LoadJob:
+    """One submitted load. fetch(job) runs on a pool thread and must not touch widgets;
+    long fetches call job.check() between items so a cancelled load stops early, and
+    job.report(value) to hand partial results to on_progress as they are ready."""
+
+    def __init__(self, name: str, fetch, apply, on_error=None, on_progress=None):
+        self.name = name
+        self.fetch = fetch
+        self.apply = apply
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._cancelled = threading.Event()
+        self._report = None
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def check(self):
+        if self._cancelled.is_set():
+            raise LoadCancelled(self.name)
+
+    def report(self, value):
+        self.check()
+        if self._report is not None:
+            try:
+                self._report(self, value)
+            except RuntimeError:
+                raise LoadCancelled(self.name)
+
+
+class _LoadRunnable(QRunnable):
+    def __init__(self, job: LoadJob, loader):
+        super().__init__()
+        self.job = job
+        self.loader = loader
+
+    def run(self):
+        job = self.job
+        if job.is_cancelled():
+            return
+        try:
+            result = job.fetch(job)
+        except LoadCancelled:
+            logger.debug(f"Background load '{job.name}' cancelled")
+            return
+        except Exception as e:
+            logger.error(f"Background load '{job.name}' failed: {e}", exc_info=True)
+            self._emit(self.loader._failed, job, str(e))
+            return
+        self._emit(self.loader._loaded, job, result)
+
+    def _emit(self, signal, job, value):
+        if job.is_cancelled():
+            return
+        try:
+            signal.emit(job, value)
+        except RuntimeError:
+            # The window owning the loader is gone
+            pass
+
+
+class BackgroundLoader(QObject):
+    """Runs named loads on a QThreadPool and applies their results on the GUI thread.
+
+    Submitting a load cancels the previous load of the same name, and a
+    result (or progress report) only reaches its handler if the job is still
+    the current one, so a slow stale load can never overwrite a newer one.
+    busy_changed reports the names currently loading, for loading indicators.
+    """
+
+    busy_changed = pyqtSignal(list)
+    _loaded = pyqtSignal(object, object)
+    _failed = pyqtSignal(object, str)
+    _progress = pyqtSignal(object, object)
+
+    def __init__(self, pool: QThreadPool = None, parent=None):
+        super().__init__(parent)
+        self.pool = pool if pool is not None else QThreadPool.globalInstance()
+        self._jobs = {}
+        # Emitted from pool threads; queued so handlers always run on the GUI thread
+        self._loaded.connect(self._on_loaded, Qt.QueuedConnection)
+        self._failed.connect(self._on_failed, Qt.QueuedConnection)
+        self._progress.connect(self._on_progress, Qt.QueuedConnection)
+
+    def submit(self, name: str, fetch, apply, on_error=None, on_progress=None) -> LoadJob:
+        self.cancel(name)
+        job = LoadJob(name, fetch, apply, on_error, on_progress)
+        if on_progress is not None:
+            job._report = self._progress.emit
+        self._jobs[name] = job
+        self.busy_changed.emit(self.busy())
+        self.pool.start(_LoadRunnable(job, self))
+        return job
+
+    def _take(self, job: LoadJob) -> bool:
+        if self._jobs.get(job.name) is not job or job.is_cancelled():
+            return False
+        del self._jobs[job.name]
+        self.busy_changed.emit(self.busy())
+        return True
+
+    def _on_loaded(self, job, result):
+        if self._take(job):
+            job.apply(result)
+
+    def _on_progress(self, job, value):
+        if self._jobs.get(job.name) is job and not job.is_cancelled():
+            job.on_progress(value)
+
+    def _on_failed(self, job, error):
+        if self._take(job) and job.on_error is not None:
+            job.on_error(error)
+
+    def cancel(self, name: str):
+        job = self._jobs.pop(name, None)
+        if job is not None:
+            job.cancel()
+            self.busy_changed.emit(self.busy())
+
+    def cancel_all(self):
+        for name in list(self._jobs):
+            self.cancel(name)
+
+    def is_loading(self, name: str) -> bool:
+        return name in self._jobs
+
+    def busy(self) -> list:
+        return sorted(self._jobs)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until the pool is idle (for tests and shutdown)."""
+        return self.pool.waitForDone(msecs)
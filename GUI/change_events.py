@@ -0,0 +1,123 @@
+import logging
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeEvent:
+    """Something an admin action changed in the database."""
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class CompanyEvent(ChangeEvent):
+    def __init__(self, company_id):
+        self.company_id = company_id
+
+
+class CompanyAdded(CompanyEvent):
+    pass
+
+
+class CompanyUpdated(CompanyEvent):
+    """Client path or customer code edited (the name is unchanged)."""
+
+
+class CompanyArchived(CompanyEvent):
+    """The company and all its boards were archived."""
+
+
+class CompanyRestored(CompanyEvent):
+    """The company and all its boards were unarchived."""
+
+
+class CompanyDeleted(CompanyEvent):
+    """The company was deleted with its boards and orders (order_ids: the deleted orders)."""
+
+    def __init__(self, company_id, order_ids=()):
+        super().__init__(company_id)
+        self.order_ids = list(order_ids)
+
+
+class BoardEvent(ChangeEvent):
+    def __init__(self, company_id, board_id, board_name=None):
+        self.company_id = company_id
+        self.board_id = board_id
+        self.board_name = board_name
+
+
+class BoardAdded(BoardEvent):
+    pass
+
+
+class BoardRenamed(BoardEvent):
+    def __init__(self, company_id, board_id, board_name, old_name):
+        super().__init__(company_id, board_id, board_name)
+        self.old_name = old_name
+
+
+class BoardArchived(BoardEvent):
+    pass
+
+
+class BoardRestored(BoardEvent):
+    pass
+
+
+class BoardDeleted(BoardEvent):
+    pass
+
+
+class OrderEvent(ChangeEvent):
+    def __init__(self, order_id):
+        self.order_id = order_id
+
+
+class OrderCreated(OrderEvent):
+    pass
+
+
+class OrderStatusChanged(OrderEvent):
+    """The order's DB status changed, e.g. to 'Archived' or back to 'Pending'."""
+
+    def __init__(self, order_id, status):
+        super().__init__(order_id)
+        self.status = status
+
+
+class OrderDeleted(OrderEvent):
+    pass
+
+
+class ChangeBus(QObject):
+    """Delivers change events to the views that show the changed data.
+
+    Each view subscribes a handler for the event types it displays and
+    patches only the affected rows or nodes, instead of every action
+    reloading every view. A failing handler is logged and does not stop
+    the others.
+    """
+
+    published = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._handlers = []
+
+    def subscribe(self, handler, *event_types):
+        """Call handler(event) for events of event_types (all events if none given)."""
+        self._handlers.append((event_types or (ChangeEvent,), handler))
+
+    def publish(self, event: ChangeEvent):
+        logger.debug(f"Change: {event!r}")
+        for event_types, handler in list(self._handlers):
+            if isinstance(event, event_types):
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(f"Failed to apply {event!r} in {getattr(handler, '__name__', handler)}: {e}",
+                                 exc_info=True)
+        self.published.emit(event)
@@ -0,0 +1,386 @@
+import os
+import logging
+
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QColor
+
+logger = logging.getLogger(__name__)
+
+# Orders fetched per page when a board (or a company's unassigned orders) is expanded or "more" is clicked
+try:
+    ORDER_PAGE_SIZE = max(1, int(os.environ.get('LT_TREE_PAGE_SIZE', '200')))
+except Exception:
+    ORDER_PAGE_SIZE = 200
+
+
+class TreeNode:
+    """One row of the company tree: kind is "company", "board", "order" or "more"."""
+
+    __slots__ = ("kind", "id", "name", "parent", "children", "fetched", "total", "open",
+                 "status", "file_path", "last_id", "loaded")
+
+    def __init__(self, kind, node_id=None, name="", parent=None):
+        self.kind = kind
+        self.id = node_id
+        self.name = name
+        self.parent = parent
+        self.children = []
+        self.fetched = False   # company: boards loaded; board: first page loaded
+        self.total = 0         # orders under this node (from the GROUP BY counts)
+        self.open = 0
+        self.status = None
+        self.file_path = None
+        self.last_id = None    # paging cursor: lowest order_id loaded so far
+        self.loaded = 0        # orders loaded directly under this node
+
+    def row(self) -> int:
+        return self.parent.children.index(self) if self.parent else 0
+
+    def company(self):
+        node = self
+        while node is not None and node.kind != "company":
+            node = node.parent
+        return node
+
+
+class CompanyTreeModel(QAbstractItemModel):
+    """Company -> board -> order tree that reads from the DB only as nodes are expanded.
+
+    set_companies() takes the company list and the per-company counts from
+    one GROUP BY (shown as badges); a company's boards, their order counts
+    and its unassigned orders are fetched on first expand (canFetchMore /
+    fetchMore), and orders are paged in ORDER_PAGE_SIZE at a time, newest
+    first, with a trailing "more" row that load_more() expands.
+    """
+
+    HEADERS = ["Company", "Orders & Boards"]
+
+    def __init__(self, db_manager, parent=None, page_size=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.page_size = page_size or ORDER_PAGE_SIZE
+        self.root = TreeNode("root")
+
+    # ---- Qt model interface ----
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row(), 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if node.kind in ("root",) or node.children:
+            return bool(node.children)
+        if node.kind == "company":
+            return not node.fetched
+        if node.kind == "board":
+            return node.total > 0 and not node.fetched
+        return False
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return node.kind in ("company", "board") and not node.fetched
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        if node.fetched:
+            return
+        node.fetched = True
+        try:
+            if node.kind == "company":
+                self._fetch_boards(parent, node)
+            self._fetch_orders(parent, node)
+        except Exception as e:
+            logger.error(f"Failed to load tree node {node.kind} {node.id}: {e}", exc_info=True)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if node.kind == "company":
+                return node.name if column == 0 else f"{node.total} orders ({node.open} open)"
+            if column == 0:
+                return ""
+            if node.kind == "board":
+                return f"{node.name} ({node.total})"
+            if node.kind == "order":
+                return f"Order: {node.name} [{node.status}]"
+            if node.kind == "more":
+                return f"Show more… ({node.total} not shown)"
+        if role == Qt.ForegroundRole and node.kind == "more":
+            return QColor("#888")
+        if role == Qt.ToolTipRole and node.kind == "order":
+            return node.file_path
+        return None
+
+    # ---- loading ----
+    def node(self, index) -> TreeNode:
+        return index.internalPointer() if index.isValid() else self.root
+
+    def set_companies(self, companies, counts):
+        """Replace the top level. companies: (company_id, company_name, ...) rows; counts from get_company_order_counts()."""
+        self.beginResetModel()
+        self.root = TreeNode("root")
+        for company in companies:
+            node = TreeNode("company", company[0], company[1], self.root)
+            node.total, node.open = counts.get(company[0], (0, 0))
+            self.root.children.append(node)
+        self.endResetModel()
+
+    def _fetch_boards(self, parent_index, company):
+        boards = [b for b in self.db_manager.get_boards_by_company(company.id) if not (b[2] if len(b) > 2 else 0)]
+        counts = self.db_manager.get_board_order_counts(company.id)
+        if not boards:
+            return
+        self.beginInsertRows(parent_index, 0, len(boards) - 1)
+        for board_id, board_name, *_ in boards:
+            node = TreeNode("board", board_id, board_name, company)
+            node.total = counts.get(board_id, 0)
+            company.children.append(node)
+        self.endInsertRows()
+
+    def _container_remaining(self, container) -> int:
+        if container.kind == "board":
+            return container.total - container.loaded
+        # A company's own orders are the ones not under any of its active boards
+        on_boards = sum(c.total for c in container.children if c.kind == "board")
+        return container.total - on_boards - container.loaded
+
+    def _fetch_orders(self, parent_index, container):
+        """Append the next page of orders under a board or company (replacing its "more" row)."""
+        company = container.company()
+        rows = self.db_manager.get_orders_page(
+            company.id, container.id if container.kind == "board" else None, before_id=container.last_id,
+            limit=self.page_size, unassigned=container.kind == "company")
+
+        if container.children and container.children[-1].kind == "more":
+            last = len(container.children) - 1
+            self.beginRemoveRows(parent_index, last, last)
+            container.children.pop()
+            self.endRemoveRows()
+
+        if rows:
+            first = len(container.children)
+            self.beginInsertRows(parent_index, first, first + len(rows) - 1)
+            for order_id, order_number, _c, _b, status, file_path, *_ in rows:
+                node = TreeNode("order", order_id, order_number, container)
+                node.status, node.file_path = status, file_path
+                container.children.append(node)
+            container.loaded += len(rows)
+            container.last_id = rows[-1][0]
+            self.endInsertRows()
+
+        remaining = self._container_remaining(container) if len(rows) == self.page_size else 0
+        if remaining > 0:
+            more = TreeNode("more", parent=container)
+            more.total = remaining
+            row = len(container.children)
+            self.beginInsertRows(parent_index, row, row)
+            container.children.append(more)
+            self.endInsertRows()
+
+    def load_more(self, index):
+        """Load the next page for a "more" row's board/company."""
+        node = self.node(index)
+        if node.kind != "more":
+            return
+        try:
+            self._fetch_orders(index.parent(), node.parent)
+        except Exception as e:
+            logger.error(f"Failed to load more orders: {e}", exc_info=True)
+
+    # ---- in-place patches, so an admin action doesn't rebuild the tree ----
+    def _index_of(self, node, column=0) -> QModelIndex:
+        return QModelIndex() if node is self.root else self.createIndex(node.row(), column, node)
+
+    def _changed(self, node, column=1):
+        index = self._index_of(node, column)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def _insert(self, parent, row, node):
+        self.beginInsertRows(self._index_of(parent), row, row)
+        parent.children.insert(row, node)
+        self.endInsertRows()
+
+    def _remove(self, node):
+        parent, row = node.parent, node.row()
+        self.beginRemoveRows(self._index_of(parent), row, row)
+        parent.children.pop(row)
+        self.endRemoveRows()
+
+    def _company(self, company_id):
+        return next((c for c in self.root.children if c.id == company_id), None)
+
+    def _board(self, company, board_id):
+        if company is None:
+            return None
+        return next((b for b in company.children if b.kind == "board" and b.id == board_id), None)
+
+    def _order(self, order_id):
+        for company in self.root.children:
+            for child in company.children:
+                if child.kind == "order" and child.id == order_id:
+                    return child
+                if child.kind == "board":
+                    found = next((o for o in child.children if o.kind == "order" and o.id == order_id), None)
+                    if found is not None:
+                        return found
+        return None
+
+    def insert_company(self, company, counts=(0, 0)):
+        """Add a company row in company_id order, as set_companies() would list it."""
+        if self._company(company[0]) is not None:
+            return
+        node = TreeNode("company", company[0], company[1], self.root)
+        node.total, node.open = counts
+        row = next((r for r, c in enumerate(self.root.children) if c.id > node.id), len(self.root.children))
+        self._insert(self.root, row, node)
+
+    def remove_company(self, company_id):
+        node = self._company(company_id)
+        if node is not None:
+            self._remove(node)
+
+    def set_counts(self, counts):
+        """Update badges from get_company_order_counts(), repainting only those that changed."""
+        for company in self.root.children:
+            total, open_ = counts.get(company.id, (0, 0))
+            if (total, open_) != (company.total, company.open):
+                company.total, company.open = total, open_
+                self._changed(company)
+
+    def reload_company(self, company_id):
+        """Drop a company's loaded boards and orders, fetching them again if it had been expanded."""
+        node = self._company(company_id)
+        if node is None:
+            return
+        index = self._index_of(node)
+        was_fetched = node.fetched
+        if node.children:
+            self.beginRemoveRows(index, 0, len(node.children) - 1)
+            node.children = []
+            self.endRemoveRows()
+        node.fetched, node.last_id, node.loaded = False, None, 0
+        if was_fetched:
+            self.fetchMore(index)
+
+    def insert_board(self, company_id, board_id, board_name):
+        company = self._company(company_id)
+        if company is None or not company.fetched or self._board(company, board_id) is not None:
+            return  # An unexpanded company loads its boards when expanded
+        row = sum(1 for c in company.children if c.kind == "board")
+        self._insert(company, row, TreeNode("board", board_id, board_name, company))
+
+    def rename_board(self, company_id, board_id, board_name):
+        board = self._board(self._company(company_id), board_id)
+        if board is not None:
+            board.name = board_name
+            self._changed(board)
+
+    def insert_order(self, order):
+        """Show a new order (an orders row) first under its board, or its company if it has no active board."""
+        order_id, order_number, company_id, board_id, status, file_path, *_ = order
+        company = self._company(company_id)
+        if company is None or not company.fetched:
+            return
+        board = self._board(company, board_id)
+        if board is not None:
+            board.total += 1
+            self._changed(board)
+        container = board or company
+        if not container.fetched:
+            return
+        node = TreeNode("order", order_id, order_number, container)
+        node.status, node.file_path = status, file_path
+        row = 0 if board is not None else sum(1 for c in company.children if c.kind == "board")
+        container.loaded += 1
+        self._insert(container, row, node)
+
+    def update_order(self, order_id, status):
+        node = self._order(order_id)
+        if node is not None:
+            node.status = status
+            self._changed(node)
+
+    def remove_order(self, order_id):
+        node = self._order(order_id)
+        if node is None:
+            return
+        container = node.parent
+        container.loaded -= 1
+        self._remove(node)
+        if container.kind == "board":
+            container.total -= 1
+            self._changed(container)
+
+    def expanded_company_ids(self, view, proxy=None) -> list:
+        """Ids of companies currently expanded in view (to restore after set_companies)."""
+        ids = []
+        for row, company in enumerate(self.root.children):
+            index = self.index(row, 0)
+            if proxy is not None:
+                index = proxy.mapFromSource(index)
+            if index.isValid() and view.isExpanded(index):
+                ids.append(company.id)
+        return ids
+
+    def companies(self) -> list:
+        """(company_id, company_name, total_orders, open_orders) of the listed companies."""
+        return [(c.id, c.name, c.total, c.open) for c in self.root.children]
+
+    def company_index(self, company_id) -> QModelIndex:
+        for row, company in enumerate(self.root.children):
+            if company.id == company_id:
+                return self.index(row, 0)
+        return QModelIndex()
+
+
+class CompanyTreeFilter(QSortFilterProxyModel):
+    """Shows nodes whose name (or an ancestor's / a loaded descendant's name) contains the search text."""
+
+    def __init__(self, source: CompanyTreeModel, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self.setRecursiveFilteringEnabled(True)
+        self._text = ""
+
+    def set_search(self, text: str):
+        text = (text or "").strip().lower()
+        if text != self._text:
+            self._text = text
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._text:
+            return True
+        node = self.sourceModel().node(source_parent)
+        node = node.children[source_row] if source_row < len(node.children) else None
+        while node is not None and node.kind != "root":
+            if self._text in (node.name or "").lower():
+                return True
+            node = node.parent
+        return False
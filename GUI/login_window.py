@@ -37,6 +37,12 @@ class LoginWindow(QWidget):
 
         self.setLayout(layout)
 
+    def reset(self):
+        """Clear the previous login before the window is shown again."""
+        self.username_input.clear()
+        self.password_input.clear()
+        self.username_input.setFocus()
+
     def handle_login(self):
         username = self.username_input.text().strip()
         password = self.password_input.text().strip()
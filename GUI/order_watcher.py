@@ -0,0 +1,228 @@
+import os
+import logging
+import sqlite3
+import threading
+
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from GUI.background import BackgroundLoader
+from managers.dashboard_snapshot import file_stamp
+
+logger = logging.getLogger(__name__)
+
+# How often watched order files are stat'ed, for shares where change notifications don't arrive
+try:
+    FILE_POLL_MS = max(100, int(os.environ.get('LT_WATCH_POLL_MS', '5000')))
+except Exception:
+    FILE_POLL_MS = 5000
+
+# How often the DB is checked for result writes from other connections (PRAGMA data_version)
+try:
+    DB_POLL_MS = max(100, int(os.environ.get('LT_DB_POLL_MS', '2000')))
+except Exception:
+    DB_POLL_MS = 2000
+
+# Changes are collected this long after the last one before orders_changed is emitted
+try:
+    CHANGE_DEBOUNCE_MS = max(0, int(os.environ.get('LT_WATCH_DEBOUNCE_MS', '500')))
+except Exception:
+    CHANGE_DEBOUNCE_MS = 500
+
+
+# Stamp of a file not stat'ed yet; the first poll records it without reporting a change
+_UNSEEN = object()
+
+
+class OrderWatcher(QObject):
+    """Notices when watched orders change and emits orders_changed([order_id, ...]).
+
+    Three sources feed it: QFileSystemWatcher on the order files (instant
+    on local disks), a stat poll of the same files (network shares often
+    send no notifications), and a PRAGMA data_version poll on one held-open
+    DB connection, which changes whenever another connection commits; only
+    then are serial_results asked which orders were written (by change_seq).
+    A file's stamp (file_stamp()) is remembered so one save reported by two
+    sources counts once, and changes are debounced so a burst of saves
+    becomes one notification. Between stop() and start() no file is watched
+    and nothing polls; start() reports whatever changed meanwhile.
+
+    The stats and DB queries run as BackgroundLoader jobs (the files are on
+    the share); only the changed order ids come back to the GUI thread. A
+    poll is skipped while the previous one of the same kind is still running.
+    """
+
+    orders_changed = pyqtSignal(list)
+
+    def __init__(self, db_manager, parent=None, file_poll_ms=None, db_poll_ms=None, debounce_ms=None,
+                 loader=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.loader = loader if loader is not None else BackgroundLoader(parent=self)
+        self._paths = {}     # order_id -> file_path
+        self._orders = {}    # file_path -> order_id
+        self._stamps = {}    # order_id -> file_stamp() last seen (_UNSEEN until the first poll)
+        self._dirty = set()
+        # The DB connection is used only by poll jobs, one at a time, under _conn_lock
+        self._conn_lock = threading.Lock()
+        self._conn = None
+        self._polling_db = False
+        self._data_version = None
+        self._last_seq = None
+
+        self._fs = QFileSystemWatcher(self)
+        self._fs.fileChanged.connect(self._on_file_changed)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(CHANGE_DEBOUNCE_MS if debounce_ms is None else debounce_ms)
+        self._debounce.timeout.connect(self._flush)
+        self._file_poll = QTimer(self)
+        self._file_poll.setInterval(file_poll_ms or FILE_POLL_MS)
+        self._file_poll.timeout.connect(self.poll_files)
+        self._db_poll = QTimer(self)
+        self._db_poll.setInterval(db_poll_ms or DB_POLL_MS)
+        self._db_poll.timeout.connect(self.poll_db)
+
+    def watch(self, orders):
+        """Watch exactly these (order_id, file_path) pairs."""
+        orders = dict(orders)
+        for order_id in [o for o in self._paths if orders.get(o) != self._paths[o]]:
+            self.unwatch(order_id)
+        for order_id, file_path in orders.items():
+            self.watch_order(order_id, file_path)
+
+    def watch_order(self, order_id, file_path):
+        if not file_path or self._paths.get(order_id) == file_path:
+            return
+        self.unwatch(order_id)
+        self._paths[order_id] = file_path
+        self._orders[file_path] = order_id
+        # Stat'ed by the next poll, unless the caller reports the stamp it scanned first (mark_seen)
+        self._stamps[order_id] = _UNSEEN
+
+    def mark_seen(self, order_id, stamp):
+        """Record that the caller has seen order_id's file as of stamp; later changes get reported."""
+        if order_id in self._paths and stamp is not None:
+            self._stamps[order_id] = stamp
+
+    def unwatch(self, order_id):
+        file_path = self._paths.pop(order_id, None)
+        self._stamps.pop(order_id, None)
+        self._dirty.discard(order_id)
+        if file_path is not None:
+            self._orders.pop(file_path, None)
+            self._fs.removePath(file_path)
+
+    def file_path(self, order_id):
+        return self._paths.get(order_id)
+
+    def is_active(self) -> bool:
+        return self._file_poll.isActive()
+
+    def start(self):
+        if self.is_active():
+            return
+        with self._conn_lock:
+            self._polling_db = True
+        self._file_poll.start()
+        self._db_poll.start()
+        # Pick up whatever changed while stopped
+        self.poll_files()
+        self.poll_db()
+        existing = [self._paths[o] for o, stamp in self._stamps.items() if stamp not in (None, _UNSEEN)]
+        if existing:
+            self._fs.addPaths(existing)
+
+    def stop(self):
+        for timer in (self._file_poll, self._db_poll, self._debounce):
+            timer.stop()
+        self.loader.cancel_all()
+        watched = self._fs.files()
+        if watched:
+            self._fs.removePaths(watched)
+        with self._conn_lock:
+            self._polling_db = False
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _on_file_changed(self, file_path):
+        order_id = self._orders.get(file_path)
+        if order_id is not None:
+            self._poll({order_id: file_path}, f"watch_file:{order_id}")
+
+    def poll_files(self):
+        self._poll(dict(self._paths), "watch_files")
+
+    def _poll(self, paths, name):
+        if not paths or self.loader.is_loading(name):
+            return
+        self.loader.submit(name, lambda job: self._stat_files(job, paths), self._apply_stamps)
+
+    @staticmethod
+    def _stat_files(job, paths):
+        """Pool thread: {order_id: (file_path, stamp)} for every file in paths."""
+        stamps = {}
+        for order_id, file_path in paths.items():
+            job.check()
+            stamps[order_id] = (file_path, file_stamp(file_path))
+        return stamps
+
+    def _apply_stamps(self, stamps):
+        for order_id, (file_path, stamp) in stamps.items():
+            if self._paths.get(order_id) != file_path:
+                continue  # Unwatched or repointed while the poll ran
+            seen = self._stamps.get(order_id)
+            if stamp == seen:
+                continue
+            self._stamps[order_id] = stamp
+            # Saving by renaming a new file over the old one (or a file reappearing) leaves it unwatched
+            if stamp is not None and self.is_active() and file_path not in self._fs.files():
+                self._fs.addPath(file_path)
+            if seen is not _UNSEEN:
+                self._mark(order_id)
+
+    def poll_db(self):
+        if self.loader.is_loading("watch_db"):
+            return
+        self.loader.submit("watch_db", self._db_changes, self._apply_results)
+
+    def _db_changes(self, job):
+        """Pool thread: order ids with serial results written since the last check (empty if none)."""
+        with self._conn_lock:
+            if not self._polling_db:
+                return []
+            try:
+                if self._conn is None:
+                    self._conn = sqlite3.connect(self.db_manager.full_db_path, check_same_thread=False)
+                    self._data_version = None
+                version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            except Exception as e:
+                logger.error(f"Order watcher DB poll failed: {e}")
+                return []
+            # A new connection has no previous version to compare: always check once after start()
+            if version == self._data_version:
+                return []
+            self._data_version = version
+            try:
+                changed, latest = self.db_manager.get_orders_changed_since(self._last_seq)
+            except Exception:
+                return []
+            self._last_seq = max([latest, *changed.values()])
+            return list(changed)
+
+    def _apply_results(self, order_ids):
+        for order_id in order_ids:
+            if order_id in self._paths:
+                self._mark(order_id)
+
+    def _mark(self, order_id):
+        self._dirty.add(order_id)
+        self._debounce.start()
+
+    def _flush(self):
+        if not self._dirty:
+            return
+        changed = sorted(self._dirty)
+        self._dirty.clear()
+        logger.debug(f"Orders changed: {changed}")
+        self.orders_changed.emit(changed)
@@ -3,19 +3,19 @@
 import logging
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, 
-    QTableWidget, QTableWidgetItem, QLabel, QCheckBox, QMessageBox, 
+    QLabel, QCheckBox, QMessageBox, 
     QTextEdit, QDialog, QDialogButtonBox, QFrame, QScrollArea, QSplitter
 )
 from PyQt5.QtWidgets import QSizePolicy
 from PyQt5.QtWidgets import QHeaderView
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 from datetime import datetime
-from openpyxl import load_workbook
 import os
-import time
-import tempfile
 import GUI.styles as styles
+from managers.result_journal import FLUSH_INTERVAL_MS
+from managers.file_lock import INTERACTIVE_LOCK_TIMEOUT
+from GUI.table_models import RowTableModel, StatusDelegate, create_table_view
 
 logger = logging.getLogger(__name__)
 
@@ -178,13 +178,15 @@ class WorkflowStep(QFrame):
 
 
 class UserWindow(QWidget):
-    def __init__(self, username: str, user_id: int, db_manager, xlsx_manager, on_logout=None):
+    def __init__(self, username: str, user_id: int, db_manager, xlsx_manager, on_logout=None, result_journal=None):
         super().__init__()
         self.username = username
         self.user_id = user_id
         self.db_manager = db_manager
         self.xlsx_manager = xlsx_manager
         self.on_logout = on_logout
+        # Optional ResultJournal; when None every result is written to the order file immediately
+        self.result_journal = result_journal
         
         self.setWindowTitle("Label Tracker - User")
         self.setMinimumSize(1200, 800)
@@ -241,17 +243,17 @@ class UserWindow(QWidget):
                 background-color: #667eea;
                 border-color: #667eea;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #1a1a2e;
                 alternate-background-color: #16213e;
                 gridline-color: #2a2a4e;
                 border: none;
                 border-radius: 8px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #667eea;
             }
             QHeaderView::section {
@@ -268,6 +270,13 @@ class UserWindow(QWidget):
         self.current_order_file = None
         self.current_company_name = None
         self.current_board_name = None
+        # Order left in memory by the previous login (see start_session)
+        self._kept_order_file = None
+
+        # company_id -> name and board_id -> name for the order table, kept across logins and
+        # refetched when an order refers to one not seen yet
+        self._company_names = {}
+        self._board_names = {}
         
         # Track fail history per serial number
         self.serial_history = {}
@@ -277,6 +286,13 @@ class UserWindow(QWidget):
         self.workflow_steps = []
         self.current_step = 0
 
+        # Write-behind flush: journaled results reach their order files every FLUSH_INTERVAL_MS
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_pending_results)
+        if self.result_journal is not None:
+            self.flush_timer.start()
+
         logger.info(f"User window initialized for: {username}")
         self.setup_ui()
 
@@ -319,9 +335,9 @@ class UserWindow(QWidget):
         
         header_layout.addStretch()
         
-        user_label = QLabel(f"Operator: {self.username}")
-        user_label.setStyleSheet("color: #aaa; font-size: 14pt;")
-        header_layout.addWidget(user_label)
+        self.user_label = QLabel(f"Operator: {self.username}")
+        self.user_label.setStyleSheet("color: #aaa; font-size: 14pt;")
+        header_layout.addWidget(self.user_label)
         
         self.logout_button = QPushButton("Logout")
         self.logout_button.setStyleSheet("""
@@ -499,6 +515,10 @@ class UserWindow(QWidget):
 
         test_layout.addLayout(result_layout)
 
+        # Non-blocking confirmation of the last saved result
+        self.save_status_label = QLabel("")
+        self.save_status_label.setStyleSheet("color: #aaa; font-size: 11pt;")
+        test_layout.addWidget(self.save_status_label)
 
         # Add the testing frame into the content area so scan/submit controls are visible
         content_layout.addWidget(test_frame)
@@ -511,18 +531,15 @@ class UserWindow(QWidget):
         table_label.setStyleSheet("color: #64b5f6; font-size: 16pt; font-weight: bold; margin-top: 10px;")
         content_layout.addWidget(table_label)
 
-        self.order_table = QTableWidget()
-        self.order_table.setColumnCount(8)
-        self.order_table.setHorizontalHeaderLabels([
+        self.order_model = RowTableModel([
             "Operator", "Company", "Board", "Serial Number", 
             "Pass/Fail", "Timestamp", "Failure Explanation", "Fix Explanation"
-        ])
-        self.order_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.order_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.order_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.order_table.cellClicked.connect(self.select_serial)
+        ], self)
+        self.order_table = create_table_view(
+            self.order_model, row_height=30, status_column=4,
+            delegate=StatusDelegate({"Pass": "green", "Fail": "red"}, default="yellow"))
+        self.order_table.clicked.connect(lambda index: self.select_serial(index.row(), index.column()))
         self.order_table.setAlternatingRowColors(True)
-        self.order_table.setWordWrap(True)
 
         try:
             self.order_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -530,7 +547,6 @@ class UserWindow(QWidget):
         except Exception:
             pass
 
-        self.order_table.verticalHeader().setDefaultSectionSize(30)
         self.order_table.setMinimumHeight(DEFAULT_VISIBLE_ROWS * 30 + 48)
         self.order_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         content_layout.addWidget(self.order_table)
@@ -554,6 +570,10 @@ class UserWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please enter an order number.")
             return
 
+        # Results for the previous order must reach its file before switching; other orders' are retried by the timer
+        if self.current_order_file and not self.flush_pending_results(self.current_order_file, warn=True):
+            return
+
         try:
             # Find order in database
             with self.db_manager.get_connection() as conn:
@@ -587,6 +607,14 @@ class UserWindow(QWidget):
             self.board_label.setText(f"Board Type: {self.current_board_name}")
             self.order_status_label.setText(f"Status: {status}")
             
+            # Drop the in-memory copy of the previous order
+            for previous in {self.current_order_file, self._kept_order_file} - {None, file_path}:
+                self.xlsx_manager.close_session(previous)
+            self._kept_order_file = None
+            self._company_names[company_id] = self.current_company_name
+            if board_id:
+                self._board_names.update(board_dict)
+
             # Store current order info
             self.current_order_id = order_id
             self.current_order_file = file_path
@@ -606,61 +634,40 @@ class UserWindow(QWidget):
     def load_xlsx_data(self, file_path):
         """Load data from XLSX file into table - 8 columns only"""
         try:
-            wb = load_workbook(file_path)
-            ws = wb.active
+            # Keep the order in memory for the session; saves reuse it instead of re-reading the share.
+            # A copy still held from an earlier load or login is reused unless the file changed since.
+            session = self.xlsx_manager.get_session(file_path)
+            if session is None or session.is_stale():
+                session = self.xlsx_manager.open_session(file_path)
+            layout = session.layout
 
-            # Clear existing data
-            self.order_table.setRowCount(0)
             self.serial_history.clear()
 
-            company_map = {c[0]: c[1] for c in self.db_manager.get_companies_all(include_archived=True)}
-            board_map = {}
-
-            # Preload all boards into a dict for faster lookup
-            for company_id in company_map:
-                try:
-                    boards = self.db_manager.get_boards_by_company(company_id)
-                    for b_id, b_name, *_ in boards:
-                        board_map[b_id] = b_name
-                except Exception:
-                    continue
-                
-            for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=0):
-                (
-                    created_by,      # Column 1 - Admin who created the order (SKIP)
-                    created_at,      # Column 2 - Order creation timestamp (SKIP)
-                    operator,        # Column 3 - Username of tester (DISPLAY)
-                    company_id,      # Column 4 - (DISPLAY as name)
-                    board_id,        # Column 5 - (DISPLAY as name)
-                    serial_number,   # Column 6 - (DISPLAY)
-                    pass_fail,       # Column 7 - (DISPLAY)
-                    timestamp,       # Column 8 - (DISPLAY)
-                    failure_exp,     # Column 9 - (DISPLAY)
-                    fix_exp,         # Column 10 - (DISPLAY)
-                ) = row
+            def column(values, key):
+                idx = layout.get(key)
+                return values[idx] if idx is not None and idx < len(values) else None
+
+            company_map, board_map = self._reference_names(
+                {column(v, "company") for v in session.rows.values()},
+                {column(v, "board") for v in session.rows.values()})
+
+            rows = []
+            for row_idx, excel_row in enumerate(sorted(session.rows)):
+                values = session.rows[excel_row]
+                operator = column(values, "operator")            # Username of tester (DISPLAY)
+                company_id = column(values, "company")           # (DISPLAY as name)
+                board_id = column(values, "board")               # (DISPLAY as name)
+                serial_number = column(values, "serial")         # (DISPLAY)
+                pass_fail = column(values, "pass_fail")          # (DISPLAY)
+                timestamp = column(values, "timestamp")          # (DISPLAY)
+                failure_exp = column(values, "failure")          # (DISPLAY)
+                fix_exp = column(values, "fix")                  # (DISPLAY)
 
                 operator_name = operator or "---"
                 company_name = company_map.get(company_id, "Unknown")
                 board_name = board_map.get(board_id, "Unknown")
                 serial_str = str(serial_number).strip() if serial_number else ""
 
-                # Insert a new row into the table (8 columns)
-                self.order_table.insertRow(row_idx)
-                self.order_table.setItem(row_idx, 0, QTableWidgetItem(operator_name))
-                self.order_table.setItem(row_idx, 1, QTableWidgetItem(company_name))
-                self.order_table.setItem(row_idx, 2, QTableWidgetItem(board_name))
-                self.order_table.setItem(row_idx, 3, QTableWidgetItem(serial_str))
-
-                # Color code status
-                status_item = QTableWidgetItem(str(pass_fail) if pass_fail else "Pending")
-                if str(pass_fail).lower() == "pass":
-                    status_item.setForeground(Qt.green)
-                elif str(pass_fail).lower() == "fail":
-                    status_item.setForeground(Qt.red)
-                else:
-                    status_item.setForeground(Qt.yellow)
-                self.order_table.setItem(row_idx, 4, status_item)
-
                 # Format timestamp
                 formatted_timestamp = ""
                 if timestamp:
@@ -673,35 +680,160 @@ class UserWindow(QWidget):
                     except Exception:
                         formatted_timestamp = str(timestamp)
 
-                self.order_table.setItem(row_idx, 5, QTableWidgetItem(formatted_timestamp))
-                self.order_table.setItem(row_idx, 6, QTableWidgetItem(str(failure_exp) if failure_exp else ""))
-                self.order_table.setItem(row_idx, 7, QTableWidgetItem(str(fix_exp) if fix_exp else ""))
+                # 8 columns; the Pass/Fail colour is drawn by the table's delegate
+                rows.append((operator_name, company_name, board_name, serial_str,
+                             str(pass_fail) if pass_fail else "Pending", formatted_timestamp,
+                             failure_exp if failure_exp else "", fix_exp if fix_exp else ""))
 
                 # Track serial for later lookup
                 was_failed = str(pass_fail).lower() == "fail"
                 self.serial_history[serial_str] = {
                     "was_failed": was_failed,
-                    "row": row_idx + 2,       # Excel row index
-                    "table_row": row_idx      # Table widget row index
+                    "row": excel_row,         # Excel row index
+                    "table_row": row_idx      # Table view row index
                 }
 
-            logger.info(f"Loaded {self.order_table.rowCount()} serial numbers from XLSX")
+            self.order_model.set_rows(rows)
+            logger.info(f"Loaded {len(rows)} serial numbers from XLSX")
 
-            # Adjust row heights for readability
-            try:
-                fm = self.order_table.fontMetrics()
-                default_h = int(fm.height() * 1.4)
-                if default_h < 20:
-                    default_h = 20
-                self.order_table.verticalHeader().setDefaultSectionSize(default_h)
-                self.order_table.resizeRowsToContents()
-            except Exception:
-                pass
-            
         except Exception as e:
             logger.error(f"Failed to load XLSX data: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to load XLSX data:\n{str(e)}")
 
+    def _reference_names(self, company_ids, board_ids):
+        """Company and board name maps covering the given ids, fetched only when one isn't cached."""
+        if not (set(company_ids) - {None} <= self._company_names.keys()
+                and set(board_ids) - {None} <= self._board_names.keys()):
+            self._company_names = {c[0]: c[1] for c in self.db_manager.get_companies_all(include_archived=True)}
+            self._board_names = {}
+            # Preload all boards into a dict for faster lookup
+            for company_id in self._company_names:
+                try:
+                    boards = self.db_manager.get_boards_by_company(company_id)
+                    for b_id, b_name, *_ in boards:
+                        self._board_names[b_id] = b_name
+                except Exception:
+                    continue
+        return self._company_names, self._board_names
+
+    def flush_pending_results(self, file_path: str = None, warn: bool = False) -> bool:
+        """Write journaled results to their order files (only file_path's when given).
+
+        Returns False if any of those results are still unsaved; with warn the
+        operator is also told in a dialog. Results the journal quarantined
+        (their order file is gone) are always reported in a dialog and also
+        return False. Runs on the GUI thread, so lock waits are capped at
+        INTERACTIVE_LOCK_TIMEOUT and a busy file is left to the next timer flush.
+        """
+        if self.result_journal is None:
+            return True
+        flushing = self.result_journal.pending_count(file_path)
+        if flushing:
+            try:
+                self.result_journal.flush(file_path, timeout=INTERACTIVE_LOCK_TIMEOUT)
+            except Exception as e:
+                logger.error(f"Failed to flush pending results: {e}", exc_info=True)
+        quarantined = self.result_journal.take_quarantined()
+        if quarantined:
+            self.report_quarantined(quarantined)
+            return False
+        if not flushing:
+            return True
+        pending = self.result_journal.pending_count(file_path)
+        if not pending:
+            self.save_status_label.setText("All results saved")
+            logger.debug(f"Order file lock stats: {self.xlsx_manager.lock_manager.stats()}")
+            self.sync_external_changes()
+            return True
+        self.save_status_label.setText(f"{pending} result(s) waiting to be saved - will retry")
+        if warn:
+            QMessageBox.critical(
+                self, "Error",
+                f"Failed to save {pending} result(s) to the order file.\n\n"
+                "They are kept locally and will be retried.")
+        return False
+
+    def report_quarantined(self, quarantined):
+        """Tell the operator which results could not be saved because their order file is gone."""
+        total = sum(count for _, count, _ in quarantined)
+        self.save_status_label.setText(f"{total} result(s) NOT saved - order file missing")
+        lines = [f"{os.path.basename(path)}: {count} result(s) ({reason})" for path, count, reason in quarantined]
+        QMessageBox.critical(
+            self, "Results Not Saved",
+            f"{total} result(s) could not be saved because their order file no longer exists:\n\n"
+            + "\n".join(lines)
+            + f"\n\nThey were set aside in {self.result_journal.quarantine_path}. "
+            "Tell an admin before continuing.")
+
+    def sync_external_changes(self):
+        """Show rows other stations saved into the current order and warn about same-serial conflicts."""
+        session = self.xlsx_manager.get_session(self.current_order_file) if self.current_order_file else None
+        if session is None:
+            return
+
+        for excel_row in sorted(session.take_external_rows()):
+            entry = self.serial_history.get(self.normalize_sn(session.value(excel_row, "serial")))
+            if not entry or entry["row"] != excel_row:
+                continue
+            table_row = entry["table_row"]
+            pass_fail = session.value(excel_row, "pass_fail")
+            changes = {0: session.value(excel_row, "operator") or "---", 4: str(pass_fail) if pass_fail else "Pending"}
+            for col, key in ((5, "timestamp"), (6, "failure"), (7, "fix")):
+                value = session.value(excel_row, key)
+                changes[col] = value if value else ""
+            self.order_model.update_row(table_row, changes)
+            entry["was_failed"] = entry["was_failed"] or str(pass_fail).lower() == "fail"
+
+        conflicts = session.take_conflicts()
+        if conflicts:
+            lines = [
+                f"{c['serial']}: {c['theirs'].get('pass_fail')} by {c['theirs'].get('operator')} "
+                f"was replaced by {c['ours'].get('pass_fail')} by {c['ours'].get('operator')}"
+                for c in conflicts
+            ]
+            QMessageBox.warning(
+                self, "Concurrent Update",
+                "Another station saved results for the same serial(s):\n\n" + "\n".join(lines))
+
+    def closeEvent(self, event):
+        # The order stays in memory for the next login; loading another order drops it
+        self.flush_pending_results()
+        super().closeEvent(event)
+
+    def start_session(self, username: str, user_id: int):
+        """Reuse this window for the next operator login.
+
+        The previous operator's order, scans and results table are cleared.
+        Their order stays in memory (reloaded only if its file changed) and
+        the company/board names stay cached, so carrying on with the same
+        order after a shift change costs no re-read.
+        """
+        self.username = username
+        self.user_id = user_id
+        self.user_label.setText(f"Operator: {username}")
+        logger.info(f"User window reused for: {username}")
+
+        if self.current_order_file:
+            self._kept_order_file = self.current_order_file
+        self.current_order_id = None
+        self.current_order_file = None
+        self.current_company_name = None
+        self.current_board_name = None
+        self.serial_history.clear()
+        self.current_serial = None
+        if hasattr(self, 'fix_explanation'):
+            delattr(self, 'fix_explanation')
+
+        self.order_input.clear()
+        self.sn_input.clear()
+        self.company_label.setText("Company: ---")
+        self.board_label.setText("Board Type: ---")
+        self.order_status_label.setText("Status: ---")
+        self.save_status_label.setText("")
+        self.order_model.set_rows([])
+        self.reset_action_buttons()
+        self.update_workflow_step(0)
+
     def handle_logout(self):
         try:
             self.close()
@@ -730,7 +862,7 @@ class UserWindow(QWidget):
         # Select the corresponding table row using stored table_row
         try:
             table_row = self.serial_history[norm_sn].get("table_row")
-            if table_row is not None and 0 <= table_row < self.order_table.rowCount():
+            if table_row is not None and 0 <= table_row < self.order_model.rowCount():
                 self.order_table.selectRow(table_row)
                 self.current_serial = norm_sn
 
@@ -747,9 +879,8 @@ class UserWindow(QWidget):
 
     def select_serial(self, row, column):
         """Select a serial from the table"""
-        serial_item = self.order_table.item(row, 3)
-        if serial_item:
-            self.current_serial = serial_item.text()
+        if 0 <= row < self.order_model.rowCount():
+            self.current_serial = self.order_model.value(row, 3)
             self.sn_input.setText(self.current_serial)
             self.update_workflow_step(2)
             # Enable action buttons when a serial is selected by clicking
@@ -916,8 +1047,8 @@ class UserWindow(QWidget):
         try:
             timestamp = datetime.now().strftime("%b %d, %Y %I:%M %p")
 
-            # Update XLSX file
-            self.update_xlsx_file(
+            # Journal the result (or write it straight to the XLSX file without a journal)
+            self.record_result(
                 self.current_serial,
                 result,
                 timestamp,
@@ -930,19 +1061,10 @@ class UserWindow(QWidget):
             if norm_sn in self.serial_history:
                 table_row = self.serial_history[norm_sn]["table_row"]
 
-                # Update status with color (column 4)
-                status_item = QTableWidgetItem(result)
-                if result == "Pass":
-                    status_item.setForeground(Qt.green)
-                else:
-                    status_item.setForeground(Qt.red)
-
-                self.order_table.setItem(table_row, 4, status_item)
-                self.order_table.setItem(table_row, 5, QTableWidgetItem(timestamp))
-                self.order_table.setItem(table_row, 6, QTableWidgetItem(failure_explanation))
-                self.order_table.setItem(table_row, 7, QTableWidgetItem(fix_explanation))
+                self.order_model.update_row(table_row, {
+                    4: result, 5: timestamp, 6: failure_explanation, 7: fix_explanation})
 
-            QMessageBox.information(self, "Success", f"Serial {self.current_serial} marked as {result}.")
+            self.save_status_label.setText(f"Serial {self.current_serial} marked as {result}.")
 
             # Move to final step
             self.update_workflow_step(3)
@@ -977,60 +1099,50 @@ class UserWindow(QWidget):
         except Exception:
             return str(sn)
 
+    def record_result(self, serial_number, pass_fail, timestamp, failure_explanation="", fix_explanation=""):
+        """Record a result via the write-behind journal, falling back to a direct write."""
+        if self.result_journal is None:
+            self.update_xlsx_file(serial_number, pass_fail, timestamp, failure_explanation, fix_explanation)
+            self.sync_external_changes()
+            return
+
+        norm_sn = self.normalize_sn(serial_number)
+        excel_row = self.serial_history[norm_sn]["row"]
+        flush_due = self.result_journal.record(
+            self.current_order_file,
+            excel_row,
+            self._result_values(pass_fail, timestamp, failure_explanation, fix_explanation),
+        )
+        logger.info(f"Result journaled for SN: {serial_number}")
+        if flush_due:
+            self.flush_pending_results(self.current_order_file)
+
+    def _result_values(self, pass_fail, timestamp, failure_explanation="", fix_explanation="") -> dict:
+        """Order-file columns written for one result (explanations only when given)."""
+        values = {
+            "operator": self.username,
+            "pass_fail": pass_fail,
+            "timestamp": timestamp,
+        }
+        if failure_explanation:
+            values["failure"] = failure_explanation
+        if fix_explanation:
+            values["fix"] = fix_explanation
+        return values
+
     def update_xlsx_file(self, serial_number, pass_fail, timestamp, failure_explanation="", fix_explanation=""):
         """Update XLSX file with new data"""
         try:
-            wb = load_workbook(self.current_order_file)
-            ws = wb.active
             # Normalize serial before lookup into serial_history
             norm_sn = self.normalize_sn(serial_number)
             excel_row = self.serial_history[norm_sn]["row"]
 
-            # XLSX columns:
-            # 1: created_by (admin who created order)
-            # 2: created_at (order creation time)
-            # 3: operator (username of tester)
-            # 4: company_id
-            # 5: board_id
-            # 6: serial_number
-            # 7: pass_fail
-            # 8: timestamp
-            # 9: failure_explanation
-            # 10: fix_explanation
-
-            ws.cell(row=excel_row, column=3).value = self.username  # operator
-            ws.cell(row=excel_row, column=7).value = pass_fail
-            ws.cell(row=excel_row, column=8).value = timestamp
-
-            if failure_explanation:
-                ws.cell(row=excel_row, column=9).value = failure_explanation
-
-            if fix_explanation:
-                ws.cell(row=excel_row, column=10).value = fix_explanation
-
-            # Safe save
-            temp_dir = os.path.dirname(self.current_order_file) or None
-            fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=".xlsx", dir=temp_dir)
-            os.close(fd)
-            try:
-                wb.save(tmp_path)
-                max_retries = 3
-                for attempt in range(1, max_retries + 1):
-                    try:
-                        os.replace(tmp_path, self.current_order_file)
-                        break
-                    except PermissionError:
-                        if attempt == max_retries:
-                            raise
-                        time.sleep(0.5)
-                logger.info(f"XLSX file updated for SN: {serial_number}")
-            finally:
-                try:
-                    if os.path.exists(tmp_path):
-                        os.remove(tmp_path)
-                except Exception:
-                    pass
-                
+            values = self._result_values(pass_fail, timestamp, failure_explanation, fix_explanation)
+
+            # Only this row is rewritten; saved via temp file + atomic replace
+            self.xlsx_manager.update_order_rows(self.current_order_file, {excel_row: values})
+            logger.info(f"XLSX file updated for SN: {serial_number}")
+
         except Exception as e:
             logger.error(f"Failed to update XLSX file: {e}", exc_info=True)
             raise
@@ -177,16 +177,16 @@ QPushButton:hover {
 """
 # Table style
 TABLE_STYLE = """
-QTableWidget {
+QTableView {
     background-color: #1a1a2e;
     alternate-background-color: #16213e;
     gridline-color: #2a2a4e;
     border: none;
 }
-QTableWidget::item {
+QTableView::item {
     padding: 8px;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #667eea;
 }
 QHeaderView::section {
@@ -0,0 +1,270 @@
+from PyQt5.QtWidgets import QTableView, QStyledItemDelegate, QAbstractItemView, QHeaderView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QColor, QPalette
+
+# data(index, KEY_ROLE) returns the row's key (e.g. the order id) on every column
+KEY_ROLE = Qt.UserRole
+
+# Separates columns inside a row's search key so a term can't match across two cells
+_SEARCH_SEP = "\x1f"
+
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only table model over a list of row tuples.
+
+    Each row is one tuple of display strings plus an optional key, so a
+    table costs one tuple per row instead of one item object per cell. The
+    view only asks for the cells it is painting.
+
+    search_columns (default: all) are joined into a lowercase search key
+    per row when rows are set, for SearchFilterProxy. sort() reorders the
+    row list itself (one Python sort over cached keys, then layoutChanged)
+    and is reapplied when rows are replaced. sort_keys maps a column to a
+    function turning its display string into a value that sorts correctly
+    (e.g. numbers, dates); other columns sort case-insensitively.
+    update_row(), insert_row() and remove_row() patch single rows in place,
+    so views keep their selection and scroll position.
+    """
+
+    def __init__(self, headers, parent=None, search_columns=None, sort_keys=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.search_columns = list(search_columns) if search_columns is not None else list(range(len(headers)))
+        self.sort_keys = dict(sort_keys or {})
+        self._rows = []
+        self._keys = []
+        self._search = []
+        self._sort_cache = {}
+        self._sorted_by = None
+        self._key_index = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == KEY_ROLE:
+            return self._keys[index.row()]
+        return None
+
+    def _sort_key(self, column, row):
+        # Unconvertible values sort after converted ones instead of failing the comparison
+        convert = self.sort_keys.get(column)
+        if convert is not None:
+            try:
+                return (0, convert(row[column]))
+            except (TypeError, ValueError):
+                pass
+        return (1, row[column].lower())
+
+    def _search_key(self, row) -> str:
+        return _SEARCH_SEP.join(row[c] for c in self.search_columns).lower()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self.headers):
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows, keys=None):
+        """Replace the contents. rows: iterable of tuples (None cells shown as ''); keys: parallel list."""
+        self.beginResetModel()
+        self._rows = [tuple("" if v is None else str(v) for v in row) for row in rows]
+        self._keys = list(keys) if keys is not None else [None] * len(self._rows)
+        self._search = [self._search_key(row) for row in self._rows]
+        self._sort_cache = {}
+        self._key_index = None
+        if self._sorted_by is not None:
+            self._apply_sort(*self._sorted_by)
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if not 0 <= column < len(self.headers):
+            self._sorted_by = None
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_to_new = self._apply_sort(column, order)
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent, [self.index(old_to_new[i.row()], i.column()) for i in persistent])
+        self.layoutChanged.emit()
+
+    def _apply_sort(self, column, order):
+        """Reorder the row storage by column; returns old row -> new row."""
+        self._sorted_by = (column, order)
+        cache = self._sort_cache.get(column)
+        if cache is None:
+            cache = self._sort_cache[column] = [self._sort_key(column, row) for row in self._rows]
+        perm = sorted(range(len(self._rows)), key=cache.__getitem__, reverse=order == Qt.DescendingOrder)
+        self._rows = [self._rows[i] for i in perm]
+        self._keys = [self._keys[i] for i in perm]
+        self._search = [self._search[i] for i in perm]
+        for col, values in self._sort_cache.items():
+            self._sort_cache[col] = [values[i] for i in perm]
+        self._key_index = None
+        old_to_new = [0] * len(perm)
+        for new, old in enumerate(perm):
+            old_to_new[old] = new
+        return old_to_new
+
+    def search_key(self, row: int) -> str:
+        return self._search[row]
+
+    def value(self, row: int, column: int) -> str:
+        return self._rows[row][column]
+
+    def key(self, row: int):
+        return self._keys[row] if 0 <= row < len(self._keys) else None
+
+    def row_for_key(self, key):
+        """Row holding key, or -1."""
+        if self._key_index is None:
+            self._key_index = {k: r for r, k in enumerate(self._keys)}
+        return self._key_index.get(key, -1)
+
+    def update_row(self, row: int, changes: dict):
+        """Set {column: value} on one row and repaint just that row."""
+        values = list(self._rows[row])
+        for column, value in changes.items():
+            values[column] = "" if value is None else str(value)
+        self._rows[row] = tuple(values)
+        self._search[row] = self._search_key(self._rows[row])
+        for column, cache in self._sort_cache.items():
+            cache[row] = self._sort_key(column, self._rows[row])
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1), [Qt.DisplayRole])
+
+    def insert_row(self, values, key=None) -> int:
+        """Add one row (at its sorted position if the model is sorted, else at the end); returns the row."""
+        values = tuple("" if v is None else str(v) for v in values)
+        row = len(self._rows)
+        if self._sorted_by is not None:
+            column, order = self._sorted_by
+            new = self._sort_key(column, values)
+            cache = self._sort_cache[column]
+            descending = order == Qt.DescendingOrder
+            row = next((r for r, k in enumerate(cache) if (k < new if descending else k > new)), row)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, values)
+        self._keys.insert(row, key)
+        self._search.insert(row, self._search_key(values))
+        for column, cache in self._sort_cache.items():
+            cache.insert(row, self._sort_key(column, values))
+        self._key_index = None
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for values in (self._rows, self._keys, self._search, *self._sort_cache.values()):
+            del values[row]
+        self._key_index = None
+        self.endRemoveRows()
+
+    def rows_where(self, match: dict) -> list:
+        """Rows whose values equal all of match's {column: value}."""
+        return [r for r, values in enumerate(self._rows) if all(values[c] == v for c, v in match.items())]
+
+
+class SearchFilterProxy(QSortFilterProxyModel):
+    """Filters a RowTableModel by search terms and optional exact column values, and sorts it.
+
+    Every whitespace-separated term must appear in the row's precomputed
+    search key, so filtering never touches the DB or rebuilds the source
+    rows. Sorting is handed to the source model, which sorts its own row
+    list far faster than a per-comparison data() lookup from the proxy.
+    """
+
+    def __init__(self, source: RowTableModel, parent=None):
+        super().__init__(parent)
+        self.setSourceModel(source)
+        self._terms = []
+        self._column_filters = {}
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def set_search(self, text: str):
+        terms = (text or "").lower().split()
+        if terms != self._terms:
+            self._terms = terms
+            self.invalidateFilter()
+
+    def set_column_filter(self, column: int, value=None):
+        """Only show rows whose column equals value (None clears it)."""
+        if value is None:
+            self._column_filters.pop(column, None)
+        else:
+            self._column_filters[column] = value
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        source = self.sourceModel()
+        for column, value in self._column_filters.items():
+            if source.value(source_row, column) != value:
+                return False
+        if self._terms:
+            key = source.search_key(source_row)
+            return all(term in key for term in self._terms)
+        return True
+
+
+def current_source_row(view) -> int:
+    """The source-model row of a view's current index, or -1."""
+    index = view.currentIndex()
+    if not index.isValid():
+        return -1
+    model = view.model()
+    if isinstance(model, QSortFilterProxyModel):
+        index = model.mapToSource(index)
+    return index.row()
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Draws a status column's text in the colour mapped to its value."""
+
+    def __init__(self, colours: dict, default=None, bold=False, parent=None):
+        super().__init__(parent)
+        self.colours = {k.lower(): QColor(v) for k, v in colours.items()}
+        self.default = QColor(default) if default else None
+        self.bold = bold
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        colour = self.colours.get((index.data() or "").lower(), self.default)
+        if colour is None:
+            return
+        option.palette.setColor(QPalette.Text, colour)
+        option.palette.setColor(QPalette.HighlightedText, colour)
+        if self.bold:
+            option.font.setBold(True)
+
+
+def create_table_view(model, row_height: int = 24, status_column=None, delegate=None,
+                      sortable=False) -> QTableView:
+    """A read-only, single-row-select QTableView with fixed row heights.
+
+    Fixed heights mean the view never measures rows it isn't showing, so
+    scrolling and reloading stay cheap however many rows the model holds.
+    sortable enables header-click sorting (model should be a proxy); rows
+    keep the model's order until a header is clicked.
+    """
+    view = QTableView()
+    view.setModel(model)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.setSelectionMode(QAbstractItemView.SingleSelection)
+    view.setWordWrap(False)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    view.verticalHeader().setDefaultSectionSize(row_height)
+    if status_column is not None and delegate is not None:
+        delegate.setParent(view)
+        view.setItemDelegateForColumn(status_column, delegate)
+    if sortable:
+        view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        view.setSortingEnabled(True)
+    return view
@@ -10,6 +10,11 @@ sys.path.insert(0, project_root)
 from utils.logger import setup_logging
 from managers.db_manager import DatabaseManager
 from managers.xlsx_manager import XLSXManager
+from managers.status_cache import StatusCache
+from managers.result_journal import ResultJournal
+from managers.file_lock import FileLockManager, INTERACTIVE_LOCK_TIMEOUT
+from managers.order_mirror import OrderMirror
+from managers.dashboard_snapshot import DashboardSnapshot
 from GUI.app import AppController
 
 def main():
@@ -22,12 +27,38 @@ def main():
         db_manager = DatabaseManager()
         logger.info("Database manager initialized")
         
+        # Station-local cache of order file status (counts, readiness)
+        status_cache = StatusCache()
+        logger.info(f"Status cache initialized at {status_cache.full_db_path}")
+
+        # Advisory locks on order files, shared with the other stations on the drive
+        lock_manager = FileLockManager()
+
+        # Station-local copies of order files, refreshed only when the share's copy changes
+        order_mirror = OrderMirror()
+        logger.info(f"Order mirror at {order_mirror.mirror_dir} ({order_mirror.max_bytes // (1024 * 1024)} MB max)")
+
         # Initialize XLSX manager
-        xlsx_manager = XLSXManager(db_manager)
+        xlsx_manager = XLSXManager(db_manager, status_cache=status_cache, lock_manager=lock_manager,
+                                   mirror=order_mirror)
         logger.info("XLSX manager initialized")
+
+        # Write-behind journal for operator results; replay anything left by a crash
+        result_journal = ResultJournal(xlsx_manager)
+        try:
+            # Short lock waits: a locked order file must not hold up the login window
+            replayed = result_journal.replay(timeout=INTERACTIVE_LOCK_TIMEOUT)
+            if replayed:
+                logger.info(f"Replayed {replayed} journaled results from previous session")
+        except Exception as e:
+            logger.error(f"Failed to replay result journal (entries kept for retry): {e}")
         
+        # Admin dashboard saved at logout, shown at the next login while fresh data loads
+        dashboard_snapshot = DashboardSnapshot()
+
         # Start the application with managers
-        controller = AppController(db_manager, xlsx_manager)
+        controller = AppController(db_manager, xlsx_manager, result_journal=result_journal,
+                                   dashboard_snapshot=dashboard_snapshot)
         logger.info("Application controller started")
         
         controller.run()
@@ -4,8 +4,15 @@
 a = Analysis(
     ['main.py', 
     'GUI/__init__.py', 'GUI/admin_window.py', 'GUI/app.py', 'GUI/login_window.py', 
-    'GUI/standard_user_window.py', 'GUI/widgets.py', 'GUI/styles.py',
+    'GUI/standard_user_window.py', 'GUI/widgets.py', 'GUI/styles.py', 'GUI/table_models.py',
+    'GUI/background.py', 'GUI/company_tree_model.py', 'GUI/change_events.py', 'GUI/order_watcher.py',
     'managers/__init__.py', 'managers/db_manager.py', 'managers/xlsx_manager.py',
+    'managers/status_cache.py', 'managers/xlsx_fast_reader.py',
+    'managers/xlsx_row_patcher.py', 'managers/result_journal.py',
+    'managers/file_lock.py', 'managers/order_session.py', 'managers/order_mirror.py',
+    'managers/dashboard_snapshot.py',
+    'managers/xlsx_summary.py', 'managers/delta_export.py', 'managers/delivery_bundle.py',
+    'managers/cold_storage.py', 'managers/backfill_importer.py',
     'utils/logger.py'],
     pathex=[],
     binaries=[],
@@ -0,0 +1,215 @@
+import io, os, sys, time, logging, argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from openpyxl import load_workbook
+
+from managers.xlsx_manager import XLSXManager, TIMESTAMP_FORMAT, DELIVERABLE_DIR, HEADER_ALIASES
+from managers.xlsx_fast_reader import FastSheetReader, FastReaderUnsupported
+from managers.cold_storage import COLD_STORAGE_DIR, open_stored, split_stored_path
+
+logger = logging.getLogger(__name__)
+
+# Parser processes; files are CPU-bound to decode, so default to one per core
+try:
+    IMPORT_WORKERS = max(1, int(os.environ.get('LT_IMPORT_WORKERS', str(os.cpu_count() or 2))))
+except Exception:
+    IMPORT_WORKERS = 2
+
+# Folders under a client path that never hold order workbooks
+SKIP_DIRS = {DELIVERABLE_DIR, COLD_STORAGE_DIR}
+
+# Log progress every this many files
+PROGRESS_EVERY = 100
+
+
+def _fingerprint(path: str):
+    stored = split_stored_path(path)
+    st = os.stat(stored[0] if stored else path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _has_order_header(data: bytes) -> bool:
+    """True if the first row names a serial number column (i.e. this looks like an order workbook)."""
+    try:
+        with FastSheetReader(io.BytesIO(data)) as reader:
+            headers = reader.header()
+    except FastReaderUnsupported:
+        wb = load_workbook(io.BytesIO(data), read_only=True)
+        try:
+            headers = next(wb.active.iter_rows(max_row=1, values_only=True), ())
+        finally:
+            wb.close()
+    names = {str(h).strip().lower() for h in headers if h is not None}
+    return any(name in names for name in HEADER_ALIASES["serial"])
+
+
+def _parse_file(path: str, check_header: bool = False) -> dict:
+    """Worker: decode one order workbook into serial_results records and counters.
+
+    Runs in a pool process, so it only touches the file, never the DB.
+    check_header rejects workbooks without an order header row (used for
+    files found by walking folders, which may be any spreadsheet).
+    """
+    try:
+        with open_stored(path) as fh:
+            data = fh.read()
+        if check_header and not _has_order_header(data):
+            return {"path": path, "error": "not an order workbook (no serial number header)"}
+        records, counters = XLSXManager(None).parse_order_results(io.BytesIO(data))
+        if not records:
+            return {"path": path, "error": "no serial numbers found"}
+        return {"path": path, "records": records, "counters": counters,
+                "sheet_crc": XLSXManager._sheet_crc(io.BytesIO(data))}
+    except Exception as e:
+        return {"path": path, "error": f"{type(e).__name__}: {e}"}
+
+
+class BackfillImporter:
+    """Loads results from existing order workbooks into serial_results and order_counters.
+
+    Files come from orders.file_path (including cold storage) and, with
+    walk_folders=True, from the companies' client folders; workbooks found
+    there that are not registered become archived orders of that company.
+    Parsing runs in a process pool using the same header resolution as the
+    live app, with a bounded number of files in flight; the main process
+    does all DB writes. Each file is committed together with its
+    import_checkpoints row, so an interrupted run resumes with the first
+    file not yet done. Files are re-imported only when they change.
+    """
+
+    def __init__(self, db, workers: int = None):
+        self.db = db
+        self.workers = workers if workers else IMPORT_WORKERS
+
+    def registered_files(self) -> dict:
+        """{file_path: order_id} for every order in the DB."""
+        return {o[5]: o[0] for o in self.db.get_orders() if o[5]}
+
+    def folder_files(self) -> dict:
+        """{file_path: company_id} for workbooks under the client folders."""
+        found = {}
+        for company in self.db.get_companies_all(include_archived=True):
+            company_id, client_path = company[0], company[2]
+            if not client_path or not os.path.isdir(client_path):
+                continue
+            for root, dirs, files in os.walk(client_path):
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                for name in files:
+                    # Skip Excel owner files and our own temp files
+                    if name.lower().endswith(".xlsx") and not name.startswith(("~$", "lt_tmp_")):
+                        found.setdefault(os.path.join(root, name), company_id)
+        return found
+
+    def run(self, walk_folders: bool = False, progress=None) -> dict:
+        """Import every file not yet checkpointed (or changed since). Returns a report dict."""
+        started = time.monotonic()
+        registered = self.registered_files()
+        unregistered = {}
+        if walk_folders:
+            unregistered = {p: c for p, c in self.folder_files().items() if p not in registered}
+
+        checkpoints = self.db.get_import_checkpoints()
+        todo, fingerprints = [], {}
+        report = {"files": 0, "imported": 0, "skipped": 0, "rows": 0, "errors": [], "seconds": 0.0,
+                  "rows_per_second": 0.0}
+        for path in list(registered) + list(unregistered):
+            report["files"] += 1
+            try:
+                fingerprints[path] = _fingerprint(path)
+            except OSError as e:
+                report["errors"].append((path, f"unreadable: {e}"))
+                continue
+            checkpoint = checkpoints.get(path)
+            if checkpoint and checkpoint[:2] == fingerprints[path]:
+                report["skipped"] += 1
+                if checkpoint[2] == "error":
+                    report["errors"].append((path, "malformed (unchanged since last run)"))
+                continue
+            todo.append(path)
+
+        for result in self._parse_all(todo, check_header=set(unregistered)):
+            path = result["path"]
+            if "error" in result:
+                logger.warning(f"Backfill: {path} is malformed: {result['error']}")
+                report["errors"].append((path, result["error"]))
+                self.db.save_import_error(path, fingerprints[path], result["error"])
+                continue
+
+            order_id = registered.get(path)
+            if order_id is None:
+                order_id = self._register(path, unregistered[path])
+            self.db.save_imported_order(order_id, result["records"], result["counters"], path, fingerprints[path],
+                                        sheet_crc=result["sheet_crc"])
+            report["imported"] += 1
+            report["rows"] += len(result["records"])
+
+            done = report["imported"] + len(report["errors"])
+            if done % PROGRESS_EVERY == 0:
+                elapsed = time.monotonic() - started
+                logger.info(f"Backfill: {done}/{len(todo)} files, {report['rows'] / elapsed:.0f} rows/s")
+                if progress is not None:
+                    progress(done, len(todo))
+
+        report["seconds"] = time.monotonic() - started
+        report["rows_per_second"] = report["rows"] / report["seconds"] if report["seconds"] else 0.0
+        logger.info(f"Backfill finished: {report['imported']} imported, {report['skipped']} unchanged, "
+                    f"{len(report['errors'])} malformed, {report['rows']} rows "
+                    f"({report['rows_per_second']:.0f} rows/s)")
+        return report
+
+    def _parse_all(self, paths, check_header=()):
+        """Yield parse results in order, keeping at most 2 * workers files in flight."""
+        if self.workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                yield _parse_file(path, path in check_header)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            it = iter(paths)
+            for path in it:
+                pending.append(pool.submit(_parse_file, path, path in check_header))
+                if len(pending) >= 2 * self.workers:
+                    break
+            while pending:
+                yield pending.popleft().result()
+                nxt = next(it, None)
+                if nxt is not None:
+                    pending.append(pool.submit(_parse_file, nxt, nxt in check_header))
+
+    def _register(self, path: str, company_id: int) -> int:
+        """Add a workbook found in a client folder as an archived order of its company."""
+        created_by = self.db.get_first_admin_id() or 1
+        order_number = os.path.splitext(os.path.basename(path))[0]
+        # Historical file: date it by the file and keep it out of the awaiting-confirmation list
+        created_at = datetime.fromtimestamp(os.path.getmtime(path)).strftime(TIMESTAMP_FORMAT)
+        order_id = self.db.add_archived_order(order_number, company_id, path, created_by, created_at)
+        logger.info(f"Backfill: registered {path} as order {order_number}")
+        return order_id
+
+
+def main(argv=None):
+    from managers.db_manager import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="Import existing order workbooks into the database")
+    parser.add_argument("--db-path", help="Folder containing the database (default: the app's)")
+    parser.add_argument("--walk-folders", action="store_true",
+                        help="Also import unregistered workbooks found in the client folders")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    db = DatabaseManager(db_path=args.db_path) if args.db_path else DatabaseManager()
+    report = BackfillImporter(db, workers=args.workers).run(walk_folders=args.walk_folders)
+
+    print(f"Imported {report['imported']} files ({report['rows']} rows, {report['rows_per_second']:.0f} rows/s), "
+          f"{report['skipped']} unchanged")
+    for path, error in report["errors"]:
+        print(f"MALFORMED {path}: {error}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
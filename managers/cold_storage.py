@@ -0,0 +1,239 @@
+import os, stat, shutil, logging, zipfile, tempfile
+from datetime import datetime, timedelta
+
+from managers.xlsx_manager import TIMESTAMP_FORMAT
+from managers.xlsx_row_patcher import copy_member_raw
+
+logger = logging.getLogger(__name__)
+
+# Archived orders older than this many days are moved into cold storage
+try:
+    COLD_STORAGE_DAYS = int(os.environ.get('LT_COLD_STORAGE_DAYS', '90'))
+except Exception:
+    COLD_STORAGE_DAYS = 90
+
+# Containers live in this folder next to the order files they hold, one zip per month
+COLD_STORAGE_DIR = "ColdStorage"
+
+# orders.file_path of a stored order is "<container.zip>::<member>"
+CONTAINER_SEP = "::"
+
+
+def split_stored_path(path: str):
+    """Return (container, member) for a cold-storage path, else None."""
+    if not path or CONTAINER_SEP not in path:
+        return None
+    container, member = path.split(CONTAINER_SEP, 1)
+    return container, member
+
+
+def is_stored_path(path: str) -> bool:
+    return split_stored_path(path) is not None
+
+
+def stored_exists(path: str) -> bool:
+    """os.path.exists() that also accepts cold-storage paths (checks the container)."""
+    stored = split_stored_path(path)
+    return os.path.exists(stored[0] if stored else path)
+
+
+def open_stored(path: str):
+    """Open an order file for binary reading, whether live or inside a container."""
+    stored = split_stored_path(path)
+    if stored is None:
+        return open(path, "rb")
+    container, member = stored
+    zf = zipfile.ZipFile(container)
+    try:
+        fh = zf.open(member)
+    except Exception:
+        zf.close()
+        raise
+    # Closing the member closes the container with it
+    original_close = fh.close
+
+    def close():
+        original_close()
+        zf.close()
+    fh.close = close
+    return fh
+
+
+def extract_copy(path: str, dest_dir: str = None) -> str:
+    """Return a path Excel can open: the file itself, or for a cold-storage path
+    a read-only copy of the member extracted to dest_dir (a temp folder by default).
+
+    Edits need restore(); the copy is never written back.
+    """
+    stored = split_stored_path(path)
+    if stored is None:
+        return path
+    dest_dir = dest_dir if dest_dir else os.path.join(tempfile.gettempdir(), "LabelTracker", COLD_STORAGE_DIR)
+    os.makedirs(dest_dir, exist_ok=True)
+    name, ext = os.path.splitext(os.path.basename(stored[1]))
+    fd, copy_path = tempfile.mkstemp(prefix=f"{name}_", suffix=ext or ".xlsx", dir=dest_dir)
+    try:
+        with os.fdopen(fd, "wb") as out, open_stored(path) as fh:
+            shutil.copyfileobj(fh, out)
+    except Exception:
+        os.remove(copy_path)
+        raise
+    os.chmod(copy_path, stat.S_IREAD)
+    return copy_path
+
+
+class ColdStorage:
+    """Moves the files of long-archived orders into per-month zip containers.
+
+    compact() groups archived orders older than the cutoff by folder and
+    creation month, writes each month's container once (existing members are
+    copied as raw compressed bytes, new files deflated), then repoints
+    orders.file_path at "<container>::<member>" and removes the originals.
+    Each member's comment records its original path for restore().
+
+    Containers are always rewritten to a temp file and renamed into place,
+    so an interrupted run leaves either the old or the new container, and
+    members no longer referenced by any order are dropped on the next
+    rewrite.
+    """
+
+    def __init__(self, db, xlsx_manager=None, lock_manager=None):
+        self.db = db
+        self.xlsx_manager = xlsx_manager
+        self.lock_manager = lock_manager if lock_manager is not None else getattr(xlsx_manager, "lock_manager", None)
+
+    @staticmethod
+    def _container_for(file_path: str, created: datetime) -> str:
+        return os.path.join(os.path.dirname(file_path), COLD_STORAGE_DIR, f"{created:%Y-%m}.zip")
+
+    def candidates(self, older_than_days: int = None) -> dict:
+        """Return {container: [(order_id, file_path)]} of archived orders due for cold storage."""
+        days = COLD_STORAGE_DAYS if older_than_days is None else older_than_days
+        cutoff = datetime.now() - timedelta(days=days)
+        grouped = {}
+        for order_id, _num, _company, _board, status, file_path, created_at, _by in self.db.get_archived_orders():
+            if is_stored_path(file_path) or not file_path or not os.path.exists(file_path):
+                continue
+            try:
+                created = datetime.strptime(created_at, TIMESTAMP_FORMAT)
+            except (TypeError, ValueError):
+                created = datetime.fromtimestamp(os.path.getmtime(file_path))
+            if created >= cutoff:
+                continue
+            grouped.setdefault(self._container_for(file_path, created), []).append((order_id, file_path))
+        return grouped
+
+    def compact(self, older_than_days: int = None) -> int:
+        """Move eligible archived orders into cold storage. Returns the number of files moved."""
+        moved = 0
+        for container, orders in self.candidates(older_than_days).items():
+            try:
+                moved += self._store(container, orders)
+            except Exception as e:
+                # Originals are only removed after their container is in place and the DB updated
+                logger.error(f"Failed to compact orders into {container}: {e}", exc_info=True)
+        logger.info(f"Cold storage: moved {moved} archived order files")
+        return moved
+
+    def _referenced_members(self, container: str) -> set:
+        prefix = container + CONTAINER_SEP
+        return {o[5][len(prefix):] for o in self.db.get_orders() if o[5] and o[5].startswith(prefix)}
+
+    def _store(self, container: str, orders) -> int:
+        os.makedirs(os.path.dirname(container), exist_ok=True)
+        additions = {f"{order_id}_{os.path.basename(path)}": (order_id, path) for order_id, path in orders}
+        fingerprints = {}
+
+        if self.lock_manager is not None:
+            with self.lock_manager.locked(container):
+                self._write_container(container, additions, fingerprints)
+        else:
+            self._write_container(container, additions, fingerprints)
+
+        self.db.update_order_file_paths(
+            (order_id, f"{container}{CONTAINER_SEP}{member}") for member, (order_id, _) in additions.items())
+
+        moved = 0
+        for member, (order_id, path) in additions.items():
+            st = os.stat(path)
+            if (st.st_size, st.st_mtime_ns) != fingerprints[member]:
+                # Written to after it was copied: keep the live file authoritative
+                logger.warning(f"{path} changed while being compacted, leaving it in place")
+                self.db.update_order_file_paths([(order_id, path)])
+                continue
+            os.remove(path)
+            if self.xlsx_manager is not None:
+                self.xlsx_manager.invalidate_status(path)
+            moved += 1
+        return moved
+
+    def _write_container(self, container: str, additions: dict, fingerprints: dict):
+        keep = self._referenced_members(container) - set(additions)
+        fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=".zip", dir=os.path.dirname(container))
+        os.close(fd)
+        try:
+            with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as zout:
+                if os.path.exists(container):
+                    with zipfile.ZipFile(container) as zin:
+                        for info in zin.infolist():
+                            if info.filename in keep:
+                                copy_member_raw(zin, zout, info)
+
+                for member, (_order_id, path) in additions.items():
+                    st = os.stat(path)
+                    fingerprints[member] = (st.st_size, st.st_mtime_ns)
+                    info = zipfile.ZipInfo(member, date_time=datetime.fromtimestamp(st.st_mtime).timetuple()[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    info.comment = path.encode("utf-8")
+                    with open(path, "rb") as src, zout.open(info, "w") as dst:
+                        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                            dst.write(chunk)
+
+            # Read the new members back (zipfile checks their CRC) before trusting the container
+            with zipfile.ZipFile(tmp_path) as check:
+                for member in additions:
+                    with check.open(member) as fh:
+                        while fh.read(1024 * 1024):
+                            pass
+            with open(tmp_path, "rb+") as fh:
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, container)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def restore(self, order_id: int) -> str:
+        """Extract an order's file back to its original location if it is in cold storage.
+
+        Returns the live file path (unchanged if the order was not stored).
+        """
+        details = self.db.get_order_details(order_id)
+        if not details:
+            raise ValueError(f"Order {order_id} not found")
+        stored = split_stored_path(details[3])
+        if stored is None:
+            return details[3]
+        container, member = stored
+
+        with zipfile.ZipFile(container) as zf:
+            info = zf.getinfo(member)
+            original = info.comment.decode("utf-8") if info.comment else os.path.join(
+                os.path.dirname(os.path.dirname(container)), member.split("_", 1)[-1])
+            target_dir = os.path.dirname(original) or "."
+            os.makedirs(target_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=".xlsx", dir=target_dir)
+            try:
+                with os.fdopen(fd, "wb") as dst, zf.open(info) as src:
+                    for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                        dst.write(chunk)
+                os.replace(tmp_path, original)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        # The stale member is dropped the next time this container is rewritten
+        self.db.update_order_file_paths([(order_id, original)])
+        if self.xlsx_manager is not None:
+            self.xlsx_manager.invalidate_status(original)
+        logger.info(f"Restored order {details[0]} from {container} to {original}")
+        return original
@@ -0,0 +1,84 @@
+import os, json, logging
+from datetime import datetime
+
+from utils.logger import resource_path
+
+logger = logging.getLogger(__name__)
+
+
+def file_stamp(file_path):
+    """(size, mtime_ns) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(file_path)
+        return st.st_size, st.st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+
+class DashboardSnapshot:
+    """Station-local copy of the admin dashboard as it was last shown.
+
+    The admin window saves its awaiting-confirmation rows (with each order
+    file's (size, mtime_ns) fingerprint) and the company list with order
+    counts on logout or exit, and shows them straight away on the next
+    login while the real data loads. A row whose file fingerprint still
+    matches keeps its saved status instead of being rescanned.
+
+    The snapshot is tied to the database it was taken from, written to a
+    temporary file and renamed into place, and ignored if it can't be read.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_dir: str = None, file_name: str = "dashboard_snapshot.json"):
+        self.cache_dir = cache_dir if cache_dir else resource_path('cache')
+        self.path = os.path.join(self.cache_dir, file_name)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _db_key(db_path: str) -> str:
+        return os.path.normcase(os.path.abspath(db_path))
+
+    def save(self, db_path: str, orders, companies) -> bool:
+        """Store the dashboard.
+
+        orders: (order_id, order_number, company, board, status, file_path, size, mtime_ns) rows
+        companies: (company_id, company_name, total_orders, open_orders) rows
+        """
+        data = {
+            "version": self.VERSION,
+            "db": self._db_key(db_path),
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "orders": [list(o) for o in orders],
+            "companies": [list(c) for c in companies],
+        }
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to save dashboard snapshot: {e}")
+            return False
+
+    def load(self, db_path: str):
+        """The saved dashboard of db_path as a dict (saved_at, orders, companies), or None."""
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable dashboard snapshot: {e}")
+            return None
+        if data.get("version") != self.VERSION or data.get("db") != self._db_key(db_path):
+            return None
+        try:
+            data["saved_at"] = datetime.fromisoformat(data["saved_at"])
+            data["orders"] = [tuple(o) for o in data["orders"]]
+            data["companies"] = [tuple(c) for c in data["companies"]]
+        except Exception as e:
+            logger.warning(f"Ignoring malformed dashboard snapshot: {e}")
+            return None
+        return data
@@ -84,6 +84,71 @@ class DatabaseManager:
                     FOREIGN KEY (created_by) REFERENCES users(user_id)
                 )""")
 
+                # Per-serial results, written through on every save of the order file.
+                # Client deliverables are built from here instead of the operator's working file.
+                query.execute("""
+                CREATE TABLE IF NOT EXISTS serial_results (
+                    order_id INTEGER NOT NULL,
+                    serial TEXT NOT NULL,
+                    excel_row INTEGER NOT NULL,
+                    operator TEXT,
+                    pass_fail TEXT,
+                    pass_fail_timestamp TEXT,
+                    failure_explanation TEXT,
+                    fix_explanation TEXT,
+                    updated_at TEXT NOT NULL,
+                    change_seq INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (order_id, serial),
+                    FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE
+                )""")
+
+                # CRC of the order sheet version each order's serial_results were last brought up to date with
+                query.execute("""
+                CREATE TABLE IF NOT EXISTS serial_results_sync (
+                    order_id INTEGER PRIMARY KEY,
+                    sheet_crc TEXT NOT NULL,
+                    FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE
+                )""")
+
+                # Per-order result counters (workbook summary shape), kept alongside serial_results
+                query.execute("""
+                CREATE TABLE IF NOT EXISTS order_counters (
+                    order_id INTEGER PRIMARY KEY,
+                    total_count INTEGER NOT NULL,
+                    pass_count INTEGER NOT NULL,
+                    fail_count INTEGER NOT NULL,
+                    pending_count INTEGER NOT NULL,
+                    timestamped_passes INTEGER NOT NULL,
+                    last_timestamp TEXT,
+                    updated_at TEXT NOT NULL,
+                    FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE
+                )""")
+
+                # Files handled by the backfill importer, so an interrupted run resumes where it stopped
+                query.execute("""
+                CREATE TABLE IF NOT EXISTS import_checkpoints (
+                    file_path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    status TEXT NOT NULL CHECK(status IN ('done', 'error')),
+                    order_id INTEGER,
+                    row_count INTEGER NOT NULL DEFAULT 0,
+                    message TEXT,
+                    imported_at TEXT NOT NULL
+                )""")
+
+                # Last change_seq delivered to a client for an order (delta exports)
+                query.execute("""
+                CREATE TABLE IF NOT EXISTS delivery_watermarks (
+                    company_id INTEGER NOT NULL,
+                    order_id INTEGER NOT NULL,
+                    last_seq INTEGER NOT NULL DEFAULT 0,
+                    delivered_at TEXT,
+                    delivered_file TEXT,
+                    PRIMARY KEY (company_id, order_id),
+                    FOREIGN KEY (order_id) REFERENCES orders(order_id) ON DELETE CASCADE
+                )""")
+
                 conn.commit()
 
                 # Ensure 'archived' column on boards exists (0/1)
@@ -105,6 +170,19 @@ class DatabaseManager:
                     query.execute("ALTER TABLE companies ADD COLUMN archived INTEGER NOT NULL DEFAULT 0")
                     conn.commit()
 
+                # Ensure 'change_seq' column on serial_results exists (delta exports)
+                query.execute("PRAGMA table_info(serial_results)")
+                result_cols = [r[1] for r in query.fetchall()]
+                if 'change_seq' not in result_cols:
+                    query.execute("ALTER TABLE serial_results ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0")
+                    conn.commit()
+                query.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_serial_results_seq ON serial_results (order_id, change_seq)")
+                query.execute("CREATE INDEX IF NOT EXISTS idx_serial_results_change ON serial_results (change_seq)")
+                # Company tree: per-company counts and per-board order pages
+                query.execute("CREATE INDEX IF NOT EXISTS idx_orders_company_board ON orders (company_id, board_id, order_id)")
+                conn.commit()
+
                 # Ensure at least one admin user exists (seed default admin)
                 query.execute("SELECT user_id FROM users WHERE username=?", ("admin",))
                 if not query.fetchone():
@@ -122,6 +200,18 @@ class DatabaseManager:
             raise
 
     # ---------------- User methods ----------------
+    def get_first_admin_id(self):
+        """user_id of the oldest admin account, or None."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT user_id FROM users WHERE role='admin' ORDER BY user_id LIMIT 1")
+                row = query.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Failed to get admin user: {e}")
+            raise
+
     def add_user(self, username, password, role="user"):
         pw_hash = hashlib.sha256(password.encode()).hexdigest()
         try:
@@ -160,9 +250,11 @@ class DatabaseManager:
                     (company_name, client_path, cust_id),
                 )
                 conn.commit()
+                company_id = query.lastrowid
 
             if not os.path.exists(client_path):
                 os.makedirs(client_path, exist_ok=True)
+            return company_id
         except Exception as e:
             logger.error(f"Failed to add company: {e}")
             raise
@@ -247,8 +339,10 @@ class DatabaseManager:
                     (company_id, board_name, board_path),
                 )
                 conn.commit()
+                board_id = query.lastrowid
             if not os.path.exists(board_path):
                 os.makedirs(board_path, exist_ok=True)
+            return board_id
 
         except Exception as e:
             logger.error(f"Failed to add board: {e}")
@@ -279,10 +373,27 @@ class DatabaseManager:
                     (order_number, company_id, board_id, file_path, created_at, created_by),
                 )
                 conn.commit()
+                return query.lastrowid
         except Exception as e:
             logger.error(f"Failed to add order: {e}")
             raise
 
+    def add_archived_order(self, order_number, company_id, file_path, created_by, created_at):
+        """Add a historical order (e.g. found by the backfill importer) straight to the archive."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute(
+                    "INSERT INTO orders (order_number, company_id, board_id, file_path, created_at, created_by, status) "
+                    "VALUES (?, ?, NULL, ?, ?, ?, 'Archived')",
+                    (order_number, company_id, file_path, created_at, created_by),
+                )
+                conn.commit()
+                return query.lastrowid
+        except Exception as e:
+            logger.error(f"Failed to add archived order: {e}")
+            raise
+
     def update_order_status(self, order_id, status):
         try:
             with self.get_connection() as conn:
@@ -336,7 +447,8 @@ class DatabaseManager:
                         o.status,
                         o.file_path,
                         o.created_at,
-                        u.username
+                        u.username,
+                        o.order_id
                     FROM orders o
                     LEFT JOIN companies c ON o.company_id = c.company_id
                     LEFT JOIN boards b ON o.board_id = b.board_id
@@ -388,10 +500,24 @@ class DatabaseManager:
             logger.error(f"Failed to get boards: {e}")
             raise
 
+    def get_archived_boards(self):
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT board_id, board_name, company_id FROM boards WHERE archived=1")
+                return query.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to get archived boards: {e}")
+            raise
+
     def delete_order_permanently(self, order_id):
         try:
             with self.get_connection() as conn:
                 query = conn.cursor()
+                query.execute("DELETE FROM serial_results WHERE order_id=?", (order_id,))
+                query.execute("DELETE FROM delivery_watermarks WHERE order_id=?", (order_id,))
+                query.execute("DELETE FROM order_counters WHERE order_id=?", (order_id,))
+                query.execute("DELETE FROM serial_results_sync WHERE order_id=?", (order_id,))
                 query.execute("DELETE FROM orders WHERE order_id=?", (order_id,))
                 conn.commit()
         except Exception as e:
@@ -415,7 +541,12 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 query = conn.cursor()
-                # Delete orders referencing company
+                # Delete orders referencing company (and their serial results)
+                for table in ("serial_results", "delivery_watermarks", "order_counters", "serial_results_sync"):
+                    query.execute(
+                        f"DELETE FROM {table} WHERE order_id IN (SELECT order_id FROM orders WHERE company_id=?)",
+                        (company_id,),
+                    )
                 query.execute("DELETE FROM orders WHERE company_id=?", (company_id,))
                 # Delete boards
                 query.execute("DELETE FROM boards WHERE company_id=?", (company_id,))
@@ -438,3 +569,404 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to get orders: {e}")
             raise
+
+    def get_order(self, order_id):
+        """Return one orders row (same shape as get_orders) or None."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT * FROM orders WHERE order_id=?", (order_id,))
+                return query.fetchone()
+        except Exception as e:
+            logger.error(f"Failed to get order {order_id}: {e}")
+            raise
+
+    def get_company_order_counts(self):
+        """Return {company_id: (total_orders, open_orders)} from one GROUP BY."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute(
+                    "SELECT company_id, COUNT(*), SUM(status != 'Archived') FROM orders GROUP BY company_id")
+                return {company_id: (total, open_ or 0) for company_id, total, open_ in query.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to count orders per company: {e}")
+            raise
+
+    def get_board_order_counts(self, company_id):
+        """Return {board_id: order count} for a company (board_id None for orders without a board)."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT board_id, COUNT(*) FROM orders WHERE company_id=? GROUP BY board_id",
+                              (company_id,))
+                return dict(query.fetchall())
+        except Exception as e:
+            logger.error(f"Failed to count orders per board for company {company_id}: {e}")
+            raise
+
+    def get_orders_page(self, company_id, board_id=None, before_id=None, limit=200, unassigned=False):
+        """Return up to limit orders (newest first, same shape as get_orders) of one board of a company.
+
+        unassigned=True returns the company's orders that have no active board
+        instead. Pass the last order_id of the previous page as before_id.
+        """
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                if unassigned:
+                    where = ("company_id=? AND (board_id IS NULL OR board_id NOT IN "
+                             "(SELECT board_id FROM boards WHERE company_id=? AND archived=0))")
+                    params = [company_id, company_id]
+                else:
+                    where, params = "company_id=? AND board_id=?", [company_id, board_id]
+                if before_id is not None:
+                    where += " AND order_id < ?"
+                    params.append(before_id)
+                query.execute(f"SELECT * FROM orders WHERE {where} ORDER BY order_id DESC LIMIT ?", (*params, limit))
+                return query.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to get orders page for company {company_id}: {e}")
+            raise
+
+    def update_order_file_paths(self, paths):
+        """Point orders at new file locations. paths: iterable of (order_id, file_path)."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.executemany("UPDATE orders SET file_path=? WHERE order_id=?",
+                                  [(file_path, order_id) for order_id, file_path in paths])
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to update order file paths: {e}")
+            raise
+
+    def get_order_id_by_file(self, file_path):
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT order_id FROM orders WHERE file_path=? ORDER BY order_id DESC", (file_path,))
+                row = query.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Failed to look up order for {file_path}: {e}")
+            raise
+
+    def get_order_details(self, order_id):
+        """Return (order_number, company_id, board_name, file_path, created_at, created_by, client_path) or None."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("""
+                    SELECT o.order_number,
+                        o.company_id,
+                        b.board_name,
+                        o.file_path,
+                        o.created_at,
+                        o.created_by,
+                        c.client_path
+                    FROM orders o
+                    LEFT JOIN companies c ON o.company_id = c.company_id
+                    LEFT JOIN boards b ON o.board_id = b.board_id
+                    WHERE o.order_id = ?
+                """, (order_id,))
+                return query.fetchone()
+        except Exception as e:
+            logger.error(f"Failed to get order {order_id}: {e}")
+            raise
+
+    # ---------------- Serial result methods ----------------
+    def save_serial_results(self, order_id, rows, replace_all=False, sheet_crc=None, previous_crc=None,
+                            counters=None):
+        """Insert or replace serial results.
+
+        rows: iterable of (serial, excel_row, operator, pass_fail, pass_fail_timestamp,
+        failure_explanation, fix_explanation). With replace_all=True rows are the
+        order's complete results: serials not in rows are dropped and rows that
+        are already stored unchanged are left alone, in the same transaction.
+
+        Every call stamps its rows with the next change_seq. The number is taken
+        under the write lock, so a batch committed after a reader's snapshot
+        always gets a higher change_seq than anything that reader saw.
+
+        sheet_crc records which version of the order's sheet the results now
+        match. With previous_crc it is only recorded if the results matched
+        previous_crc before (a save on top of a version the DB never saw leaves
+        them marked behind). counters (workbook summary shape) replace the
+        order's order_counters row.
+        """
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("BEGIN IMMEDIATE")
+                self._write_serial_results(query, order_id, rows, replace_all)
+                if sheet_crc is not None:
+                    self._set_results_sheet_crc(query, order_id, sheet_crc, previous_crc)
+                if counters is not None:
+                    self._write_order_counters(query, order_id, counters)
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to save serial results for order {order_id}: {e}")
+            raise
+
+    @staticmethod
+    def _write_serial_results(query, order_id, rows, replace_all):
+        """save_serial_results() body, for callers already inside a BEGIN IMMEDIATE transaction."""
+        rows = [tuple(row) for row in rows]
+        if replace_all:
+            # Unchanged rows keep their change_seq, so delta exports only resend real changes
+            query.execute(
+                """SELECT serial, excel_row, operator, pass_fail, pass_fail_timestamp,
+                          failure_explanation, fix_explanation
+                   FROM serial_results WHERE order_id=?""",
+                (order_id,),
+            )
+            stored = {row[0]: row for row in query.fetchall()}
+            query.executemany("DELETE FROM serial_results WHERE order_id=? AND serial=?",
+                              ((order_id, serial) for serial in stored.keys() - {str(row[0]) for row in rows}))
+            rows = [row for row in rows if stored.get(str(row[0])) != DatabaseManager._stored_result(row)]
+        if not rows:
+            return
+        updated_at = datetime.datetime.now().isoformat(timespec="microseconds")
+        query.execute("SELECT COALESCE(MAX(change_seq), 0) + 1 FROM serial_results")
+        change_seq = query.fetchone()[0]
+        query.executemany(
+            """INSERT OR REPLACE INTO serial_results
+               (order_id, serial, excel_row, operator, pass_fail, pass_fail_timestamp,
+                failure_explanation, fix_explanation, updated_at, change_seq)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            ((order_id, *row, updated_at, change_seq) for row in rows),
+        )
+
+    @staticmethod
+    def _stored_result(row):
+        """A serial_results row tuple as SQLite hands it back (TEXT columns come back as str)."""
+        return tuple(value if value is None or i == 1 else str(value) for i, value in enumerate(row))
+
+    @staticmethod
+    def _write_order_counters(query, order_id, counters):
+        query.execute(
+            """INSERT OR REPLACE INTO order_counters
+               (order_id, total_count, pass_count, fail_count, pending_count, timestamped_passes,
+                last_timestamp, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            (order_id, counters["total_count"], counters["pass_count"], counters["fail_count"],
+             counters["pending_count"], counters["timestamped_passes"], counters["last_timestamp"],
+             datetime.datetime.now().isoformat(timespec="seconds")),
+        )
+
+    @staticmethod
+    def _set_results_sheet_crc(query, order_id, sheet_crc, previous_crc=None):
+        if previous_crc is None:
+            query.execute("INSERT OR REPLACE INTO serial_results_sync (order_id, sheet_crc) VALUES (?, ?)",
+                          (order_id, sheet_crc))
+        else:
+            query.execute("UPDATE serial_results_sync SET sheet_crc=? WHERE order_id=? AND sheet_crc=?",
+                          (sheet_crc, order_id, previous_crc))
+
+    def get_results_sheet_crc(self, order_id):
+        """CRC of the order sheet version the serial results were last brought up to date with, or None."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT sheet_crc FROM serial_results_sync WHERE order_id=?", (order_id,))
+                row = query.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            logger.error(f"Failed to get results sheet CRC for order {order_id}: {e}")
+            raise
+
+    def get_serial_result_counts(self, order_id):
+        """Return [(pass_fail, count), ...] for an order's serial results."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute(
+                    "SELECT pass_fail, COUNT(*) FROM serial_results WHERE order_id=? GROUP BY pass_fail",
+                    (order_id,),
+                )
+                return query.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to count serial results for order {order_id}: {e}")
+            raise
+
+    def get_last_result_times(self):
+        """Return {order_id: ISO time of the order's most recent serial result write}."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT order_id, MAX(updated_at) FROM serial_results GROUP BY order_id")
+                return dict(query.fetchall())
+        except Exception as e:
+            logger.error(f"Failed to get last result times: {e}")
+            raise
+
+    def iter_serial_results(self, order_id, after_seq=None, upto_seq=None, batch_size=1000):
+        """Yield (serial, excel_row, operator, pass_fail, pass_fail_timestamp, failure_explanation,
+        fix_explanation) in sheet order, fetching batch_size rows at a time.
+
+        after_seq/upto_seq restrict the rows to after_seq < change_seq <= upto_seq.
+        """
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                sql = """SELECT serial, excel_row, operator, pass_fail, pass_fail_timestamp,
+                                failure_explanation, fix_explanation
+                         FROM serial_results WHERE order_id=?"""
+                params = [order_id]
+                if after_seq is not None:
+                    sql += " AND change_seq > ?"
+                    params.append(after_seq)
+                if upto_seq is not None:
+                    sql += " AND change_seq <= ?"
+                    params.append(upto_seq)
+                query.execute(sql + " ORDER BY excel_row", params)
+                while True:
+                    batch = query.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    yield from batch
+        except Exception as e:
+            logger.error(f"Failed to read serial results for order {order_id}: {e}")
+            raise
+
+    def get_max_change_seq(self, order_id):
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT COALESCE(MAX(change_seq), 0) FROM serial_results WHERE order_id=?", (order_id,))
+                return query.fetchone()[0]
+        except Exception as e:
+            logger.error(f"Failed to read change sequence for order {order_id}: {e}")
+            raise
+
+    def get_orders_changed_since(self, after_seq=None):
+        """Return ({order_id: latest change_seq} for results written after after_seq, latest change_seq overall).
+
+        With after_seq=None only the latest change_seq is looked up, as a starting point.
+        """
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                latest = query.execute("SELECT COALESCE(MAX(change_seq), 0) FROM serial_results").fetchone()[0]
+                if after_seq is None:
+                    return {}, latest
+                query.execute(
+                    "SELECT order_id, MAX(change_seq) FROM serial_results WHERE change_seq > ? GROUP BY order_id",
+                    (after_seq,))
+                return dict(query.fetchall()), latest
+        except Exception as e:
+            logger.error(f"Failed to read orders changed since {after_seq}: {e}")
+            raise
+
+    # ---------------- Delivery watermark methods ----------------
+    def get_delivery_watermark(self, company_id, order_id):
+        """Return (last_seq, delivered_at, delivered_file) for (company, order); (0, None, None) if never delivered."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute(
+                    "SELECT last_seq, delivered_at, delivered_file FROM delivery_watermarks WHERE company_id=? AND order_id=?",
+                    (company_id, order_id),
+                )
+                row = query.fetchone()
+                return tuple(row) if row else (0, None, None)
+        except Exception as e:
+            logger.error(f"Failed to read delivery watermark for order {order_id}: {e}")
+            raise
+
+    def advance_delivery_watermark(self, company_id, order_id, expected_seq, new_seq, delivered_file):
+        """Move the watermark from expected_seq to new_seq.
+
+        Returns False (and changes nothing) if another export moved it first.
+        """
+        try:
+            delivered_at = datetime.datetime.now().strftime("%b %d, %Y %I:%M %p")
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("BEGIN IMMEDIATE")
+                query.execute(
+                    "INSERT OR IGNORE INTO delivery_watermarks (company_id, order_id, last_seq) VALUES (?, ?, 0)",
+                    (company_id, order_id),
+                )
+                query.execute(
+                    """UPDATE delivery_watermarks SET last_seq=?, delivered_at=?, delivered_file=?
+                       WHERE company_id=? AND order_id=? AND last_seq=?""",
+                    (new_seq, delivered_at, delivered_file, company_id, order_id, expected_seq),
+                )
+                advanced = query.rowcount == 1
+                conn.commit()
+                return advanced
+        except Exception as e:
+            logger.error(f"Failed to advance delivery watermark for order {order_id}: {e}")
+            raise
+
+    # ---------------- Backfill import methods ----------------
+    def get_import_checkpoints(self):
+        """Return {file_path: (size, mtime_ns, status)} for files the importer has handled."""
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("SELECT file_path, size, mtime_ns, status FROM import_checkpoints")
+                return {row[0]: tuple(row[1:]) for row in query.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to read import checkpoints: {e}")
+            raise
+
+    def save_imported_order(self, order_id, rows, counters, file_path, fingerprint, sheet_crc=None):
+        """Replace an order's serial results and counters and checkpoint its file, in one transaction.
+
+        counters: dict with total_count, pass_count, fail_count, pending_count,
+        timestamped_passes and last_timestamp. sheet_crc is the CRC of the sheet
+        the rows were read from (see save_serial_results()).
+        """
+        try:
+            now = datetime.datetime.now().isoformat(timespec="seconds")
+            rows = list(rows)
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute("BEGIN IMMEDIATE")
+                self._write_serial_results(query, order_id, rows, replace_all=True)
+                self._write_order_counters(query, order_id, counters)
+                if sheet_crc is not None:
+                    self._set_results_sheet_crc(query, order_id, sheet_crc)
+                query.execute(
+                    """INSERT OR REPLACE INTO import_checkpoints
+                       (file_path, size, mtime_ns, status, order_id, row_count, message, imported_at)
+                       VALUES (?, ?, ?, 'done', ?, ?, NULL, ?)""",
+                    (file_path, fingerprint[0], fingerprint[1], order_id, len(rows), now),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to save imported order {order_id}: {e}")
+            raise
+
+    def save_import_error(self, file_path, fingerprint, message):
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute(
+                    """INSERT OR REPLACE INTO import_checkpoints
+                       (file_path, size, mtime_ns, status, order_id, row_count, message, imported_at)
+                       VALUES (?, ?, ?, 'error', NULL, 0, ?, ?)""",
+                    (file_path, fingerprint[0], fingerprint[1], message,
+                     datetime.datetime.now().isoformat(timespec="seconds")),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to record import error for {file_path}: {e}")
+            raise
+
+    def get_order_counters(self, order_id):
+        try:
+            with self.get_connection() as conn:
+                query = conn.cursor()
+                query.execute(
+                    """SELECT total_count, pass_count, fail_count, pending_count, timestamped_passes, last_timestamp
+                       FROM order_counters WHERE order_id=?""",
+                    (order_id,),
+                )
+                return query.fetchone()
+        except Exception as e:
+            logger.error(f"Failed to get counters for order {order_id}: {e}")
+            raise
@@ -0,0 +1,213 @@
+import os, json, queue, hashlib, logging, zipfile, tempfile, threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from managers.xlsx_manager import TIMESTAMP_FORMAT, DELIVERABLE_DIR, PASS_VALUES, FAIL_VALUES
+from managers.cold_storage import open_stored, stored_exists
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+# Files hashed/read ahead of the one being written into the zip
+try:
+    BUNDLE_WORKERS = max(1, int(os.environ.get('LT_BUNDLE_WORKERS', '4')))
+except Exception:
+    BUNDLE_WORKERS = 4
+
+# Chunks buffered per file being read ahead (bounds memory to workers * depth * CHUNK_SIZE)
+READ_AHEAD_CHUNKS = 8
+
+
+class BundleError(Exception):
+    pass
+
+
+def _read_hashing(path: str, chunks: queue.Queue, cancelled: threading.Event):
+    """Read path in chunks into the queue, hashing as it goes. Ends with (None, sha256) or (None, exception)."""
+    digest = hashlib.sha256()
+    try:
+        with open_stored(path) as fh:
+            while not cancelled.is_set():
+                chunk = fh.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)  # hashlib releases the GIL on large buffers
+                chunks.put(chunk)
+        chunks.put((None, digest.hexdigest()))
+    except Exception as e:
+        chunks.put((None, e))
+
+
+class DeliveryBundler:
+    """Packs confirmed order files for a client into one zip with a manifest.
+
+    Order files are streamed straight into the zip (no temporary copies) and
+    their SHA-256 is computed while they are read. Reading and hashing run
+    on a small thread pool ahead of the writer, so the next files are being
+    hashed while the current one is written. manifest.json, built from the
+    DB, lists every order with its board, result counts, size and checksum;
+    verify_bundle() checks a bundle against it in one pass.
+    """
+
+    def __init__(self, db, xlsx_manager, workers: int = None):
+        self.db = db
+        self.xlsx_manager = xlsx_manager
+        self.workers = workers if workers else BUNDLE_WORKERS
+
+    def select_orders(self, company_id=None, start=None, end=None, order_ids=None, status="Archived"):
+        """Return order ids to bundle.
+
+        Either the given order_ids, or the company's orders with the given
+        status created between the start and end dates (inclusive, either may be None).
+        """
+        if order_ids:
+            return list(order_ids)
+        selected = []
+        for order_id, _num, o_company, _board, o_status, _path, created_at, _by in self.db.get_orders(company_id):
+            if status and o_status != status:
+                continue
+            if start or end:
+                try:
+                    created = datetime.strptime(created_at, TIMESTAMP_FORMAT).date()
+                except (TypeError, ValueError):
+                    logger.warning(f"Order {order_id} has an unreadable creation date, not bundled")
+                    continue
+                if (start and created < start) or (end and created > end):
+                    continue
+            selected.append(order_id)
+        return selected
+
+    def _source_file(self, details) -> str:
+        """The client deliverable when one was exported, else the order file (possibly in cold storage)."""
+        order_number, _company, _board, file_path, _created, _by, client_path = details
+        deliverable = os.path.join(client_path or "", DELIVERABLE_DIR, f"{order_number}.xlsx")
+        return deliverable if client_path and os.path.exists(deliverable) else file_path
+
+    def _counts(self, order_id: int, file_path: str) -> dict:
+        self.xlsx_manager.refresh_serial_results(order_id, file_path)
+        counts = {"total": 0, "pass": 0, "fail": 0, "pending": 0}
+        for pass_fail, count in self.db.get_serial_result_counts(order_id):
+            pf_str = str(pass_fail).strip().lower() if pass_fail is not None else ""
+            category = "pass" if pf_str in PASS_VALUES else "fail" if pf_str in FAIL_VALUES else "pending"
+            counts[category] += count
+            counts["total"] += count
+        return counts
+
+    def build_bundle(self, dest_path: str, order_ids) -> dict:
+        """Write a bundle of the given orders to dest_path and return its manifest."""
+        entries = []
+        for order_id in order_ids:
+            details = self.db.get_order_details(order_id)
+            if not details:
+                raise BundleError(f"Order {order_id} not found")
+            source = self._source_file(details)
+            if not source or not stored_exists(source):
+                raise BundleError(f"File for order {details[0]} not found: {source}")
+            entries.append({
+                "order_id": order_id,
+                "order_number": details[0],
+                "company_id": details[1],
+                "board": details[2],
+                "created_at": details[4],
+                "counts": self._counts(order_id, details[3]),
+                "member": f"orders/{details[0]}.xlsx",
+                "source": source,
+            })
+        if len({e["member"] for e in entries}) != len(entries):
+            raise BundleError("Duplicate order numbers in bundle")
+
+        dest_dir = os.path.dirname(dest_path) or "."
+        os.makedirs(dest_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=".zip", dir=dest_dir)
+        os.close(fd)
+        cancelled = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bundle")
+        queues = []
+        try:
+            # Readers are submitted in write order, each feeding its own bounded queue; the
+            # writer always waits on the earliest unfinished file, which is already running
+            for entry in entries:
+                chunks = queue.Queue(maxsize=READ_AHEAD_CHUNKS)
+                pool.submit(_read_hashing, entry["source"], chunks, cancelled)
+                queues.append(chunks)
+
+            with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as zf:
+                for entry, chunks in zip(entries, queues):
+                    size = 0
+                    # XLSX files are already deflated; storing them keeps bundling I/O bound
+                    info = zipfile.ZipInfo(entry["member"], date_time=datetime.now().timetuple()[:6])
+                    with zf.open(info, "w", force_zip64=True) as member:
+                        while True:
+                            item = chunks.get()
+                            if isinstance(item, tuple):
+                                break
+                            member.write(item)
+                            size += len(item)
+                    if isinstance(item[1], Exception):
+                        raise BundleError(f"Could not read {entry['source']}: {item[1]}")
+                    entry["size"] = size
+                    entry["sha256"] = item[1]
+
+                manifest = {
+                    "version": MANIFEST_VERSION,
+                    "created_at": datetime.now().strftime(TIMESTAMP_FORMAT),
+                    "orders": [{k: v for k, v in e.items() if k != "source"} for e in entries],
+                }
+                zf.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2), compress_type=zipfile.ZIP_DEFLATED)
+            os.replace(tmp_path, dest_path)
+        finally:
+            # On failure, stop the readers and unblock any waiting on a full queue
+            cancelled.set()
+            for chunks in queues:
+                while not chunks.empty():
+                    chunks.get_nowait()
+            pool.shutdown(wait=True)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        logger.info(f"Bundled {len(entries)} orders into {dest_path}")
+        return manifest
+
+
+def verify_bundle(path: str, workers: int = None) -> list:
+    """Check every member of a bundle against its manifest in one pass.
+
+    Returns a list of problems; an empty list means the bundle is intact.
+    """
+    with zipfile.ZipFile(path) as zf:
+        try:
+            manifest = json.loads(zf.read(MANIFEST_NAME))
+        except KeyError:
+            return [f"{MANIFEST_NAME} missing"]
+        names = set(zf.namelist())
+
+    problems = [f"{e['member']} missing" for e in manifest["orders"] if e["member"] not in names]
+    present = [e for e in manifest["orders"] if e["member"] in names]
+
+    def check(entry):
+        digest = hashlib.sha256()
+        size = 0
+        # One handle per worker; reading also checks the zip CRC
+        with zipfile.ZipFile(path) as zf, zf.open(entry["member"]) as member:
+            for chunk in iter(lambda: member.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                size += len(chunk)
+        if size != entry["size"] or digest.hexdigest() != entry["sha256"]:
+            return f"{entry['member']} does not match the manifest"
+        return None
+
+    with ThreadPoolExecutor(max_workers=workers or BUNDLE_WORKERS) as pool:
+        for entry, result in zip(present, pool.map(lambda e: _safe_check(check, e), present)):
+            if result:
+                problems.append(result)
+    return problems
+
+
+def _safe_check(check, entry):
+    try:
+        return check(entry)
+    except (zipfile.BadZipFile, OSError) as e:
+        return f"{entry['member']} is unreadable: {e}"
@@ -0,0 +1,121 @@
+import os, csv, json, logging, tempfile
+from datetime import datetime
+
+from openpyxl import Workbook
+
+from managers.xlsx_manager import ORDER_HEADERS, DELIVERABLE_DIR
+
+logger = logging.getLogger(__name__)
+
+DELTA_FORMATS = ("csv", "jsonl", "xlsx")
+
+# Columns of a delta export: serial_results fields (JSON keys) and their order-file headers
+DELTA_KEYS = ("serial", "operator", "pass_fail", "timestamp", "failure", "fix")
+DELTA_HEADERS = [ORDER_HEADERS[5], ORDER_HEADERS[2]] + ORDER_HEADERS[6:]
+
+
+class DeliveryConflict(Exception):
+    """Another export advanced the delivery watermark while this one was being written."""
+
+
+class DeltaExporter:
+    """Writes the serial results changed since the last delivery of an order.
+
+    Each (company, order) has a watermark: the highest serial_results
+    change_seq already delivered. An export streams the rows with
+    watermark < change_seq <= current max into a CSV, JSON-lines or compact
+    XLSX file, then advances the watermark - only after the file has been
+    fully written, flushed and renamed into place. A crash in between leaves
+    the watermark where it was, so the next export re-sends those rows
+    rather than skipping them.
+    """
+
+    def __init__(self, db, xlsx_manager):
+        self.db = db
+        self.xlsx_manager = xlsx_manager
+
+    def export_changes(self, order_id: int, fmt: str = "csv", dest_dir: str = None):
+        """Export the changes of an order since its last delivery.
+
+        Returns (file_path, row_count), or (None, 0) if nothing changed.
+        Raises DeliveryConflict if a concurrent export delivered first.
+        """
+        if fmt not in DELTA_FORMATS:
+            raise ValueError(f"Unsupported delta format '{fmt}' (expected one of {', '.join(DELTA_FORMATS)})")
+
+        details = self.db.get_order_details(order_id)
+        if not details:
+            raise ValueError(f"Order {order_id} not found")
+        order_number, company_id, _board, file_path, _created_at, _created_by, client_path = details
+
+        # Rows edited outside the app only reach the DB through a resync
+        self.xlsx_manager.refresh_serial_results(order_id, file_path)
+
+        since = self.db.get_delivery_watermark(company_id, order_id)[0]
+        upto = self.db.get_max_change_seq(order_id)
+        if upto <= since:
+            logger.info(f"No changes to deliver for order {order_number} (watermark {since})")
+            return None, 0
+
+        dest_dir = dest_dir if dest_dir else os.path.join(client_path, DELIVERABLE_DIR)
+        os.makedirs(dest_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        dest_path = os.path.join(dest_dir, f"{order_number}_changes_{stamp}_{upto}.{fmt}")
+
+        rows = ((serial, operator, pass_fail, timestamp, failure, fix)
+                for serial, _row, operator, pass_fail, timestamp, failure, fix
+                in self.db.iter_serial_results(order_id, after_seq=since, upto_seq=upto))
+
+        fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=f".{fmt}", dir=dest_dir)
+        try:
+            if fmt == "xlsx":
+                fh = os.fdopen(fd, "wb")
+            else:
+                fh = os.fdopen(fd, "w", newline="", encoding="utf-8")
+            with fh:
+                count = getattr(self, f"_write_{fmt}")(fh, rows)
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, dest_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if not self.db.advance_delivery_watermark(company_id, order_id, since, upto, dest_path):
+            # Keep the file if the winning export wrote the same name (same range, same second)
+            if self.db.get_delivery_watermark(company_id, order_id)[2] != dest_path:
+                os.remove(dest_path)
+            raise DeliveryConflict(f"Order {order_number} was delivered by another export; try again")
+
+        logger.info(f"Delivered {count} changed serials of order {order_number} (seq {since}-{upto}) to {dest_path}")
+        return dest_path, count
+
+    @staticmethod
+    def _write_csv(fh, rows) -> int:
+        writer = csv.writer(fh)
+        writer.writerow(DELTA_HEADERS)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    @staticmethod
+    def _write_jsonl(fh, rows) -> int:
+        count = 0
+        for row in rows:
+            fh.write(json.dumps(dict(zip(DELTA_KEYS, row)), default=str) + "\n")
+            count += 1
+        return count
+
+    @staticmethod
+    def _write_xlsx(fh, rows) -> int:
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Changes")
+        ws.append(DELTA_HEADERS)
+        count = 0
+        for row in rows:
+            ws.append(row)
+            count += 1
+        wb.save(fh)
+        return count
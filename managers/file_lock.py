@@ -0,0 +1,323 @@
+import os, json, time, uuid, random, socket, getpass, logging, threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Lock policy, overridable per station through the environment
+try:
+    LOCK_TIMEOUT = float(os.environ.get('LT_LOCK_TIMEOUT', '30'))
+except Exception:
+    LOCK_TIMEOUT = 30.0
+# Waits made on the GUI thread (e.g. write-behind flushes) give up after this long;
+# whatever is left stays journaled for the next flush instead of freezing the window
+try:
+    INTERACTIVE_LOCK_TIMEOUT = float(os.environ.get('LT_INTERACTIVE_LOCK_TIMEOUT', '1.5'))
+except Exception:
+    INTERACTIVE_LOCK_TIMEOUT = 1.5
+try:
+    LOCK_STALE_AFTER = float(os.environ.get('LT_LOCK_STALE_AFTER', '60'))
+except Exception:
+    LOCK_STALE_AFTER = 60.0
+
+LOCK_SUFFIX = ".lock"
+
+# Waits longer than this are logged as warnings
+SLOW_WAIT_SECONDS = 1.0
+
+
+class LockTimeout(Exception):
+    """Raised when an order file lock (or a locked file operation) cannot be obtained in time."""
+
+
+class FileLockManager:
+    """Cross-process advisory locks for order files on the shared drive.
+
+    A lock is a small "<file>.lock" JSON file created with O_EXCL next to the
+    order file. It records owner, host, pid and a token; while held, its mtime
+    is refreshed by a heartbeat thread. A lock whose heartbeat is older than
+    stale_after seconds belongs to a crashed or disconnected station and is
+    broken by the next waiter.
+
+    Within one process waiters for the same file are served in FIFO order;
+    across stations they retry with jittered exponential backoff. Locks are
+    re-entrant per thread. Wait times, conflicts, stale recoveries and
+    timeouts are counted (see stats()).
+    """
+
+    def __init__(self, owner: str = None, timeout: float = None, stale_after: float = None,
+                 heartbeat_interval: float = None, base_delay: float = 0.05, max_delay: float = 2.0):
+        self.owner = owner if owner else self._default_owner()
+        self.host = socket.gethostname()
+        self.pid = os.getpid()
+        self.timeout = LOCK_TIMEOUT if timeout is None else timeout
+        self.stale_after = LOCK_STALE_AFTER if stale_after is None else stale_after
+        self.heartbeat_interval = heartbeat_interval if heartbeat_interval else max(self.stale_after / 4, 0.5)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._queues = {}   # key -> list of waiting tickets (FIFO)
+        self._held = {}     # key -> [thread ident, depth, token, lock_path]
+
+        self._stats = {
+            "acquisitions": 0,
+            "conflicts": 0,
+            "stale_recoveries": 0,
+            "timeouts": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0,
+        }
+
+    @staticmethod
+    def _default_owner() -> str:
+        try:
+            return getpass.getuser()
+        except Exception:
+            return "unknown"
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    @staticmethod
+    def lock_path(file_path: str) -> str:
+        return file_path + LOCK_SUFFIX
+
+    def backoff_delays(self):
+        """Yield jittered exponential backoff delays (capped at max_delay)."""
+        attempt = 0
+        while True:
+            delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+            # "Equal jitter": never shorter than half the step, so stations spread out
+            yield delay / 2 + random.uniform(0, delay / 2)
+            attempt += 1
+
+    @contextmanager
+    def locked(self, file_path: str, timeout: float = None):
+        """Hold the lock for file_path for the duration of the with-block.
+
+        Raises LockTimeout if it cannot be acquired within timeout seconds.
+        """
+        key = self._key(file_path)
+        me = threading.get_ident()
+
+        with self._cond:
+            held = self._held.get(key)
+            if held and held[0] == me:
+                held[1] += 1
+                reentered = True
+            else:
+                reentered = False
+        if reentered:
+            try:
+                yield
+            finally:
+                with self._cond:
+                    self._held[key][1] -= 1
+            return
+
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        token = self._acquire(key, self.lock_path(file_path), deadline)
+        self._record_wait(file_path, time.monotonic() - started)
+
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(self.lock_path(file_path), stop),
+                                name="order-lock-heartbeat", daemon=True)
+        beat.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            beat.join(timeout=1)
+            self._release(key, self.lock_path(file_path), token)
+
+    def _acquire(self, key: str, lock_path: str, deadline: float) -> str:
+        ticket = object()
+        with self._cond:
+            queue = self._queues.setdefault(key, [])
+            queue.append(ticket)
+            # In-process waiters line up behind each other and never race on the lock file
+            while queue[0] is not ticket or key in self._held:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    queue.remove(ticket)
+                    if not queue:
+                        self._queues.pop(key, None)
+                    self._cond.notify_all()
+                    self._stats["timeouts"] += 1
+                    raise LockTimeout(f"Timed out waiting for {lock_path} (queued behind local writers)")
+                self._cond.wait(remaining)
+
+        try:
+            delays = self.backoff_delays()
+            conflicted = False
+            while True:
+                token = self._try_create(lock_path)
+                if token:
+                    with self._cond:
+                        # Marked held before our ticket leaves the queue, so the next local waiter keeps waiting
+                        self._held[key] = [threading.get_ident(), 1, token, lock_path]
+                    return token
+
+                info = self._read_lock(lock_path)
+                if self._is_stale(lock_path) and self._break_stale(lock_path, info):
+                    continue
+
+                if not conflicted:
+                    conflicted = True
+                    with self._cond:
+                        self._stats["conflicts"] += 1
+                    holder = f"{info.get('owner')}@{info.get('host')}" if info else "unknown holder"
+                    logger.info(f"Order file locked by {holder}, waiting: {lock_path}")
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    with self._cond:
+                        self._stats["timeouts"] += 1
+                    holder = f"{info.get('owner')} on {info.get('host')}" if info else "another station"
+                    raise LockTimeout(f"Order file is locked by {holder}: {lock_path}")
+                time.sleep(min(next(delays), remaining))
+        finally:
+            with self._cond:
+                queue = self._queues.get(key, [])
+                if ticket in queue:
+                    queue.remove(ticket)
+                if not queue:
+                    self._queues.pop(key, None)
+                self._cond.notify_all()
+
+    def _try_create(self, lock_path: str):
+        token = uuid.uuid4().hex
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return None
+        except PermissionError:
+            # Windows reports a lock file being deleted by its holder as access denied
+            return None
+        try:
+            os.write(fd, json.dumps({
+                "owner": self.owner,
+                "host": self.host,
+                "pid": self.pid,
+                "token": token,
+                "acquired_at": time.time(),
+            }).encode("utf-8"))
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        return token
+
+    @staticmethod
+    def _read_lock(lock_path: str):
+        try:
+            with open(lock_path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return None
+
+    def _is_stale(self, lock_path: str) -> bool:
+        try:
+            age = time.time() - os.stat(lock_path).st_mtime
+        except OSError:
+            return False
+        return age > self.stale_after
+
+    def _break_stale(self, lock_path: str, info) -> bool:
+        """Remove a stale lock. Returns True if the caller should retry immediately."""
+        graveyard = f"{lock_path}.stale-{uuid.uuid4().hex[:8]}"
+        try:
+            os.rename(lock_path, graveyard)
+        except OSError:
+            # Someone else broke (or released) it first
+            return True
+
+        taken = self._read_lock(graveyard)
+        if info and taken and taken.get("token") != info.get("token") and not os.path.exists(lock_path):
+            # Between our stat and rename another station re-took the lock; give it back
+            try:
+                os.rename(graveyard, lock_path)
+                return False
+            except OSError:
+                pass
+        try:
+            os.remove(graveyard)
+        except OSError:
+            pass
+
+        with self._cond:
+            self._stats["stale_recoveries"] += 1
+        holder = f"{info.get('owner')}@{info.get('host')}" if info else "unknown holder"
+        logger.warning(f"Recovered stale lock held by {holder}: {lock_path}")
+        return True
+
+    def _heartbeat(self, lock_path: str, stop: threading.Event):
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                os.utime(lock_path, None)
+            except OSError as e:
+                logger.warning(f"Lock heartbeat failed for {lock_path}: {e}")
+
+    def _release(self, key: str, lock_path: str, token: str):
+        try:
+            info = self._read_lock(lock_path)
+            if info is None or info.get("token") == token:
+                os.remove(lock_path)
+            else:
+                logger.warning(f"Lock {lock_path} was taken over while held; leaving it in place")
+        except FileNotFoundError:
+            logger.warning(f"Lock {lock_path} disappeared while held")
+        except OSError as e:
+            logger.error(f"Failed to release lock {lock_path}: {e}")
+        finally:
+            with self._cond:
+                self._held.pop(key, None)
+                self._cond.notify_all()
+
+    def retry_io(self, func, file_path: str, timeout: float = None):
+        """Call func(), retrying PermissionError (e.g. Excel has the file open) with backoff.
+
+        Used for os.replace onto order files. Each retry counts as a conflict;
+        LockTimeout is raised once the timeout is exhausted.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        delays = self.backoff_delays()
+        conflicted = False
+        while True:
+            try:
+                result = func()
+                break
+            except PermissionError as e:
+                if not conflicted:
+                    conflicted = True
+                    with self._cond:
+                        self._stats["conflicts"] += 1
+                    logger.info(f"{file_path} is in use ({e}), retrying")
+                remaining = started + timeout - time.monotonic()
+                if remaining <= 0:
+                    with self._cond:
+                        self._stats["timeouts"] += 1
+                    raise LockTimeout(f"{file_path} stayed in use for {timeout:.0f}s: {e}") from e
+                time.sleep(min(next(delays), remaining))
+        if conflicted:
+            self._record_wait(file_path, time.monotonic() - started, count=False)
+        return result
+
+    def _record_wait(self, file_path: str, waited: float, count: bool = True):
+        with self._cond:
+            if count:
+                self._stats["acquisitions"] += 1
+            self._stats["total_wait"] += waited
+            self._stats["max_wait"] = max(self._stats["max_wait"], waited)
+        if waited >= SLOW_WAIT_SECONDS:
+            logger.warning(f"Waited {waited:.2f}s for {file_path}")
+
+    def stats(self) -> dict:
+        """Return lock telemetry for this session."""
+        with self._cond:
+            stats = dict(self._stats)
+        stats["avg_wait"] = (stats["total_wait"] / stats["acquisitions"]) if stats["acquisitions"] else 0.0
+        return stats
@@ -0,0 +1,203 @@
+import os, time, shutil, sqlite3, hashlib, logging, tempfile, threading
+from contextlib import contextmanager
+
+from utils.logger import resource_path
+
+logger = logging.getLogger(__name__)
+
+# Mirror size bound, overridable per station through the environment
+try:
+    MIRROR_MAX_MB = int(os.environ.get('LT_MIRROR_MAX_MB', '512'))
+except Exception:
+    MIRROR_MAX_MB = 512
+
+
+class OrderMirror:
+    """Station-local read-through mirror of order workbooks on the shared drive.
+
+    read() stats the remote file and serves the local copy when the remote
+    size and mtime still match the copy; otherwise the file is copied down
+    once. The copy's bytes are returned, read under the mirror lock, so no
+    caller ever holds a path another thread could evict or replace. Writers hand the bytes they just wrote to
+    store() so the mirror is refreshed without reading them back. Total
+    mirror size is bounded by evicting the least recently used copies; a
+    copy another reader still has open is skipped until the next eviction.
+
+    Copies live in a local directory (never on the share), indexed by a small
+    SQLite table keyed by the normalized remote path.
+    """
+
+    def __init__(self, mirror_dir: str = None, max_bytes: int = None, db_name: str = "mirror.db"):
+        self.mirror_dir = mirror_dir if mirror_dir else resource_path(os.path.join('cache', 'mirror'))
+        self.max_bytes = max_bytes if max_bytes else MIRROR_MAX_MB * 1024 * 1024
+        self.full_db_path = os.path.join(self.mirror_dir, db_name)
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.mirror_dir, exist_ok=True)
+        self.init_db()
+
+    @contextmanager
+    def get_connection(self):
+        conn = None
+        try:
+            conn = sqlite3.connect(self.full_db_path, timeout=5)
+            yield conn
+        except Exception as e:
+            logger.error(f"Order mirror connection error: {e}")
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                conn.close()
+
+    def init_db(self):
+        try:
+            with self.get_connection() as conn:
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS mirror (
+                    path TEXT PRIMARY KEY,
+                    local_name TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )""")
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize order mirror: {e}")
+            raise
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _local_path(self, key: str) -> str:
+        return os.path.join(self.mirror_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".xlsx")
+
+    @staticmethod
+    def remote_fingerprint(file_path: str):
+        st = os.stat(file_path)
+        return (st.st_size, st.st_mtime_ns)
+
+    def read(self, file_path: str):
+        """Return (data, (size, mtime_ns)) of file_path, read from an up-to-date local copy.
+
+        Raises OSError if the remote file cannot be read.
+        """
+        with self._lock:
+            local_path, fp = self._fetch(file_path)
+            with open(local_path, "rb") as fh:
+                return fh.read(), fp
+
+    def _fetch(self, file_path: str):
+        """Return (local_path, (size, mtime_ns)) of an up-to-date local copy; the caller holds self._lock."""
+        key = self._key(file_path)
+        local_path = self._local_path(key)
+        fp = self.remote_fingerprint(file_path)
+
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT size, mtime_ns FROM mirror WHERE path=?", (key,)).fetchone()
+            if row and tuple(row) == fp and os.path.exists(local_path):
+                conn.execute("UPDATE mirror SET last_access=? WHERE path=?", (time.time(), key))
+                conn.commit()
+                self.hits += 1
+                return local_path, fp
+        self.misses += 1
+
+        for _ in range(3):
+            fd, tmp_path = tempfile.mkstemp(prefix="mirror_", suffix=".tmp", dir=self.mirror_dir)
+            os.close(fd)
+            try:
+                shutil.copyfile(file_path, tmp_path)
+                # A writer replacing the file mid-copy changes the fingerprint; copy again
+                after = self.remote_fingerprint(file_path)
+                if after == fp:
+                    os.replace(tmp_path, local_path)
+                    break
+                fp = after
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        else:
+            raise OSError(f"{file_path} kept changing while being mirrored")
+
+        self._record(key, fp)
+        self._evict(keep=key)
+        return local_path, fp
+
+    def store(self, file_path: str, data: bytes):
+        """Refresh the mirror with bytes just written through to file_path."""
+        key = self._key(file_path)
+        try:
+            fp = self.remote_fingerprint(file_path)
+            with self._lock:
+                fd, tmp_path = tempfile.mkstemp(prefix="mirror_", suffix=".tmp", dir=self.mirror_dir)
+                try:
+                    with os.fdopen(fd, "wb") as fh:
+                        fh.write(data)
+                    os.replace(tmp_path, self._local_path(key))
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                self._record(key, fp)
+                self._evict(keep=key)
+        except Exception as e:
+            # The next read simply copies the file down again
+            logger.warning(f"Order mirror refresh failed for {file_path}: {e}")
+            self.invalidate(file_path)
+
+    def invalidate(self, file_path: str):
+        key = self._key(file_path)
+        try:
+            with self._lock:
+                with self.get_connection() as conn:
+                    conn.execute("DELETE FROM mirror WHERE path=?", (key,))
+                    conn.commit()
+                if os.path.exists(self._local_path(key)):
+                    os.remove(self._local_path(key))
+        except Exception as e:
+            logger.warning(f"Order mirror invalidation failed for {file_path}: {e}")
+
+    def _record(self, key: str, fp):
+        with self.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO mirror (path, local_name, size, mtime_ns, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, os.path.basename(self._local_path(key)), fp[0], fp[1], time.time()),
+            )
+            conn.commit()
+
+    def _evict(self, keep: str = None):
+        """Drop least recently used copies until the mirror fits in max_bytes."""
+        with self.get_connection() as conn:
+            rows = conn.execute("SELECT path, local_name, size FROM mirror ORDER BY last_access ASC").fetchall()
+            total = sum(r[2] for r in rows)
+            for path, local_name, size in rows:
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(os.path.join(self.mirror_dir, local_name))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    # Still open by a reader (Windows refuses to delete it); try again next time
+                    logger.debug(f"Cannot evict {path} from order mirror yet: {e}")
+                    continue
+                conn.execute("DELETE FROM mirror WHERE path=?", (path,))
+                total -= size
+                logger.debug(f"Evicted {path} from order mirror")
+            conn.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for this session."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
@@ -0,0 +1,123 @@
+import io, os, logging
+
+logger = logging.getLogger(__name__)
+
+
+def _trimmed(values):
+    """Row values without trailing empty cells, so differently padded rows compare equal."""
+    values = list(values or [])
+    while values and values[-1] in (None, ""):
+        values.pop()
+    return values
+
+
+class OrderSession:
+    """In-memory copy of one order workbook for the length of an operator session.
+
+    Holds the raw .xlsx bytes plus a compact row model ({excel_row: values})
+    decoded once on load. Writes are built from the cached bytes, so a save
+    costs one write to the share instead of a read and a write. Before each
+    write the file's size and mtime are compared with what we last saw; only
+    if another writer changed the file is it read again.
+
+    That fingerprint is also the version used for optimistic concurrency:
+    when it changed, the rows another writer touched are diffed against the
+    version we held. Our row updates are then applied on top of theirs, so
+    results for different serials merge. A row changed by both sides is a
+    real conflict and is reported (see take_conflicts()).
+    """
+
+    def __init__(self, xlsx_manager, file_path: str):
+        self.xlsx_manager = xlsx_manager
+        self.file_path = file_path
+        self.data = None
+        self.fingerprint = None
+        self.layout = None
+        self.rows = {}
+        # Number of times the file was re-read because someone else changed it
+        self.external_reloads = 0
+        # Rows changed by other writers that the UI has not picked up yet
+        self._external_rows = set()
+        self._conflicts = []
+
+    def _disk_fingerprint(self):
+        st = os.stat(self.file_path)
+        return (st.st_size, st.st_mtime_ns)
+
+    def load(self):
+        """(Re)read the workbook from disk and rebuild the row model."""
+        self.data, self.fingerprint = self.xlsx_manager.read_order_bytes(self.file_path)
+        self.layout, self.rows = self.xlsx_manager.read_order_rows(io.BytesIO(self.data))
+        logger.debug(f"Order session loaded {self.file_path}: {len(self.rows)} rows")
+
+    def is_stale(self) -> bool:
+        """True if the file on disk is no longer the version we hold."""
+        try:
+            return self._disk_fingerprint() != self.fingerprint
+        except OSError:
+            return True
+
+    def current_bytes(self, updates=None) -> bytes:
+        """Return the workbook bytes, re-reading only if the file changed underneath us.
+
+        updates are the row updates about to be written ({excel_row: {layout_key: value}});
+        any of those rows that another writer also changed since our version is
+        recorded as a conflict.
+        """
+        updates = updates or {}
+        if self.data is None:
+            self.load()
+        elif self.is_stale():
+            self.external_reloads += 1
+            base_rows = self.rows
+            self.load()
+            changed = {r for r in set(base_rows) | set(self.rows)
+                       if _trimmed(base_rows.get(r)) != _trimmed(self.rows.get(r))}
+            self._external_rows |= changed
+            logger.info(f"{self.file_path} was changed by another writer ({len(changed)} rows), merging")
+            for excel_row in sorted(changed & set(updates)):
+                theirs = self._result_of(self.rows.get(excel_row))
+                # The row as this write leaves it: our values on top of theirs
+                ours = {key: updates[excel_row].get(key, value) for key, value in theirs.items()}
+                conflict = {
+                    "row": excel_row,
+                    "serial": self.value(excel_row, "serial"),
+                    "ours": ours,
+                    "theirs": theirs,
+                }
+                self._conflicts.append(conflict)
+                logger.warning(f"Concurrent update of {conflict['serial']} in {self.file_path}: "
+                               f"other writer set {theirs}, overwriting with this station's {ours}")
+        return self.data
+
+    def value(self, excel_row: int, key: str):
+        """Value of a layout column (e.g. "serial") in the row model."""
+        values = self.rows.get(excel_row) or []
+        idx = self.layout.get(key) if self.layout else None
+        return values[idx] if idx is not None and idx < len(values) else None
+
+    def _result_of(self, values):
+        values = values or []
+        return {key: (values[idx] if idx is not None and idx < len(values) else None)
+                for key, idx in ((k, self.layout.get(k)) for k in ("operator", "pass_fail", "timestamp"))}
+
+    def take_external_rows(self) -> set:
+        """Return (and forget) the rows other writers changed since the last call."""
+        rows, self._external_rows = self._external_rows, set()
+        return rows
+
+    def take_conflicts(self) -> list:
+        """Return (and forget) same-row conflicts detected at save time."""
+        conflicts, self._conflicts = self._conflicts, []
+        return conflicts
+
+    def commit(self, data: bytes, cell_updates: dict):
+        """Record a successful write of data (cell_updates: {excel_row: {col_idx: value}})."""
+        self.data = data
+        self.fingerprint = self._disk_fingerprint()
+        for excel_row, values in cell_updates.items():
+            row = self.rows.setdefault(excel_row, [])
+            for col_idx, value in values.items():
+                if col_idx >= len(row):
+                    row.extend([None] * (col_idx + 1 - len(row)))
+                row[col_idx] = value
@@ -0,0 +1,204 @@
+import os, json, logging, tempfile, threading
+from datetime import datetime
+
+from managers.file_lock import LockTimeout
+from utils.logger import resource_path
+
+logger = logging.getLogger(__name__)
+
+# Durability policy, overridable per station through the environment
+try:
+    FLUSH_INTERVAL_MS = int(os.environ.get('LT_FLUSH_INTERVAL_MS', '3000'))
+except Exception:
+    FLUSH_INTERVAL_MS = 3000
+try:
+    MAX_UNFLUSHED = int(os.environ.get('LT_MAX_UNFLUSHED', '20'))
+except Exception:
+    MAX_UNFLUSHED = 20
+
+
+class ResultJournal:
+    """Write-behind buffer for operator results with a crash-safe local journal.
+
+    record() appends the result to an fsync'd JSON-lines file on the station's
+    local disk and returns immediately. Pending results are later written to
+    the order workbooks in one coalesced update per file by flush(). Entries
+    are removed from the journal only after their order file has been saved,
+    so anything left behind by a crash is written by replay() on next launch.
+
+    Applying an entry sets its cells to the journaled values, whatever the
+    row holds by then (last writer wins). During a session OrderSession
+    reports rows another station changed in the meantime as conflicts, but
+    entries replayed at startup have no session: a result another station
+    saved to the same row since the crash is overwritten without warning.
+
+    Entries whose order file no longer exists (deleted, or moved to cold
+    storage) can never be written; they are moved to a quarantine file next
+    to the journal, logged, and reported once through take_quarantined().
+    Every other failure keeps the entries for the next flush.
+    """
+
+    def __init__(self, xlsx_manager, journal_dir: str = None, journal_name: str = "pending_results.jsonl",
+                 max_unflushed: int = None,
+                 quarantine_name: str = "quarantined_results.jsonl"):
+        self.xlsx_manager = xlsx_manager
+        self.journal_dir = journal_dir if journal_dir else resource_path('cache')
+        self.journal_path = os.path.join(self.journal_dir, journal_name)
+        self.quarantine_path = os.path.join(self.journal_dir, quarantine_name)
+        self.max_unflushed = max_unflushed if max_unflushed else MAX_UNFLUSHED
+
+        self._lock = threading.RLock()
+        self._entries = []
+        self._failures = {}  # file -> consecutive failed flushes
+        self._quarantined = []  # (file, entries, reason) not yet reported, see take_quarantined()
+
+        os.makedirs(self.journal_dir, exist_ok=True)
+        self._entries, torn = self._load()
+        if torn:
+            # Drop the torn tail so new appends start on a clean line
+            self._rewrite()
+        if self._entries:
+            logger.warning(f"Result journal has {len(self._entries)} unflushed entries from a previous session")
+
+    def _load(self):
+        """Return (entries, torn) where torn is True if unreadable lines were skipped."""
+        entries, torn = [], False
+        if not os.path.exists(self.journal_path):
+            return entries, torn
+        with open(self.journal_path, "r", encoding="utf-8") as fh:
+            for line_no, line in enumerate(fh, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # A torn final line from a crash mid-append; everything before it is intact
+                    logger.warning(f"Skipping unreadable journal line {line_no} in {self.journal_path}")
+                    torn = True
+        return entries, torn
+
+    def record(self, file_path: str, excel_row: int, values: dict) -> bool:
+        """Durably journal one result. Returns True when a flush is due (max_unflushed reached)."""
+        entry = {
+            "file": file_path,
+            "row": excel_row,
+            "values": values,
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.journal_path, "a", encoding="utf-8") as fh:
+                fh.write(line)
+                fh.flush()
+                os.fsync(fh.fileno())
+            self._entries.append(entry)
+            return len(self._entries) >= self.max_unflushed
+
+    def pending_count(self, file_path: str = None) -> int:
+        with self._lock:
+            if file_path is None:
+                return len(self._entries)
+            return sum(1 for e in self._entries if e["file"] == file_path)
+
+    def pending_rows(self, file_path: str) -> dict:
+        """Return the coalesced {excel_row: values} not yet written to file_path."""
+        rows = {}
+        with self._lock:
+            for e in self._entries:
+                if e["file"] == file_path:
+                    rows.setdefault(e["row"], {}).update(e["values"])
+        return rows
+
+    def flush(self, file_path: str = None, timeout: float = None) -> int:
+        """Write pending results to their order files (one save per file), only file_path's when given.
+
+        Returns the number of journal entries flushed. Files that fail keep
+        their entries for the next attempt (see pending_count()) unless their
+        file is gone and they are quarantined; nothing is raised. timeout bounds the wait for each
+        file's lock (and for Excel to let go of it); a file that is merely
+        busy is retried on the next flush.
+        """
+        with self._lock:
+            files = []
+            for e in self._entries:
+                if (file_path is None or e["file"] == file_path) and e["file"] not in files:
+                    files.append(e["file"])
+
+            flushed = 0
+            changed = False
+            for path in files:
+                batch = [e for e in self._entries if e["file"] == path]
+                if self._target_gone(path):
+                    self._quarantine(path, batch, "order file no longer exists")
+                    changed = True
+                    continue
+                try:
+                    self.xlsx_manager.update_order_rows(path, self.pending_rows(path), timeout=timeout)
+                except LockTimeout as e:
+                    logger.info(f"{path} is busy, keeping {len(batch)} results for the next flush: {e}")
+                    continue
+                except Exception as e:
+                    failures = self._failures.get(path, 0) + 1
+                    self._failures[path] = failures
+                    logger.error(f"Failed to flush {len(batch)} results to {path} "
+                                 f"(attempt {failures}, will retry): {e}")
+                    continue
+                self._entries = [e for e in self._entries if e["file"] != path]
+                self._failures.pop(path, None)
+                flushed += len(batch)
+                changed = True
+                logger.info(f"Flushed {len(batch)} results to {path}")
+
+            if changed:
+                self._rewrite()
+            return flushed
+
+    @staticmethod
+    def _target_gone(path: str) -> bool:
+        # A missing file in a reachable folder was deleted or moved; an unreachable share is retried instead
+        return not os.path.exists(path) and os.path.isdir(os.path.dirname(path) or ".")
+
+    def _quarantine(self, path: str, batch: list, reason: str):
+        """Move path's entries out of the journal into the quarantine file (appended, fsync'd)."""
+        with open(self.quarantine_path, "a", encoding="utf-8") as fh:
+            for e in batch:
+                fh.write(json.dumps(dict(e, quarantined_at=datetime.now().isoformat(timespec="seconds"),
+                                         reason=reason)) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._entries = [e for e in self._entries if e["file"] != path]
+        self._failures.pop(path, None)
+        self._quarantined.append((path, len(batch), reason))
+        logger.error(f"Quarantined {len(batch)} results for {path} ({reason}) in {self.quarantine_path}")
+
+    def take_quarantined(self) -> list:
+        """Return [(file, entry_count, reason)] quarantined since the last call, and forget them."""
+        with self._lock:
+            taken, self._quarantined = self._quarantined, []
+            return taken
+
+    def replay(self, timeout: float = None) -> int:
+        """Flush entries left over from a previous session (call once at startup).
+
+        timeout bounds each file's lock wait (see flush()); whatever is left
+        is written by later flushes.
+        """
+        if not self.pending_count():
+            return 0
+        logger.info(f"Replaying {self.pending_count()} journaled results")
+        return self.flush(timeout=timeout)
+
+    def _rewrite(self):
+        """Atomically replace the journal with the entries still pending."""
+        fd, tmp_path = tempfile.mkstemp(prefix="journal_", suffix=".tmp", dir=self.journal_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                for e in self._entries:
+                    fh.write(json.dumps(e) + "\n")
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, self.journal_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
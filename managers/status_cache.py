@@ -0,0 +1,164 @@
+import os, json, sqlite3, hashlib, logging, threading
+from datetime import datetime
+from contextlib import contextmanager
+
+from utils.logger import resource_path
+
+logger = logging.getLogger(__name__)
+
+
+class StatusCache:
+    """Persistent cache of computed order-file results (counts, readiness).
+
+    Entries are keyed by the normalized file path and validated against a
+    fingerprint of (size, mtime, optional content hash). An unchanged file is
+    never parsed twice; a changed file simply misses and is recomputed.
+
+    The store is a small local SQLite file (never on the shared drive) so each
+    station keeps its own cache across sessions.
+    """
+
+    def __init__(self, cache_dir: str = None, db_name: str = "status_cache.db", hash_contents: bool = False):
+        self.cache_dir = cache_dir if cache_dir else resource_path('cache')
+        self.db_name = db_name
+        self.full_db_path = os.path.join(self.cache_dir, self.db_name)
+        # Hashing the whole file defeats most of the win on network shares, so it is opt-in
+        self.hash_contents = hash_contents
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.init_db()
+
+    @contextmanager
+    def get_connection(self):
+        conn = None
+        try:
+            conn = sqlite3.connect(self.full_db_path, timeout=5)
+            yield conn
+        except Exception as e:
+            logger.error(f"Status cache connection error: {e}")
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                conn.close()
+
+    def init_db(self):
+        try:
+            with self.get_connection() as conn:
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS status_cache (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL DEFAULT '',
+                    payload TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )""")
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to initialize status cache: {e}")
+            raise
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def fingerprint(self, file_path: str):
+        """Return (size, mtime_ns, content_hash) for the file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+
+        content_hash = ""
+        if self.hash_contents:
+            h = hashlib.sha1()
+            try:
+                with open(file_path, "rb") as fh:
+                    for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+                        h.update(chunk)
+                content_hash = h.hexdigest()
+            except OSError:
+                return None
+        return (st.st_size, st.st_mtime_ns, content_hash)
+
+    def get(self, file_path: str, field: str = None):
+        """Return the cached payload dict (or a single field of it) for an unchanged file.
+
+        Returns None on a miss: file missing, never cached, fingerprint changed,
+        or the requested field was not stored yet.
+        """
+        value = None
+        fp = self.fingerprint(file_path) if file_path else None
+        if fp is not None:
+            try:
+                with self.get_connection() as conn:
+                    row = conn.execute(
+                        "SELECT size, mtime_ns, content_hash, payload FROM status_cache WHERE path=?",
+                        (self._key(file_path),),
+                    ).fetchone()
+                if row and tuple(row[:3]) == fp:
+                    payload = json.loads(row[3])
+                    value = payload if field is None else payload.get(field)
+            except Exception as e:
+                logger.warning(f"Status cache lookup failed for {file_path}: {e}")
+                value = None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def put(self, file_path: str, **fields):
+        """Store computed fields for the file's current fingerprint.
+
+        Fields are merged into an existing entry when the fingerprint still
+        matches, so counts and readiness can be cached by different callers.
+        """
+        fp = self.fingerprint(file_path) if file_path else None
+        if fp is None:
+            return
+        key = self._key(file_path)
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT size, mtime_ns, content_hash, payload FROM status_cache WHERE path=?", (key,)
+                ).fetchone()
+                payload = json.loads(row[3]) if row and tuple(row[:3]) == fp else {}
+                payload.update(fields)
+                conn.execute(
+                    "INSERT OR REPLACE INTO status_cache (path, size, mtime_ns, content_hash, payload, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, fp[0], fp[1], fp[2], json.dumps(payload), datetime.now().isoformat(timespec="seconds")),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Status cache store failed for {file_path}: {e}")
+
+    def invalidate(self, file_path: str):
+        """Drop any cached entry for the file (called after every save)."""
+        if not file_path:
+            return
+        try:
+            with self.get_connection() as conn:
+                conn.execute("DELETE FROM status_cache WHERE path=?", (self._key(file_path),))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Status cache invalidation failed for {file_path}: {e}")
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for this session."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
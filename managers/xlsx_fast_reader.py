@@ -0,0 +1,234 @@
+import posixpath, zipfile, logging
+from xml.etree.ElementTree import iterparse, fromstring
+
+logger = logging.getLogger(__name__)
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_C = f"{{{NS_MAIN}}}c"
+_V = f"{{{NS_MAIN}}}v"
+_T = f"{{{NS_MAIN}}}t"
+_IS = f"{{{NS_MAIN}}}is"
+_ROW = f"{{{NS_MAIN}}}row"
+
+
+class FastReaderUnsupported(Exception):
+    """Raised when a workbook uses something the fast reader does not handle.
+
+    Callers are expected to fall back to openpyxl when they see this.
+    """
+
+
+_DIGITS = "0123456789"
+_column_cache = {}
+
+
+def column_index(ref: str) -> int:
+    """Return the 0-based column index of a cell reference such as 'G12'."""
+    letters = ref.rstrip(_DIGITS)
+    idx = _column_cache.get(letters)
+    if idx is not None:
+        return idx
+    idx = 0
+    for ch in letters.upper():
+        if not 'A' <= ch <= 'Z':
+            raise FastReaderUnsupported(f"Unrecognized cell reference: {ref!r}")
+        idx = idx * 26 + (ord(ch) - 64)
+    if idx == 0:
+        raise FastReaderUnsupported(f"Unrecognized cell reference: {ref!r}")
+    _column_cache[letters] = idx - 1
+    return idx - 1
+
+
+def column_letter(idx: int) -> str:
+    """Return the column letters for a 0-based column index (0 -> 'A')."""
+    letters = ""
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _text_of(elem) -> str:
+    """Concatenate all <t> runs below an <si>/<is> element (handles rich text)."""
+    return "".join(t.text or "" for t in elem.iter(_T))
+
+
+def resolve_active_sheet(zf: zipfile.ZipFile) -> str:
+    """Return the zip member name of the workbook's active worksheet."""
+    try:
+        workbook = fromstring(zf.read("xl/workbook.xml"))
+        rels = fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    except KeyError as e:
+        raise FastReaderUnsupported(f"Missing workbook part: {e}")
+
+    if workbook.tag != f"{{{NS_MAIN}}}workbook":
+        # e.g. strict OOXML namespace
+        raise FastReaderUnsupported(f"Unsupported workbook namespace: {workbook.tag}")
+
+    active_tab = 0
+    view = workbook.find(f"{{{NS_MAIN}}}bookViews/{{{NS_MAIN}}}workbookView")
+    if view is not None:
+        active_tab = int(view.get("activeTab", "0") or 0)
+
+    sheets = workbook.findall(f"{{{NS_MAIN}}}sheets/{{{NS_MAIN}}}sheet")
+    if not sheets or active_tab >= len(sheets):
+        raise FastReaderUnsupported("Active sheet not found")
+    rel_id = sheets[active_tab].get(f"{{{NS_REL}}}id")
+
+    target = None
+    for rel in rels.findall(f"{{{NS_PKG_REL}}}Relationship"):
+        if rel.get("Id") == rel_id:
+            if not rel.get("Type", "").endswith("/worksheet"):
+                raise FastReaderUnsupported("Active sheet is not a worksheet")
+            target = rel.get("Target")
+            break
+    if not target:
+        raise FastReaderUnsupported("Active sheet relationship not found")
+
+    # Targets are either package-absolute (/xl/...) or relative to xl/
+    if target.startswith("/"):
+        member = target.lstrip("/")
+    else:
+        member = posixpath.normpath(posixpath.join("xl", target))
+    if member not in zf.NameToInfo:
+        raise FastReaderUnsupported(f"Sheet part missing: {member}")
+    return member
+
+
+def read_shared_strings(zf: zipfile.ZipFile) -> list:
+    """Return the shared-strings table as a list (empty if the part is absent)."""
+    if "xl/sharedStrings.xml" not in zf.NameToInfo:
+        return []
+    strings = []
+    with zf.open("xl/sharedStrings.xml") as fh:
+        for _, elem in iterparse(fh):
+            if elem.tag == f"{{{NS_MAIN}}}si":
+                strings.append(_text_of(elem))
+                elem.clear()
+    return strings
+
+
+def cell_value(c, shared_strings):
+    """Decode one <c> element. shared_strings is a zero-argument callable returning the table."""
+    t = c.get("t")
+    if t == "inlineStr":
+        is_elem = c.find(_IS)
+        return _text_of(is_elem) if is_elem is not None else None
+
+    raw = c.findtext(_V)
+    if raw is None:
+        return None
+    if t == "s":
+        try:
+            return shared_strings()[int(raw)]
+        except (IndexError, ValueError):
+            raise FastReaderUnsupported(f"Bad shared string index {raw!r} in {c.get('r')}")
+    if t in ("str", "e", "d"):
+        return raw
+    if t == "b":
+        return raw == "1"
+    if t in (None, "n"):
+        try:
+            return int(raw)
+        except ValueError:
+            return float(raw)
+    raise FastReaderUnsupported(f"Unsupported cell type {t!r}")
+
+
+def decode_row(row_elem, shared_strings, columns=None, width=0) -> list:
+    """Decode a <row> element into a list of values (see FastSheetReader.iter_rows)."""
+    values = [None] * width if width else []
+    next_col = 0
+    for c in row_elem.iter(_C):
+        ref = c.get("r")
+        col = column_index(ref) if ref else next_col
+        next_col = col + 1
+        if columns is not None and col not in columns:
+            continue
+        if col >= len(values):
+            values.extend([None] * (col + 1 - len(values)))
+        values[col] = cell_value(c, shared_strings)
+    return values
+
+
+class FastSheetReader:
+    """Stream selected columns of an .xlsx worksheet straight from the zip.
+
+    Unlike openpyxl's read-only mode no cell objects are created and styles are
+    never resolved: each row is parsed with iterparse and only the requested
+    columns are decoded. Values come back as str/int/float/bool. Numbers are
+    not converted to dates (order files store timestamps as text).
+
+    Anything unexpected raises FastReaderUnsupported so the caller can fall back
+    to openpyxl.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        try:
+            self.zf = zipfile.ZipFile(file_path)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise FastReaderUnsupported(f"Not a readable xlsx container: {e}")
+        try:
+            self.sheet_member = resolve_active_sheet(self.zf)
+        except Exception:
+            self.zf.close()
+            raise
+        self._shared_strings = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.zf.close()
+
+    @property
+    def shared_strings(self) -> list:
+        if self._shared_strings is None:
+            self._shared_strings = read_shared_strings(self.zf)
+        return self._shared_strings
+
+    def _decode_row(self, row_elem, columns, width):
+        return decode_row(row_elem, lambda: self.shared_strings, columns, width)
+
+    def iter_rows(self, columns=None, min_row: int = 1, max_row: int = None):
+        """Yield (row_number, values) for each <row> in the sheet.
+
+        columns: optional iterable of 0-based column indices to decode; other
+        cells are skipped and left as None. Rows are lists at least as wide as
+        the highest requested column.
+        """
+        columns = set(columns) if columns is not None else None
+        width = (max(columns) + 1) if columns else 0
+        next_row = 1
+
+        with self.zf.open(self.sheet_member) as fh:
+            # Only "end" events: every row is complete when we see it, and
+            # clearing it drops its cells so memory stays flat on large orders.
+            for _, elem in iterparse(fh):
+                if elem.tag != _ROW:
+                    continue
+
+                r = elem.get("r")
+                row_number = int(r) if r else next_row
+                next_row = row_number + 1
+
+                if row_number >= min_row:
+                    yield row_number, self._decode_row(elem, columns, width)
+                elem.clear()
+
+                if max_row is not None and row_number >= max_row:
+                    return
+
+    def header(self) -> tuple:
+        """Return the values of the first row (the order file header)."""
+        for row_number, values in self.iter_rows(max_row=1):
+            return tuple(values) if row_number == 1 else ()
+        return ()
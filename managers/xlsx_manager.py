@@ -1,14 +1,91 @@
-import os, logging
+import io, os, zlib, zipfile, logging, tempfile
+from contextlib import contextmanager
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
 from datetime import datetime
 from managers.db_manager import DatabaseManager
+from managers.xlsx_fast_reader import FastSheetReader, FastReaderUnsupported, resolve_active_sheet, read_shared_strings
+from managers.xlsx_row_patcher import patch_workbook_rows, decode_sheet_rows, RowPatchUnsupported
+from managers.xlsx_summary import read_summary, read_workbook_summary, summary_members, sheet_crc
+from managers.file_lock import FileLockManager
+from managers.order_session import OrderSession
 from openpyxl import load_workbook
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = "%b %d, %Y %I:%M %p"
+
+# Column layout written by create_order_file (1 header row, one serial per row)
+ORDER_HEADERS = [
+    "Created By (admin)",
+    "Created At",
+    "Operator",
+    "Company ID",
+    "Board ID",
+    "Serial Number",
+    "pass/fail",
+    "pass/fail timestamp",
+    "Failure Explanation (only if failed)",
+    "Repair Explanation (only if fixed)",
+]
+
+# 0-based indices of ORDER_HEADERS, used when a file has no usable header row
+DEFAULT_LAYOUT = {
+    "created_by": 0,
+    "created_at": 1,
+    "operator": 2,
+    "company": 3,
+    "board": 4,
+    "serial": 5,
+    "pass_fail": 6,
+    "timestamp": 7,
+    "failure": 8,
+    "fix": 9,
+}
+
+# Accepted (lower-cased) header names for each logical column
+HEADER_ALIASES = {
+    "created_by": ("created by (admin)", "created by"),
+    "created_at": ("created at",),
+    "operator": ("operator", "user id"),
+    "company": ("company id", "company"),
+    "board": ("board id", "board"),
+    "serial": ("serial number", "serial", "sn"),
+    "pass_fail": ("pass/fail", "passfail", "pass_fail"),
+    "timestamp": ("pass/fail timestamp", "pass_fail timestamp", "timestamp"),
+    "failure": ("failure explanation (only if failed)", "if failed explanation", "failure explanation"),
+    "fix": ("repair explanation (only if fixed)", "if fixed explanation", "fix explanation"),
+}
+
+# Columns the status scanner needs decoded
+SCAN_KEYS = ("serial", "pass_fail", "timestamp")
+
+# Client deliverables are written to this folder under the company's client path
+DELIVERABLE_DIR = "Deliverables"
+
+# Column widths for deliverables (streamed, so they cannot be auto-sized after the fact)
+DELIVERABLE_WIDTHS = {5: 22, 8: 40, 9: 40}
+
+PASS_VALUES = {'pass', 'true', '1', 'yes'}
+FAIL_VALUES = {'fail', 'false', '0', 'no'}
+
 class XLSXManager:
-    def __init__(self, db: DatabaseManager):
+    def __init__(self, db: DatabaseManager, status_cache=None, use_fast_reader: bool = True, lock_manager=None,
+                 mirror=None):
         self.db = db
+        # Optional OrderMirror; when set, order files are read from a station-local copy
+        self.mirror = mirror
+        # Every write to an order file happens under its advisory lock (shared with other stations)
+        self.lock_manager = lock_manager if lock_manager is not None else FileLockManager()
+        # Open OrderSessions by normalized path; writes to these files reuse the in-memory copy
+        self._sessions = {}
+        # order_id by file path, for writing serial results through to the DB
+        self._order_ids = {}
+        # Optional StatusCache; when None every status/readiness check re-reads the file
+        self.status_cache = status_cache
+        # Read order sheets straight from the zip XML, falling back to openpyxl when unsupported
+        self.use_fast_reader = use_fast_reader
 
     #TODO: update parameters to match user input from UI when implemented
     def _generate_serial_numbers(self, prefix=None, start=1, count=1000):
@@ -71,19 +148,7 @@ class XLSXManager:
         ws.title = f"{order_number} Tracking"
 
         # 5. Write headers
-        headers = [
-                "Created By (admin)",
-                "Created At",
-                "Operator",
-                "Company ID", 
-                "Board ID", 
-                "Serial Number", 
-                "pass/fail", 
-                "pass/fail timestamp", 
-                "Failure Explanation (only if failed)", 
-                "Repair Explanation (only if fixed)"
-            ]
-        ws.append(headers)
+        ws.append(ORDER_HEADERS)
 
         # 6. styling
         for col in ws[1]:
@@ -95,7 +160,7 @@ class XLSXManager:
 
         # 8. meta data
         status_value = "Pending"
-        created_at = datetime.now().strftime("%b %d, %Y %I:%M %p")
+        created_at = datetime.now().strftime(TIMESTAMP_FORMAT)
 
         # 9. write serial rows
         for sn in serials:
@@ -128,97 +193,637 @@ class XLSXManager:
             # Set minimum width and add padding
             ws.column_dimensions[col_letter].width = max(max_length + 2, 10)
 
-        # 12. Save file
-        wb.save(file_path)
+        # 12. Save file (with the progress summary status checks read instead of scanning rows)
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        data = self._with_summary(buffer.getvalue(), updated_by=username)
+        with self.lock_manager.locked(file_path):
+            with open(file_path, "wb") as fh:
+                fh.write(data)
 
-        # 13. Register order in DB
-        self.db.add_order(order_number, company_id, board_id, file_path, created_by)
+        # 13. Register order in DB, with its serials for building deliverables
+        order_id = self.db.add_order(order_number, company_id, board_id, file_path, created_by)
+        self._order_ids[self._session_key(file_path)] = order_id
+        try:
+            self.db.save_serial_results(order_id, [
+                (sn, row, username, status_value, None, None, None)
+                for row, sn in enumerate(serials, start=2)
+            ], sheet_crc=self._sheet_crc(io.BytesIO(data)), counters=read_workbook_summary(io.BytesIO(data)))
+        except Exception as e:
+            # export_deliverable() re-reads the workbook when the DB is behind
+            logger.warning(f"Could not record serials of order {order_number}: {e}")
 
         return file_path, len(serials)
 
+    def invalidate_status(self, file_path: str):
+        """Forget cached status/readiness for a file after it has been written."""
+        if self.status_cache is not None:
+            self.status_cache.invalidate(file_path)
+
+    def update_order_rows(self, file_path: str, updates: dict, timeout: float = None):
+        """Write operator results into existing rows of an order workbook.
+
+        updates: {excel_row: {layout_key: value}} using the keys of DEFAULT_LAYOUT
+        (e.g. "operator", "pass_fail", "timestamp"). Columns are resolved from the
+        header row like the scanner does.
+
+        Only the touched <row> elements of the sheet XML are rewritten and all
+        other zip members are copied as-is, so a save no longer costs a full
+        openpyxl load/save of the order. Workbooks the patcher cannot handle fall
+        back to openpyxl. Either way the result goes to a temp file in the same
+        directory which then atomically replaces the original, all while holding
+        the order file's lock. If the file has an open session its in-memory copy
+        is used instead of reading the file again.
+        """
+        if not updates:
+            return
+
+        # Read-modify-write of the whole file, so the header read happens under the lock too
+        with self.lock_manager.locked(file_path, timeout=timeout):
+            self._write_order_rows(file_path, updates, timeout)
+
+    def _write_order_rows(self, file_path: str, updates: dict, timeout: float = None):
+        session = self.get_session(file_path)
+        if session is not None:
+            # Merges in other writers' rows if the file changed since the version we hold
+            data = session.current_bytes(updates)
+        else:
+            data, _ = self.read_order_bytes(file_path)
+
+        layout = dict(DEFAULT_LAYOUT)
+        try:
+            with FastSheetReader(io.BytesIO(data)) as reader:
+                resolved = self._resolve_header_layout(reader.header())
+            layout.update({k: v for k, v in resolved.items() if v is not None})
+        except FastReaderUnsupported as e:
+            logger.info(f"Could not read header of {file_path}, assuming default layout: {e}")
+
+        cell_updates = {
+            excel_row: {layout[key]: value for key, value in values.items()}
+            for excel_row, values in updates.items()
+        }
+
+        updated_by = next((v.get("operator") for v in updates.values() if v.get("operator")), None)
+        summary_written = []
+        written_rows = {}
+
+        def summary_parts(zin, sheet_member, old_sheet, new_sheet):
+            shared = []
+
+            def shared_strings():
+                if not shared:
+                    shared.append(read_shared_strings(zin))
+                return shared[0]
+
+            try:
+                before = decode_sheet_rows(old_sheet, cell_updates.keys(), shared_strings)
+                after = decode_sheet_rows(new_sheet, cell_updates.keys(), shared_strings)
+            except (RowPatchUnsupported, FastReaderUnsupported) as e:
+                logger.info(f"Cannot decode patched rows of {file_path}: {e}")
+                return {}
+            written_rows.update(after)
+
+            summary = self._updated_summary(read_summary(zin, sheet_member), before, after, layout,
+                                            updated_by, new_sheet)
+            if summary is None:
+                return {}
+            summary_written.append(True)
+            return summary_members(zin, summary)
+
+        out = io.BytesIO()
+        try:
+            patch_workbook_rows(io.BytesIO(data), out, cell_updates, extra_members=summary_parts)
+        except RowPatchUnsupported as e:
+            logger.info(f"In-place row patch unsupported for {file_path}, using openpyxl: {e}")
+            wb = load_workbook(io.BytesIO(data))
+            ws = wb.active
+            for excel_row, values in cell_updates.items():
+                for col_idx, value in values.items():
+                    ws.cell(row=excel_row, column=col_idx + 1).value = value
+                written_rows[excel_row] = [cell.value for cell in ws[excel_row]]
+            out = io.BytesIO()
+            wb.save(out)
+        new_data = out.getvalue()
+        if not summary_written:
+            # No valid summary to update incrementally (legacy file, edited in Excel): rebuild it
+            new_data = self._with_summary(new_data, updated_by=updated_by)
+
+        temp_dir = os.path.dirname(file_path) or None
+        fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=".xlsx", dir=temp_dir)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(new_data)
+            # Excel or a virus scanner may hold the file open; back off until it lets go
+            self.lock_manager.retry_io(lambda: os.replace(tmp_path, file_path), file_path, timeout=timeout)
+            if session is not None:
+                session.commit(new_data, cell_updates)
+            if self.mirror is not None:
+                self.mirror.store(file_path, new_data)
+            self.invalidate_status(file_path)
+            self._record_results(file_path, layout, written_rows,
+                                 self._sheet_crc(io.BytesIO(new_data)), self._sheet_crc(io.BytesIO(data)),
+                                 read_workbook_summary(io.BytesIO(new_data)))
+        finally:
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except Exception:
+                pass
+
+    def _with_summary(self, data: bytes, updated_by: str = None) -> bytes:
+        """Return data with a freshly computed progress summary (full scan of the rows)."""
+        try:
+            summary = self._tally_source(io.BytesIO(data), "<workbook>")
+            summary.update(updated_at=datetime.now().strftime(TIMESTAMP_FORMAT), updated_by=updated_by)
+
+            def summary_parts(zin, sheet_member, old_sheet, new_sheet):
+                return summary_members(zin, dict(summary, sheet_crc=format(zlib.crc32(new_sheet), "08x")))
+
+            out = io.BytesIO()
+            patch_workbook_rows(io.BytesIO(data), out, {}, extra_members=summary_parts)
+            return out.getvalue()
+        except Exception as e:
+            # Status checks fall back to scanning rows when there is no summary
+            logger.warning(f"Could not write workbook summary: {e}")
+            return data
+
+    def _updated_summary(self, summary, before, after, layout, updated_by, new_sheet):
+        """Apply the change from the before to the after row values to the stored summary.
+
+        Returns None if there is no valid stored summary to update.
+        """
+        if summary is None:
+            return None
+
+        fail_rows = set(summary["fail_rows"])
+        for excel_row in after:
+            for values, sign in ((before[excel_row], -1), (after[excel_row], 1)):
+                state = self._row_state(layout, values)
+                if state is None:
+                    continue
+                category, has_ts, ts_val = state
+                summary["total_count"] += sign
+                summary[f"{category}_count"] += sign
+                if category == "pass" and has_ts:
+                    summary["timestamped_passes"] += sign
+                if category == "fail":
+                    (fail_rows.add if sign > 0 else fail_rows.discard)(excel_row)
+                if sign > 0 and has_ts:
+                    parsed = self._parse_timestamp(ts_val)
+                    last = self._parse_timestamp(summary["last_timestamp"])
+                    if parsed is not None and (last is None or parsed >= last):
+                        summary["last_timestamp"] = parsed.strftime(TIMESTAMP_FORMAT)
+
+        summary["fail_rows"] = sorted(fail_rows)
+        summary["updated_at"] = datetime.now().strftime(TIMESTAMP_FORMAT)
+        summary["updated_by"] = updated_by or summary.get("updated_by")
+        summary["sheet_crc"] = format(zlib.crc32(new_sheet), "08x")
+        return summary
+
+    def _order_id(self, file_path: str):
+        key = self._session_key(file_path)
+        if key not in self._order_ids:
+            order_id = self.db.get_order_id_by_file(file_path)
+            if order_id is None:
+                return None
+            self._order_ids[key] = order_id
+        return self._order_ids[key]
+
+    def _result_record(self, layout: dict, excel_row: int, values):
+        """Row values as a serial_results tuple, or None for rows without a serial."""
+        def get(key):
+            idx = layout.get(key)
+            value = values[idx] if idx is not None and idx < len(values) else None
+            if isinstance(value, datetime):
+                return value.strftime(TIMESTAMP_FORMAT)
+            return value
+
+        serial = get("serial")
+        if serial in (None, ""):
+            return None
+        return (str(serial), excel_row, get("operator"), get("pass_fail"), get("timestamp"),
+                get("failure"), get("fix"))
+
+    def _record_results(self, file_path: str, layout: dict, rows: dict, new_crc=None, old_crc=None,
+                        counters=None):
+        """Write saved rows (and the file's new counters) through to the DB.
+
+        new_crc/old_crc are the sheet CRCs after and before the save; the DB is
+        only marked current with new_crc if it was current with old_crc.
+        """
+        if not rows:
+            return
+        try:
+            order_id = self._order_id(file_path)
+            if order_id is None:
+                return
+            records = [self._result_record(layout, r, values) for r, values in rows.items()]
+            self.db.save_serial_results(order_id, [rec for rec in records if rec is not None],
+                                        sheet_crc=new_crc, previous_crc=old_crc if new_crc else None,
+                                        counters=counters)
+        except Exception as e:
+            # The file is the operator's record; export_deliverable() resyncs a DB that fell behind
+            logger.warning(f"Could not record serial results for {file_path}: {e}")
+
+    def parse_order_results(self, source):
+        """Decode an order workbook into (serial_results records, summary counters).
+
+        source is a path or a binary file object. Records have the
+        save_serial_results() tuple shape; counters the workbook summary shape.
+        """
+        layout, rows = self.read_order_rows(source)
+        records = [self._result_record(layout, r, values) for r, values in rows.items()]
+        return [rec for rec in records if rec is not None], self._tally_rows(layout, rows.items())
+
+    def sync_serial_results(self, order_id: int, file_path: str) -> int:
+        """Replace the DB serial results of an order with the rows of its workbook."""
+        data, _ = self.read_order_bytes(file_path)
+        records, counters = self.parse_order_results(io.BytesIO(data))
+        self.db.save_serial_results(order_id, records, replace_all=True, sheet_crc=self._sheet_crc(io.BytesIO(data)),
+                                    counters=counters)
+        logger.info(f"Synced {len(records)} serial results of order {order_id} from {file_path}")
+        return len(records)
+
+    @staticmethod
+    def _sheet_crc(source):
+        """CRC-32 of the active sheet part of a workbook (from the zip directory), or None."""
+        try:
+            with zipfile.ZipFile(source) as zf:
+                return sheet_crc(zf, resolve_active_sheet(zf))
+        except (zipfile.BadZipFile, FastReaderUnsupported, KeyError, OSError) as e:
+            logger.debug(f"Could not read sheet CRC: {e}")
+            return None
+
+    def _results_behind(self, order_id: int, file_path: str) -> bool:
+        """True unless the DB results were last brought up to date with the workbook's current sheet.
+
+        Any edit to the sheet changes its CRC, including hand edits in Excel
+        that leave the pass/fail counts as they were.
+        """
+        if not file_path or not os.path.exists(file_path):
+            return False
+        current = self._sheet_crc(file_path)
+        if current is None:
+            return False
+        return self.db.get_results_sheet_crc(order_id) != current
+
+    def refresh_serial_results(self, order_id: int, file_path: str) -> bool:
+        """Resync an order's DB serial results from its workbook if they are behind. Returns True if resynced."""
+        if not self._results_behind(order_id, file_path):
+            return False
+        logger.info(f"Serial results of order {order_id} are behind {file_path}, resyncing")
+        self.sync_serial_results(order_id, file_path)
+        return True
+
+    def export_deliverable(self, order_id: int, dest_path: str = None):
+        """Build the client workbook for an order from the DB.
+
+        Rows are streamed from serial_results into a write-only workbook with
+        the create_order_file column layout; the operator's working file is
+        only read if the DB turns out to be behind it. The deliverable goes to
+        <client_path>/Deliverables/<order>.xlsx unless dest_path is given and
+        is written through a temp file, so readers never see a partial file.
+
+        Returns (dest_path, serial_count).
+        """
+        details = self.db.get_order_details(order_id)
+        if not details:
+            raise ValueError(f"Order {order_id} not found")
+        order_number, company_id, board_name, file_path, created_at, created_by, client_path = details
+
+        self.refresh_serial_results(order_id, file_path)
+
+        if dest_path is None:
+            dest_path = os.path.join(client_path, DELIVERABLE_DIR, f"{order_number}.xlsx")
+        dest_dir = os.path.dirname(dest_path) or "."
+        os.makedirs(dest_dir, exist_ok=True)
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(f"{order_number} Tracking")
+        for col_idx, header in enumerate(ORDER_HEADERS):
+            ws.column_dimensions[get_column_letter(col_idx + 1)].width = DELIVERABLE_WIDTHS.get(col_idx, max(len(header) + 2, 10))
+
+        header_cells = []
+        for header in ORDER_HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        count = 0
+        for serial, _row, operator, pass_fail, timestamp, failure, fix in self.db.iter_serial_results(order_id):
+            explanations = []
+            for text in (failure, fix):
+                cell = WriteOnlyCell(ws, value=text)
+                if text:
+                    cell.alignment = Alignment(wrap_text=True)
+                explanations.append(cell)
+            ws.append([created_by, created_at, operator, company_id, board_name, serial, pass_fail,
+                       timestamp, *explanations])
+            count += 1
+
+        fd, tmp_path = tempfile.mkstemp(prefix="lt_tmp_", suffix=".xlsx", dir=dest_dir)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                wb.save(fh)
+            self.lock_manager.retry_io(lambda: os.replace(tmp_path, dest_path), dest_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        logger.info(f"Exported deliverable for order {order_number} ({count} serials) to {dest_path}")
+        return dest_path, count
+
+    def read_order_bytes(self, file_path: str):
+        """Return (data, (size, mtime_ns)) for an order file, via the local mirror when configured."""
+        if self.mirror is not None:
+            try:
+                return self.mirror.read(file_path)
+            except Exception as e:
+                logger.warning(f"Order mirror unavailable for {file_path}, reading the share: {e}")
+
+        for _ in range(3):
+            st = os.stat(file_path)
+            before = (st.st_size, st.st_mtime_ns)
+            with open(file_path, "rb") as fh:
+                data = fh.read()
+            # A writer replacing the file mid-read changes the fingerprint; read again
+            st = os.stat(file_path)
+            if (st.st_size, st.st_mtime_ns) == before:
+                break
+        return data, before
+
+    def _read_source(self, file_path: str):
+        """Source to scan file_path from: the mirror copy's bytes when mirrored, else the share's path.
+
+        Bytes, not the copy's path: concurrent scans may evict or replace the copy between opens.
+        """
+        if self.mirror is None:
+            return file_path
+        try:
+            return io.BytesIO(self.mirror.read(file_path)[0])
+        except Exception as e:
+            logger.warning(f"Order mirror unavailable for {file_path}, reading the share: {e}")
+            return file_path
+
+    def open_session(self, file_path: str) -> OrderSession:
+        """Load an order into memory for an operator session (see OrderSession)."""
+        session = OrderSession(self, file_path)
+        session.load()
+        self._sessions[self._session_key(file_path)] = session
+        return session
+
+    def get_session(self, file_path: str):
+        return self._sessions.get(self._session_key(file_path))
+
+    def close_session(self, file_path: str):
+        self._sessions.pop(self._session_key(file_path), None)
+
+    @staticmethod
+    def _session_key(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def read_order_rows(self, source):
+        """Decode every data row of an order workbook.
+
+        source is a path or a binary file object. Returns (layout, rows) with
+        rows as {excel_row: list of values}.
+        """
+        if self.use_fast_reader:
+            try:
+                with self._open_order_rows(source, fast=True) as (layout, rows):
+                    return layout, {excel_row: values for excel_row, values in rows}
+            except FastReaderUnsupported as e:
+                logger.info(f"Fast reader unsupported for order rows, using openpyxl: {e}")
+                if hasattr(source, "seek"):
+                    source.seek(0)
+
+        with self._open_order_rows(source) as (layout, rows):
+            return layout, {excel_row: list(values) for excel_row, values in rows}
+
     def is_order_ready_for_confirmation(self, file_path: str) -> bool:
         """Return True if every data row in the XLSX file has a passing pass/fail value
         and a non-empty pass/fail timestamp. This indicates the order is ready for admin confirmation.
 
-        Heuristics:
-        - Expects the header columns created by create_order_file. Finds the "pass/fail" and "pass/fail timestamp"
-          columns by name.
-        - A cell is considered a passing value if its string lower() is in ('pass','true','1','yes').
-        - All data rows must match the above and have a non-empty timestamp.
+        Uses the shared single-pass scanner (see scan_order_file), so it always agrees
+        with the dashboard counts.
+        """
+        return self.scan_order_file(file_path)["ready"]
+
+    def _resolve_header_layout(self, headers) -> dict:
+        """Map logical column keys to 0-based indices from a header row.
+
+        Headers are matched by normalized name first, then by partial match.
+        Anything still unresolved falls back to the create_order_file layout so
+        legacy files without recognizable headers keep working.
+        """
+        header_map = {}
+        for idx, h in enumerate(headers):
+            if h is None:
+                continue
+            name = str(h).strip().lower()
+            if name and name not in header_map:
+                header_map[name] = idx
+
+        layout = {}
+        for key, names in HEADER_ALIASES.items():
+            layout[key] = next((header_map[n] for n in names if n in header_map), None)
+
+        # Partial-match fallbacks for hand-edited headers
+        if layout["pass_fail"] is None:
+            layout["pass_fail"] = next(
+                (i for k, i in header_map.items() if 'pass' in k and 'timestamp' not in k), None)
+        if layout["timestamp"] is None:
+            layout["timestamp"] = next((i for k, i in header_map.items() if 'timestamp' in k), None)
+        if layout["serial"] is None:
+            layout["serial"] = next((i for k, i in header_map.items() if 'serial' in k), None)
+
+        # No recognizable pass/fail header: assume the create_order_file layout
+        if layout["pass_fail"] is None:
+            for key, idx in DEFAULT_LAYOUT.items():
+                if layout.get(key) is None:
+                    layout[key] = idx
+        return layout
+
+    @staticmethod
+    def _parse_timestamp(value):
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.strptime(str(value).strip(), TIMESTAMP_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    @contextmanager
+    def _open_order_rows(self, file_path: str, keys=None, fast: bool = False):
+        """Open an order workbook for streaming.
+
+        Yields (layout, rows) where layout maps column keys to indices (see
+        _resolve_header_layout) and rows is an iterator of (excel_row, values).
+
+        With fast=True the raw-XML reader is used and, when keys are given, only
+        those columns are decoded. It raises FastReaderUnsupported (possibly
+        mid-iteration) for workbooks it cannot handle; callers then retry with
+        fast=False, which goes through openpyxl's read-only mode.
+        """
+        if fast:
+            with FastSheetReader(file_path) as reader:
+                layout = self._resolve_header_layout(reader.header())
+                columns = None
+                if keys is not None:
+                    columns = {layout[k] for k in keys if layout.get(k) is not None}
+                yield layout, reader.iter_rows(columns=columns, min_row=2)
+            return
+
+        wb = load_workbook(filename=file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            layout = self._resolve_header_layout(next(rows, None) or ())
+            yield layout, ((row_idx, row) for row_idx, row in enumerate(rows, start=2))
+        finally:
+            wb.close()
+
+    def scan_order_file(self, file_path: str) -> dict:
+        """Scan an order workbook once and return everything callers need.
+
+        Returns a dict with keys:
+            status          "Pending" | "Active" | "Complete" | "Unknown" (missing file) | "Error"
+            pass_count, fail_count, pending_count, total_count
+            ready           True when every row passes and has a timestamp
+            first_fail_row  Excel row number of the first failed serial (or None)
+            last_timestamp  latest pass/fail timestamp seen (or None)
+
+        Results for unchanged files come from the status cache when one is configured.
         """
         if not file_path or not os.path.exists(file_path):
-            return False
+            return self._scan_result("Unknown")
+
+        if self.status_cache is not None:
+            cached = self.status_cache.get(file_path, "scan")
+            if cached is not None:
+                return cached
 
         try:
-            wb = load_workbook(filename=file_path, read_only=True, data_only=True)
-            ws = wb.active
+            result = self._scan_rows(file_path)
+        except Exception as e:
+            logger.error(f"Failed to scan order file {file_path}: {e}")
+            return self._scan_result("Error")
+
+        if self.status_cache is not None:
+            self.status_cache.put(file_path, scan=result)
+        return result
+
+    @staticmethod
+    def _scan_result(status, pass_count=0, fail_count=0, pending_count=0, total_count=0,
+                     ready=False, first_fail_row=None, last_timestamp=None) -> dict:
+        return {
+            "status": status,
+            "pass_count": pass_count,
+            "fail_count": fail_count,
+            "pending_count": pending_count,
+            "total_count": total_count,
+            "ready": ready,
+            "first_fail_row": first_fail_row,
+            "last_timestamp": last_timestamp,
+        }
+
+    def _scan_rows(self, file_path: str) -> dict:
+        source = self._read_source(file_path)
+        # The summary written with every save answers without touching the rows
+        summary = read_workbook_summary(source)
+        if summary is None:
+            summary = self._tally_source(source, file_path)
+        else:
+            logger.debug(f"Using workbook summary for {file_path}")
+        return self._scan_from_summary(file_path, summary)
+
+    def _tally_source(self, source, file_path: str) -> dict:
+        if self.use_fast_reader:
+            try:
+                with self._open_order_rows(source, keys=SCAN_KEYS, fast=True) as (layout, rows):
+                    return self._tally_rows(layout, rows)
+            except FastReaderUnsupported as e:
+                logger.info(f"Fast reader unsupported for {file_path}, using openpyxl: {e}")
+                if hasattr(source, "seek"):
+                    source.seek(0)
+
+        with self._open_order_rows(source) as (layout, rows):
+            return self._tally_rows(layout, rows)
+
+    def _row_state(self, layout: dict, row):
+        """Classify one data row: None if it is not counted, else (category, has_timestamp, timestamp).
+
+        category is "pass", "fail" or "pending".
+        """
+        if not row or all(v is None for v in row):
+            return None
+        sn_idx, pf_idx, ts_idx = layout["serial"], layout["pass_fail"], layout["timestamp"]
+        if sn_idx is not None and (sn_idx >= len(row) or row[sn_idx] in (None, "")):
+            return None
+
+        pf_val = row[pf_idx] if pf_idx < len(row) else None
+        pf_str = str(pf_val).strip().lower() if pf_val is not None else ""
+        ts_val = row[ts_idx] if ts_idx is not None and ts_idx < len(row) else None
+        has_ts = not (ts_val is None or (isinstance(ts_val, str) and ts_val.strip() == ""))
+
+        if pf_str in PASS_VALUES:
+            category = "pass"
+        elif pf_str in FAIL_VALUES:
+            category = "fail"
+        else:
+            category = "pending"
+        return category, has_ts, ts_val
+
+    def _tally_rows(self, layout: dict, rows) -> dict:
+        """Count rows into a summary dict (the same shape as the stored workbook summary)."""
+        counts = {"pass": 0, "fail": 0, "pending": 0}
+        timestamped_passes = 0
+        fail_rows = []
+        last_ts, last_ts_raw = None, None
+
+        for excel_row, row in rows:
+            state = self._row_state(layout, row)
+            if state is None:
+                continue
+            category, has_ts, ts_val = state
+            counts[category] += 1
+            if category == "pass" and has_ts:
+                timestamped_passes += 1
+            elif category == "fail":
+                fail_rows.append(excel_row)
+
+            if has_ts:
+                parsed = self._parse_timestamp(ts_val)
+                if parsed is not None and (last_ts is None or parsed >= last_ts):
+                    last_ts = parsed
+                    last_ts_raw = parsed.strftime(TIMESTAMP_FORMAT)
+                elif last_ts is None and last_ts_raw is None:
+                    last_ts_raw = str(ts_val).strip()
+
+        return {
+            "total_count": sum(counts.values()),
+            "pass_count": counts["pass"],
+            "fail_count": counts["fail"],
+            "pending_count": counts["pending"],
+            "timestamped_passes": timestamped_passes,
+            "fail_rows": fail_rows,
+            "last_timestamp": last_ts_raw,
+        }
+
+    def _scan_from_summary(self, file_path: str, summary: dict) -> dict:
+        total_count, pass_count = summary["total_count"], summary["pass_count"]
+        fail_count, pending_count = summary["fail_count"], summary["pending_count"]
+
+        if total_count == 0 or pending_count == total_count:
+            status = "Pending"
+        elif pass_count == total_count:
+            status = "Complete"
+        else:
+            status = "Active"
 
-            # Find header indices
-            headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-            # Normalize header names
-            header_map = {str(h).strip().lower(): idx for idx, h in enumerate(headers) if h is not None}
-            pf_key = None
-            ts_key = None
-            for k in header_map:
-                if 'pass' in k and 'fail' in k and 'timestamp' not in k:
-                    # unlikely, but avoid
-                    pass
-            # find pass/fail header
-            for name in ('pass/fail', 'passfail', 'pass_fail'):
-                if name in header_map:
-                    pf_key = header_map[name]
-                    break
-            # find timestamp header
-            for name in ('pass/fail timestamp', 'pass/fail timestamp', 'pass_fail timestamp', 'pass/fail timestamp'):
-                if name in header_map:
-                    ts_key = header_map[name]
-                    break
-
-            # Fallback: try simple lookups by partial match
-            if pf_key is None:
-                for k in header_map:
-                    if 'pass' in k and 'fail' in k and 'timestamp' not in k:
-                        pf_key = header_map[k]
-                        break
-                    if 'pass' in k and 'fail' not in k and 'timestamp' not in k:
-                        pf_key = header_map[k]
-                        break
-
-            if ts_key is None:
-                for k in header_map:
-                    if 'timestamp' in k:
-                        ts_key = header_map[k]
-                        break
-
-            if pf_key is None or ts_key is None:
-                # Unable to find relevant columns — not ready
-                return False
-
-            pass_values = {'pass', 'true', '1', 'yes'}
-
-            # Iterate rows from row 2 onward
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                # row is a tuple aligned with headers
-                try:
-                    pf_val = row[pf_key]
-                except Exception:
-                    return False
-
-                # Normalize pf_val
-                if pf_val is None:
-                    return False
-                pf_str = str(pf_val).strip().lower()
-                if pf_str not in pass_values:
-                    return False
-
-                # Check timestamp
-                try:
-                    ts_val = row[ts_key]
-                except Exception:
-                    return False
-                if ts_val is None or (isinstance(ts_val, str) and ts_val.strip() == ""):
-                    return False
-
-            return True
-        except Exception:
-            return False
\ No newline at end of file
+        ready = total_count > 0 and summary["timestamped_passes"] == total_count
+        first_fail_row = min(summary["fail_rows"]) if summary["fail_rows"] else None
+        logger.debug(f"Scanned {file_path}: {status} (P:{pass_count}, F:{fail_count}, Pend:{pending_count})")
+        return self._scan_result(status, pass_count, fail_count, pending_count, total_count,
+                                 ready, first_fail_row, summary["last_timestamp"])
@@ -0,0 +1,210 @@
+import re, copy, zlib, struct, zipfile, logging
+from xml.sax.saxutils import escape
+from xml.etree.ElementTree import fromstring, ParseError
+
+from managers.xlsx_fast_reader import (
+    FastReaderUnsupported, resolve_active_sheet, column_index, column_letter, decode_row, NS_MAIN,
+)
+
+logger = logging.getLogger(__name__)
+
+_CELL_RE = re.compile(rb'<c\b([^>]*?)(?:/>|>(.*?)</c>)', re.S)
+_ATTR_RE = re.compile(rb'\b([\w:]+)="([^"]*)"')
+_PREFIXED_ROW_RE = re.compile(rb'<\w+:row\b')
+_ROOT_TAG_RE = re.compile(rb'<worksheet\b[^>]*>')
+_XMLNS_RE = re.compile(rb'\sxmlns(?::\w+)?="[^"]*"')
+
+# Local file header: signature + fixed fields, followed by name and extra
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_DATA_DESCRIPTOR_FLAG = 0x08
+_ENCRYPTED_FLAG = 0x01
+
+
+class RowPatchUnsupported(Exception):
+    """Raised when a workbook cannot be patched in place.
+
+    Callers fall back to a full openpyxl load/save when they see this.
+    """
+
+
+def _cell_xml(ref: str, style: bytes, value) -> bytes:
+    """Serialize a single <c> element holding value (inline string for text)."""
+    s_attr = b' s="' + style + b'"' if style else b""
+    r_attr = b'r="' + ref.encode("ascii") + b'"'
+    if value is None or value == "":
+        return b"<c " + r_attr + s_attr + b"/>"
+    if isinstance(value, bool):
+        return b"<c " + r_attr + s_attr + b' t="b"><v>' + (b"1" if value else b"0") + b"</v></c>"
+    if isinstance(value, (int, float)):
+        return b"<c " + r_attr + s_attr + b' t="n"><v>' + repr(value).encode("ascii") + b"</v></c>"
+
+    text = str(value)
+    space = b' xml:space="preserve"' if text != text.strip() else b""
+    return (b"<c " + r_attr + s_attr + b' t="inlineStr"><is><t' + space + b">" +
+            escape(text).encode("utf-8") + b"</t></is></c>")
+
+
+def _find_row(sheet_xml: bytes, row_number: int, start: int = 0):
+    """Return (start, end, open_tag, body) of <row r="row_number"> or None.
+
+    body is None for a self-closing <row .../> element.
+    """
+    # Fast path: openpyxl and Excel both write r as the first row attribute
+    prefix = b'<row r="%d"' % row_number
+    tag_start = sheet_xml.find(prefix, start)
+    while tag_start >= 0 and sheet_xml[tag_start + len(prefix):tag_start + len(prefix) + 1] not in (b" ", b">", b"/"):
+        tag_start = sheet_xml.find(prefix, tag_start + 1)
+    if tag_start >= 0:
+        tag_end = sheet_xml.index(b">", tag_start) + 1
+    else:
+        pattern = re.compile(rb'<row\b[^>]*?\sr="%d"[^>]*?>' % row_number)
+        m = pattern.search(sheet_xml, start) or (pattern.search(sheet_xml) if start else None)
+        if not m:
+            return None
+        tag_start, tag_end = m.start(), m.end()
+
+    open_tag = sheet_xml[tag_start:tag_end]
+    if open_tag.endswith(b"/>"):
+        return tag_start, tag_end, open_tag, None
+    close = sheet_xml.find(b"</row>", tag_end)
+    if close < 0:
+        raise RowPatchUnsupported(f"Unterminated row {row_number}")
+    return tag_start, close + len(b"</row>"), open_tag, sheet_xml[tag_end:close]
+
+
+def patch_sheet_rows(sheet_xml: bytes, updates: dict) -> bytes:
+    """Return sheet_xml with the given cells replaced.
+
+    updates: {excel_row: {col_idx (0-based): value}}. Other cells, rows and
+    formatting are left byte-for-byte untouched; existing cell styles are kept.
+    Rows must already exist (order files are pre-populated).
+    """
+    if _PREFIXED_ROW_RE.search(sheet_xml, 0, 4096 * 16):
+        raise RowPatchUnsupported("Namespace-prefixed sheet markup")
+
+    pieces = []
+    pos = 0
+    for row_number in sorted(updates):
+        found = _find_row(sheet_xml, row_number, pos)
+        if found is None:
+            raise RowPatchUnsupported(f"Row {row_number} not found")
+        row_start, row_end, open_tag, body = found
+        if row_start < pos:
+            raise RowPatchUnsupported("Rows are not in ascending order")
+
+        cells = {}
+        order = []
+        for cm in _CELL_RE.finditer(body or b""):
+            attrs = dict(_ATTR_RE.findall(cm.group(1)))
+            ref = attrs.get(b"r")
+            if not ref:
+                raise RowPatchUnsupported(f"Cell without reference in row {row_number}")
+            col = column_index(ref.decode("ascii"))
+            cells[col] = (cm.group(0), attrs.get(b"s", b""))
+            order.append(col)
+
+        for col, value in updates[row_number].items():
+            style = cells[col][1] if col in cells else b""
+            if col not in cells:
+                order.append(col)
+            cells[col] = (_cell_xml(f"{column_letter(col)}{row_number}", style, value), style)
+
+        # spans is only an optional layout hint; drop it rather than recompute it
+        tag = re.sub(rb'\sspans="[^"]*"', b"", open_tag)
+        if tag.endswith(b"/>"):
+            tag = tag[:-2].rstrip() + b">"
+        new_row = tag + b"".join(cells[c][0] for c in sorted(order)) + b"</row>"
+
+        pieces.append(sheet_xml[pos:row_start])
+        pieces.append(new_row)
+        pos = row_end
+
+    pieces.append(sheet_xml[pos:])
+    return b"".join(pieces)
+
+
+def decode_sheet_rows(sheet_xml: bytes, row_numbers, shared_strings) -> dict:
+    """Decode only the given rows of a sheet part: {excel_row: values}.
+
+    Rows are sliced out of the XML and parsed on their own, so the cost does not
+    depend on the size of the sheet beyond locating them. Missing rows decode
+    as empty lists. shared_strings is a zero-argument callable (see cell_value).
+    """
+    root = _ROOT_TAG_RE.search(sheet_xml, 0, 4096)
+    if not root:
+        raise RowPatchUnsupported("Worksheet root element not found")
+    # Re-declare the root's namespaces so prefixed row attributes (x14ac:...) still parse
+    namespaces = b"".join(_XMLNS_RE.findall(root.group(0))) or b' xmlns="' + NS_MAIN.encode() + b'"'
+
+    rows = {}
+    pos = 0
+    for row_number in sorted(row_numbers):
+        found = _find_row(sheet_xml, row_number, pos)
+        if found is None:
+            rows[row_number] = []
+            continue
+        row_start, row_end = found[0], found[1]
+        pos = row_end
+        try:
+            wrapper = fromstring(b"<wrapper" + namespaces + b">" + sheet_xml[row_start:row_end] + b"</wrapper>")
+        except ParseError as e:
+            raise RowPatchUnsupported(f"Unparseable row {row_number}: {e}")
+        rows[row_number] = decode_row(wrapper[0], shared_strings)
+    return rows
+
+
+def copy_member_raw(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """Copy a zip member's compressed bytes verbatim (no inflate/deflate)."""
+    zin.fp.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(zin.fp.read(_LOCAL_HEADER.size))
+    name_len, extra_len = header[-2], header[-1]
+    zin.fp.seek(info.header_offset + _LOCAL_HEADER.size + name_len + extra_len)
+    raw = zin.fp.read(info.compress_size)
+
+    out = copy.copy(info)
+    # Sizes are known up front, so no trailing data descriptor is needed
+    out.flag_bits &= ~_DATA_DESCRIPTOR_FLAG
+    out.header_offset = zout.fp.tell()
+    zout.fp.write(out.FileHeader())
+    zout.fp.write(raw)
+    zout.filelist.append(out)
+    zout.NameToInfo[out.filename] = out
+    zout.start_dir = zout.fp.tell()
+
+
+def patch_workbook_rows(src_path: str, dest_path: str, updates: dict, extra_members: dict = None) -> str:
+    """Write a copy of src_path to dest_path with the active sheet's rows patched.
+
+    Both may be paths or binary file objects.
+
+    Only the worksheet part is decompressed and rewritten; every other member
+    is copied as raw compressed bytes. extra_members ({name: bytes}) replaces
+    or adds small parts in the same pass. It may also be a callable
+    (zin, sheet_member, old_sheet_xml, new_sheet_xml) -> {name: bytes} for parts
+    derived from the patched sheet. Returns the sheet member name.
+    """
+    try:
+        with zipfile.ZipFile(src_path) as zin:
+            sheet_member = resolve_active_sheet(zin)
+            original = zin.read(sheet_member)
+            patched = patch_sheet_rows(original, updates)
+            if callable(extra_members):
+                extra_members = extra_members(zin, sheet_member, original, patched)
+            extra_members = dict(extra_members or {})
+
+            with zipfile.ZipFile(dest_path, "w", zipfile.ZIP_DEFLATED) as zout:
+                for info in zin.infolist():
+                    name = info.filename
+                    if name == sheet_member:
+                        zout.writestr(info, patched, compress_type=zipfile.ZIP_DEFLATED)
+                    elif name in extra_members:
+                        zout.writestr(info, extra_members.pop(name), compress_type=zipfile.ZIP_DEFLATED)
+                    elif info.flag_bits & _ENCRYPTED_FLAG:
+                        raise RowPatchUnsupported(f"Encrypted member {name}")
+                    else:
+                        copy_member_raw(zin, zout, info)
+                for name, data in extra_members.items():
+                    zout.writestr(name, data)
+    except (FastReaderUnsupported, zipfile.BadZipFile, zlib.error, KeyError) as e:
+        raise RowPatchUnsupported(str(e))
+    return sheet_member
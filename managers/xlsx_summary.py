@@ -0,0 +1,150 @@
+import re, zipfile, logging
+from xml.etree.ElementTree import fromstring, ParseError
+from xml.sax.saxutils import escape, quoteattr
+
+from managers.xlsx_fast_reader import FastReaderUnsupported, resolve_active_sheet
+
+logger = logging.getLogger(__name__)
+
+CUSTOM_PART = "docProps/custom.xml"
+NS_CUSTOM = "http://schemas.openxmlformats.org/officeDocument/2006/custom-properties"
+NS_VT = "http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes"
+FMTID = "{D5CDD505-2E9C-101B-9397-08002B2CF9AE}"
+CUSTOM_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.custom-properties+xml"
+CUSTOM_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/custom-properties"
+
+# Custom document property names are PROP_PREFIX + summary key
+PROP_PREFIX = "lt_"
+
+# Summary keys and their types. sheet_crc is the CRC-32 of the sheet part the
+# counts were computed from; Excel keeps custom properties when it edits a
+# file but rewrites the sheet, so a mismatch means the summary is stale.
+SUMMARY_FIELDS = {
+    "total_count": int,
+    "pass_count": int,
+    "fail_count": int,
+    "pending_count": int,
+    "timestamped_passes": int,
+    "fail_rows": list,
+    "last_timestamp": str,
+    "updated_at": str,
+    "updated_by": str,
+    "sheet_crc": str,
+}
+REQUIRED_FIELDS = ("total_count", "pass_count", "fail_count", "pending_count", "timestamped_passes",
+                   "fail_rows", "sheet_crc")
+
+_PROPERTY_RE = re.compile(rb'<property\b[^>]*?\bname="([^"]*)"[^>]*?(?:/>|>.*?</property>)', re.S)
+_PID_RE = re.compile(rb'\bpid="(\d+)"')
+
+
+def sheet_crc(zf: zipfile.ZipFile, sheet_member: str) -> str:
+    return format(zf.getinfo(sheet_member).CRC, "08x")
+
+
+def read_summary(zf: zipfile.ZipFile, sheet_member: str = None):
+    """Return the summary stored in the workbook, or None if missing or invalid.
+
+    A summary is only returned when it belongs to the current sheet part
+    (matching CRC) and its counts are consistent with each other.
+    """
+    if CUSTOM_PART not in zf.NameToInfo:
+        return None
+    sheet_member = sheet_member or resolve_active_sheet(zf)
+
+    raw = {}
+    for prop in fromstring(zf.read(CUSTOM_PART)):
+        name = prop.get("name", "")
+        if name.startswith(PROP_PREFIX) and len(prop):
+            raw[name[len(PROP_PREFIX):]] = prop[0].text or ""
+
+    if any(key not in raw for key in REQUIRED_FIELDS):
+        return None
+    if raw["sheet_crc"] != sheet_crc(zf, sheet_member):
+        logger.debug("Workbook summary is stale (sheet changed since it was written)")
+        return None
+
+    summary = {}
+    try:
+        for key, kind in SUMMARY_FIELDS.items():
+            value = raw.get(key, "")
+            if kind is int:
+                summary[key] = int(value)
+            elif kind is list:
+                summary[key] = [int(v) for v in value.split(",") if v]
+            else:
+                summary[key] = value or None
+    except ValueError:
+        return None
+
+    counts_ok = (
+        summary["pass_count"] + summary["fail_count"] + summary["pending_count"] == summary["total_count"]
+        and 0 <= summary["timestamped_passes"] <= summary["pass_count"]
+        and len(summary["fail_rows"]) == summary["fail_count"]
+    )
+    return summary if counts_ok else None
+
+
+def read_workbook_summary(source):
+    """read_summary() for a path or binary file object; None on any read problem."""
+    try:
+        with zipfile.ZipFile(source) as zf:
+            return read_summary(zf)
+    except (zipfile.BadZipFile, OSError, KeyError, ParseError, FastReaderUnsupported) as e:
+        logger.debug(f"No usable workbook summary: {e}")
+        return None
+
+
+def _property_xml(pid: int, key: str, value) -> bytes:
+    if isinstance(value, int) and not isinstance(value, bool):
+        typed = f"<vt:i4>{value}</vt:i4>"
+    else:
+        if isinstance(value, (list, tuple)):
+            value = ",".join(str(v) for v in value)
+        typed = f"<vt:lpwstr>{escape('' if value is None else str(value))}</vt:lpwstr>"
+    return (f'<property fmtid="{FMTID}" pid="{pid}" name={quoteattr(PROP_PREFIX + key)}>{typed}</property>'
+            ).encode("utf-8")
+
+
+def summary_members(zf: zipfile.ZipFile, summary: dict) -> dict:
+    """Return {member: bytes} that store summary in zf's custom properties.
+
+    Custom properties not written by us are kept. For workbooks without a
+    custom properties part, the content types and package relationships are
+    extended to register it.
+    """
+    foreign = []
+    if CUSTOM_PART in zf.NameToInfo:
+        for m in _PROPERTY_RE.finditer(zf.read(CUSTOM_PART)):
+            if not m.group(1).decode("utf-8").startswith(PROP_PREFIX):
+                foreign.append(m.group(0))
+
+    pid = max([int(p) for f in foreign for p in _PID_RE.findall(f)] + [1])
+    ours = []
+    for key in SUMMARY_FIELDS:
+        if key in summary:
+            pid += 1
+            ours.append(_property_xml(pid, key, summary[key]))
+
+    members = {
+        CUSTOM_PART: (
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            b'<Properties xmlns="' + NS_CUSTOM.encode() + b'" xmlns:vt="' + NS_VT.encode() + b'">'
+            + b"".join(foreign) + b"".join(ours) + b"</Properties>"
+        )
+    }
+
+    if CUSTOM_PART not in zf.NameToInfo:
+        content_types = zf.read("[Content_Types].xml")
+        if b'PartName="/docProps/custom.xml"' not in content_types:
+            override = f'<Override PartName="/{CUSTOM_PART}" ContentType="{CUSTOM_CONTENT_TYPE}"/>'.encode()
+            members["[Content_Types].xml"] = content_types.replace(b"</Types>", override + b"</Types>")
+
+        rels = zf.read("_rels/.rels")
+        if CUSTOM_REL_TYPE.encode() not in rels:
+            n = 1
+            while f'Id="rId{n}"'.encode() in rels:
+                n += 1
+            rel = f'<Relationship Id="rId{n}" Type="{CUSTOM_REL_TYPE}" Target="{CUSTOM_PART}"/>'.encode()
+            members["_rels/.rels"] = rels.replace(b"</Relationships>", rel + b"</Relationships>")
+    return members
@@ -0,0 +1,84 @@
+# tests/bench_xlsx_reader.py
+"""Benchmark: status scan with the raw-XML fast reader vs openpyxl read-only mode.
+
+Not part of the unit test suite. Run from the project root:
+
+    python tests/bench_xlsx_reader.py [rows ...]
+
+Builds order-shaped workbooks (default 1k, 10k and 100k rows) in a temp dir and
+times a pass/fail column scan with `load_workbook(read_only=True)` against
+`FastSheetReader`.
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from managers.xlsx_manager import ORDER_HEADERS, DEFAULT_LAYOUT
+from managers.xlsx_fast_reader import FastSheetReader
+
+PF_IDX = DEFAULT_LAYOUT["pass_fail"]
+
+
+def build_order(path, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Bench Tracking")
+    ws.append(ORDER_HEADERS)
+    for i in range(rows):
+        status = ("Pass", "Fail", "Pending")[i % 3]
+        ts = "Oct 01, 2025 09:00 AM" if status != "Pending" else None
+        ws.append([1, "Oct 01, 2025 08:00 AM", "operator", 1, "BOARD-1",
+                   f"BENCH-{i:06d}", status, ts, None, None])
+    wb.save(path)
+
+
+def count_openpyxl(path):
+    counts = {}
+    wb = load_workbook(path, read_only=True, data_only=True)
+    for row in wb.active.iter_rows(min_row=2, values_only=True):
+        counts[row[PF_IDX]] = counts.get(row[PF_IDX], 0) + 1
+    wb.close()
+    return counts
+
+
+def count_fast(path):
+    counts = {}
+    with FastSheetReader(path) as reader:
+        for _, row in reader.iter_rows(columns=[PF_IDX], min_row=2):
+            counts[row[PF_IDX]] = counts.get(row[PF_IDX], 0) + 1
+    return counts
+
+
+def best_of(fn, path, repeat=3):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(sizes):
+    tmp = tempfile.mkdtemp()
+    try:
+        print(f"{'rows':>8} {'openpyxl ro (s)':>16} {'fast reader (s)':>16} {'speedup':>8}")
+        for rows in sizes:
+            path = os.path.join(tmp, f"bench_{rows}.xlsx")
+            build_order(path, rows)
+            slow, slow_counts = best_of(count_openpyxl, path)
+            fast, fast_counts = best_of(count_fast, path)
+            assert slow_counts == fast_counts, (slow_counts, fast_counts)
+            print(f"{rows:>8} {slow:>16.3f} {fast:>16.3f} {slow / fast:>7.1f}x")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    main(sizes)
@@ -0,0 +1,42 @@
+# tests/order_fixtures.py
+"""Shared setup for tests that work on real order files."""
+import unittest
+import tempfile
+import os
+import shutil
+
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+
+TS = "Oct 01, 2025 09:00 AM"
+
+
+class OrderTestCase(unittest.TestCase):
+    """Temp database with an admin user and one company; make_order() adds orders to it."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.client_path = os.path.join(self.test_dir, "TestCompany")
+        self.company_id = self.db.add_company("Test Company", self.client_path)
+        self.xlsx_mgr = XLSXManager(self.db)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def make_order(self, order_number, serial_count, serial_prefix=None, results=None):
+        """Create an order file (serials "<order_number>-00001"... by default) and save
+        results ({excel_row: {layout_key: value}}) into it; returns (file_path, order_id)."""
+        file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number=order_number,
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix=serial_prefix or f"{order_number}-",
+            serial_count=serial_count,
+        )
+        if results:
+            self.xlsx_mgr.update_order_rows(file_path, results)
+        return file_path, self.db.get_order_id_by_file(file_path)
@@ -0,0 +1,116 @@
+# tests/test_backfill_importer.py
+import unittest
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from managers.xlsx_manager import XLSXManager, ORDER_HEADERS
+from managers.backfill_importer import BackfillImporter
+from tests.order_fixtures import OrderTestCase, TS
+
+
+class TestBackfillImporter(OrderTestCase):
+    def setUp(self):
+        super().setUp()
+        results = {2: {"pass_fail": "Pass", "timestamp": TS}, 3: {"pass_fail": "Fail", "timestamp": TS}}
+        self.order_ids = [self.make_order(f"IMP{n}", 3, results=results)[1] for n in range(3)]
+        # Pretend these predate serial_results
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM serial_results")
+            conn.commit()
+
+    def _results(self, order_id):
+        return dict(self.db.get_serial_result_counts(order_id))
+
+    def test_import_registered_orders_in_pool(self):
+        report = BackfillImporter(self.db, workers=2).run()
+        self.assertEqual((report["imported"], report["rows"], report["errors"]), (3, 9, []))
+        for order_id in self.order_ids:
+            self.assertEqual(self._results(order_id), {"Pass": 1, "Fail": 1, "Pending": 1})
+            self.assertEqual(self.db.get_order_counters(order_id)[:5], (3, 1, 1, 1, 1))
+
+    def test_resumes_and_skips_unchanged(self):
+        importer = BackfillImporter(self.db, workers=1)
+        original = self.db.save_imported_order
+        calls = []
+
+        def crash_on_second(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("power cut")
+            return original(*args, **kwargs)
+
+        self.db.save_imported_order = crash_on_second
+        with self.assertRaises(RuntimeError):
+            importer.run()
+        self.db.save_imported_order = original
+
+        report = importer.run()
+        self.assertEqual((report["imported"], report["skipped"]), (2, 1))
+        self.assertEqual(importer.run()["imported"], 0)
+
+        # A changed file is imported again
+        path = self.db.get_order_details(self.order_ids[0])[3]
+        wb = load_workbook(path)
+        wb.active.cell(row=4, column=7).value = "Pass"
+        wb.save(path)
+        report = importer.run()
+        self.assertEqual(report["imported"], 1)
+        self.assertEqual(self._results(self.order_ids[0]), {"Pass": 2, "Fail": 1})
+
+    def test_reimport_only_restamps_changed_rows(self):
+        importer = BackfillImporter(self.db, workers=1)
+        importer.run()
+        order_id = self.order_ids[0]
+        seq = self.db.get_max_change_seq(order_id)
+
+        path = self.db.get_order_details(order_id)[3]
+        wb = load_workbook(path)
+        wb.active.cell(row=4, column=7).value = "Pass"
+        wb.save(path)
+        self.assertEqual(importer.run()["imported"], 1)
+        self.assertEqual([r[0] for r in self.db.iter_serial_results(order_id, after_seq=seq)], ["IMP0-00003"])
+        self.assertEqual(self.db.get_order_counters(order_id)[:4], (3, 2, 1, 0))
+        self.assertEqual(self.db.get_results_sheet_crc(order_id), XLSXManager._sheet_crc(path))
+
+    def test_counters_follow_live_saves(self):
+        BackfillImporter(self.db, workers=1).run()
+        order_id = self.order_ids[1]
+        XLSXManager(self.db).update_order_rows(self.db.get_order_details(order_id)[3],
+                                               {4: {"pass_fail": "Fail", "timestamp": TS}})
+        self.assertEqual(self.db.get_order_counters(order_id)[:4], (3, 1, 2, 0))
+
+    def test_walk_folders_registers_and_reports_malformed(self):
+        legacy_dir = os.path.join(self.client_path, "2019")
+        os.makedirs(legacy_dir)
+        wb = Workbook()
+        wb.active.append(ORDER_HEADERS)
+        wb.active.append([1, TS, "op", self.company_id, None, "OLD-1", "Pass", TS, None, None])
+        wb.save(os.path.join(legacy_dir, "OLD1.xlsx"))
+
+        wb = Workbook()
+        wb.active.append(["Part", "Qty"])
+        wb.active.append(["R1", 5])
+        wb.save(os.path.join(legacy_dir, "bom.xlsx"))
+        with open(os.path.join(legacy_dir, "broken.xlsx"), "wb") as fh:
+            fh.write(b"not a zip")
+
+        report = BackfillImporter(self.db, workers=1).run(walk_folders=True)
+        self.assertEqual(report["imported"], 4)
+        self.assertEqual(sorted(os.path.basename(p) for p, _ in report["errors"]), ["bom.xlsx", "broken.xlsx"])
+
+        legacy_id = self.db.get_order_id_by_file(os.path.join(legacy_dir, "OLD1.xlsx"))
+        self.assertEqual(self.db.get_order_details(legacy_id)[0], "OLD1")
+        self.assertEqual(self._results(legacy_id), {"Pass": 1})
+        self.assertNotIn(legacy_id, [o[0] for o in self.db.get_orders() if o[4] != "Archived"])
+
+        # Malformed files stay reported without being parsed again
+        report = BackfillImporter(self.db, workers=1).run(walk_folders=True)
+        self.assertEqual((report["imported"], len(report["errors"])), (0, 2))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
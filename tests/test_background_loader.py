@@ -0,0 +1,209 @@
+# tests/test_background_loader.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import threading
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QThreadPool
+from GUI.background import BackgroundLoader, LoadJob
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+
+
+def settle(app, loader):
+    # Applying one load may start the next, so run until nothing is left
+    for _ in range(10):
+        loader.wait(5000)
+        app.processEvents()
+        if not loader.busy():
+            break
+
+
+class TestBackgroundLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.loader = BackgroundLoader(pool=QThreadPool())
+
+    def test_result_applied_on_gui_thread(self):
+        applied = []
+        fetched_on = []
+
+        def fetch(job):
+            fetched_on.append(threading.current_thread())
+            return 42
+        self.loader.submit("x", fetch, lambda r: applied.append((r, threading.current_thread())))
+        self.assertTrue(self.loader.is_loading("x"))
+        settle(self.app, self.loader)
+        self.assertEqual(applied, [(42, threading.main_thread())])
+        self.assertNotEqual(fetched_on, [threading.main_thread()])
+        self.assertEqual(self.loader.busy(), [])
+
+    def test_resubmit_and_cancel_drop_stale_results(self):
+        release = threading.Event()
+        applied = []
+
+        def slow(job):
+            release.wait(5)
+            return "stale"
+        self.loader.submit("x", slow, applied.append)
+        self.loader.submit("x", lambda job: "fresh", applied.append)
+        self.loader.submit("y", lambda job: "cancelled", applied.append)
+        self.loader.cancel("y")
+        release.set()
+        settle(self.app, self.loader)
+        self.assertEqual(applied, ["fresh"])
+
+    def test_cancel_stops_fetch_at_check(self):
+        started, release = threading.Event(), threading.Event()
+        seen = []
+
+        def fetch(job):
+            for n in range(3):
+                if n == 1:
+                    started.set()
+                    release.wait(5)
+                job.check()
+                seen.append(n)
+        self.loader.submit("x", fetch, lambda r: self.fail("cancelled load applied"))
+        started.wait(5)
+        self.loader.cancel("x")
+        release.set()
+        settle(self.app, self.loader)
+        self.assertEqual(seen, [0])
+
+    def test_progress_reports_in_order(self):
+        progress, applied = [], []
+
+        def fetch(job):
+            for n in range(3):
+                job.report(n)
+            return "done"
+        self.loader.submit("x", fetch, applied.append, on_progress=progress.append)
+        settle(self.app, self.loader)
+        self.assertEqual((progress, applied), ([0, 1, 2], ["done"]))
+
+    def test_failure_reported(self):
+        errors = []
+        self.loader.submit("x", lambda job: 1 / 0, self.fail, errors.append)
+        settle(self.app, self.loader)
+        self.assertEqual(len(errors), 1)
+
+
+class TestAdminBackgroundLoads(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from GUI.admin_window import AdminWindow
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("bg_admin", "password123", role="admin")
+        user_id = self.db.authenticate_user("bg_admin", "password123")[0]
+        with self.db.get_connection() as conn:
+            self.user_count = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        company_id = self.db.get_companies()[0][0]
+        xlsx_mgr = XLSXManager(self.db)
+        self.order_ids = []
+        for n in range(3):
+            file_path, _ = xlsx_mgr.create_order_file(order_number=f"BG{n}", created_by=user_id, user_id=user_id,
+                                                      company_id=company_id, serial_prefix=f"BG{n}-",
+                                                      serial_count=2)
+            self.order_ids.append(self.db.get_order_id_by_file(file_path))
+        # The oldest order has just had a serial tested
+        xlsx_mgr.update_order_rows(self.db.get_order_details(self.order_ids[0])[3],
+                                   {2: {"pass_fail": "Pass", "timestamp": "Oct 01, 2025 09:00 AM"}})
+        self.window = AdminWindow("bg_admin", user_id, self.db, xlsx_mgr)
+
+    def tearDown(self):
+        self.window.loader.cancel_all()
+        self.window.loader.wait(5000)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_initial_data_arrives_via_loader(self):
+        # Only the create order panel exists at login; nothing was read on the GUI thread
+        self.assertFalse(hasattr(self.window, "await_model"))
+        self.assertEqual(self.window.company_dropdown.count(), 1)
+        self.assertEqual(self.window.loading_label.text(), "Loading companies…")
+        settle(self.app, self.window.loader)
+        self.assertEqual(self.window.company_dropdown.count(), 2)
+        self.assertEqual(self.window.loading_label.text(), "")
+
+    def test_panels_built_and_loaded_on_first_visit(self):
+        self.window.show_panel(3)
+        self.assertEqual(self.window.await_model.rowCount(), 0)
+        settle(self.app, self.window.loader)
+        self.assertEqual([self.window.await_model.value(r, 4) for r in range(3)], ["Active", "Pending", "Pending"])
+        for index in (1, 2, 5):
+            self.window.show_panel(index)
+            settle(self.app, self.window.loader)
+        self.assertEqual(self.window.user_table.rowCount(), self.user_count)
+        self.assertEqual(self.window.company_tree_model.rowCount(), 1)
+        self.assertEqual(self.window.company_for_board_dropdown.count(), 2)
+
+        # Revisiting keeps the built panel
+        panel = self.window.panel_awaiting
+        self.window.show_panel(3)
+        self.assertIs(self.window.content_stack.currentWidget(), panel)
+        self.assertFalse(self.window.ensure_panel(3))
+
+    def test_rows_listed_before_scanning_most_active_first(self):
+        from GUI.admin_window import STATUS_COMPUTING
+        rows, keys, scans, _ = self.window._fetch_awaiting_orders(LoadJob("t", None, None))
+        self.assertEqual(keys, self.order_ids)
+        self.assertEqual({row[4] for row in rows}, {STATUS_COMPUTING})
+        self.assertEqual([order_id for order_id, _ in scans],
+                         [self.order_ids[0], self.order_ids[2], self.order_ids[1]])
+
+    def test_search_is_debounced(self):
+        from PyQt5.QtTest import QTest
+        self.window.show_panel(3)
+        settle(self.app, self.window.loader)
+        self.window.await_search_input.setText("bg1")
+        self.assertEqual(self.window.await_proxy.rowCount(), 3)
+        QTest.qWait(300)
+        self.assertEqual(self.window.await_proxy.rowCount(), 1)
+        self.assertEqual(self.window.await_model.rowCount(), 3)
+
+    def test_watcher_recounts_only_the_changed_order(self):
+        from PyQt5.QtTest import QTest
+        self.window.show_panel(3)
+        settle(self.app, self.window.loader)
+        self.assertTrue(self.window.order_watcher.is_active())
+        xlsx_mgr = self.window.xlsx_manager
+        xlsx_mgr.update_order_rows(self.db.get_order_details(self.order_ids[2])[3],
+                                   {2: {"pass_fail": "Pass", "timestamp": "Oct 02, 2025 09:00 AM"}})
+        self.window.order_watcher.poll_db()
+        QTest.qWait(700)
+        settle(self.app, self.window.loader)
+        self.assertEqual([self.window.await_model.value(r, 4) for r in range(3)], ["Active", "Pending", "Active"])
+
+        self.window.show_panel(0)
+        self.assertFalse(self.window.order_watcher.is_active())
+
+    def test_navigating_away_cancels_and_returning_reloads(self):
+        self.window.show_panel(5)
+        self.window.show_panel(3)
+        self.window.show_panel(0)
+        self.assertFalse(self.window.loader.is_loading("awaiting"))
+        self.assertFalse(self.window.loader.is_loading("users"))
+        settle(self.app, self.window.loader)
+        self.assertEqual(self.window.user_table.rowCount(), 0)
+
+        self.window.show_panel(5)
+        settle(self.app, self.window.loader)
+        self.assertEqual(self.window.user_table.rowCount(), self.user_count)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,130 @@
+# tests/test_change_events.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication
+from GUI.change_events import (
+    ChangeBus, CompanyEvent, CompanyAdded, BoardAdded, BoardArchived, BoardRestored, OrderEvent,
+    OrderStatusChanged,
+)
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+from tests.test_background_loader import settle
+
+
+class TestChangeBus(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_handlers_get_only_their_event_types(self):
+        bus = ChangeBus()
+        companies, orders, everything = [], [], []
+        bus.subscribe(companies.append, CompanyEvent)
+        bus.subscribe(orders.append, OrderEvent)
+        bus.subscribe(everything.append)
+        added, archived = CompanyAdded(1), OrderStatusChanged(7, "Archived")
+        bus.publish(added)
+        bus.publish(archived)
+        self.assertEqual((companies, orders, everything), ([added], [archived], [added, archived]))
+        self.assertEqual(repr(archived), "OrderStatusChanged(order_id=7, status='Archived')")
+
+    def test_failing_handler_does_not_stop_others(self):
+        bus = ChangeBus()
+        seen = []
+        bus.subscribe(lambda event: 1 / 0)
+        bus.subscribe(seen.append)
+        with self.assertLogs("GUI.change_events", level="ERROR"):
+            bus.publish(CompanyAdded(1))
+        self.assertEqual(len(seen), 1)
+
+
+class TestAdminChangePatches(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from GUI.admin_window import AdminWindow, PANELS
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("ev_admin", "password123", role="admin")
+        user_id = self.db.authenticate_user("ev_admin", "password123")[0]
+        self.company_id = self.db.add_company("Acme", os.path.join(self.test_dir, "Acme"))
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.order_ids = []
+        for n in range(3):
+            file_path, _ = self.xlsx_mgr.create_order_file(
+                order_number=f"EV{n}", created_by=user_id, user_id=user_id, company_id=self.company_id,
+                serial_prefix=f"EV{n}-", serial_count=2)
+            self.order_ids.append(self.db.get_order_id_by_file(file_path))
+        self.window = AdminWindow("ev_admin", user_id, self.db, self.xlsx_mgr)
+        for index in range(len(PANELS)):
+            self.window.ensure_panel(index)
+        self.window.load_awaiting_confirmation_orders()
+        self.window.load_all_orders()
+        settle(self.app, self.window.loader)
+
+    def tearDown(self):
+        self.window.loader.cancel_all()
+        self.window.loader.wait(5000)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_archiving_an_order_patches_rows_and_keeps_selection(self):
+        window = self.window
+        window.await_table.setCurrentIndex(window.await_proxy.index(2, 0))
+        # Selecting rescans the order in the background
+        settle(self.app, window.loader)
+        self.db.archive_order(self.order_ids[0])
+        window.changes.publish(OrderStatusChanged(self.order_ids[0], "Archived"))
+        # Patched in place: nothing was reloaded
+        self.assertEqual(window.loader.busy(), [])
+        self.assertEqual([window.await_model.key(r) for r in range(window.await_model.rowCount())],
+                         self.order_ids[1:])
+        self.assertEqual(window.get_selected_awaiting_order_id(), self.order_ids[2])
+        row = window.archived_model.row_for_key(self.order_ids[0])
+        self.assertEqual(window.archived_model.value(row, 3), "Archived")
+        self.assertEqual(window.company_tree_model.index(0, 1).data(), "3 orders (2 open)")
+
+        # Restoring lists it again and rescans just that order
+        self.db.unarchive_order(self.order_ids[0])
+        window.changes.publish(OrderStatusChanged(self.order_ids[0], "Pending"))
+        self.assertEqual(window.loader.busy(), [f"order_status:{self.order_ids[0]}"])
+        settle(self.app, window.loader)
+        row = window.await_model.row_for_key(self.order_ids[0])
+        self.assertEqual((window.await_model.rowCount(), window.await_model.value(row, 4)), (3, "Pending"))
+
+    def test_company_and_board_events(self):
+        window = self.window
+        company_id = self.db.add_company("Globex", os.path.join(self.test_dir, "Globex"))
+        window.changes.publish(CompanyAdded(company_id))
+        self.assertEqual(window.loader.busy(), [])
+        self.assertEqual(window.company_tree_model.rowCount(), 2)
+        self.assertEqual([window.company_dropdown.itemText(r) for r in range(3)],
+                         ["Select Company", "Acme", "Globex"])
+
+        acme = window.company_tree_proxy.index(0, 0)
+        window.company_tree_proxy.fetchMore(acme)
+        board_id = self.db.add_board(self.company_id, "PCB-1", os.path.join(self.test_dir, "Acme", "PCB-1"))
+        window.changes.publish(BoardAdded(self.company_id, board_id, "PCB-1"))
+        self.assertEqual(window.company_tree_proxy.index(0, 1, acme).data(), "PCB-1 (0)")
+
+        self.db.archive_board(board_id)
+        window.changes.publish(BoardArchived(self.company_id, board_id, "PCB-1"))
+        self.assertEqual(window.company_tree_proxy.rowCount(acme), 3)
+        self.assertEqual(window.archived_boards_table.rowCount(), 1)
+        self.db.unarchive_board(board_id)
+        window.changes.publish(BoardRestored(self.company_id, board_id, "PCB-1"))
+        self.assertEqual(window.archived_boards_table.rowCount(), 0)
+        self.assertEqual(window.company_tree_proxy.rowCount(acme), 4)
+        self.assertEqual(window.loader.busy(), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,101 @@
+# tests/test_cold_storage.py
+import unittest
+import os
+import sys
+import zipfile
+import stat
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from managers.cold_storage import ColdStorage, split_stored_path, open_stored, stored_exists, extract_copy
+from managers.delivery_bundle import DeliveryBundler, verify_bundle
+from tests.order_fixtures import OrderTestCase, TS
+
+
+class TestColdStorage(OrderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.paths, self.order_ids, self.contents = [], [], []
+        for n in range(3):
+            file_path, order_id = self.make_order(f"CLD{n}", 2, results={2: {"pass_fail": "Pass", "timestamp": TS}})
+            with open(file_path, "rb") as fh:
+                self.contents.append(fh.read())
+            self.paths.append(file_path)
+            self.order_ids.append(order_id)
+        for order_id in self.order_ids[:2]:
+            self.db.archive_order(order_id)
+        self.storage = ColdStorage(self.db, self.xlsx_mgr)
+
+    def _db_path(self, order_id):
+        return self.db.get_order_details(order_id)[3]
+
+    def test_only_old_archived_orders_move(self):
+        self.assertEqual(self.storage.compact(older_than_days=1), 0)
+        self.assertEqual(self.storage.compact(older_than_days=0), 2)
+
+        for n in range(2):
+            stored = split_stored_path(self._db_path(self.order_ids[n]))
+            self.assertIsNotNone(stored)
+            self.assertFalse(os.path.exists(self.paths[n]))
+            with open_stored(self._db_path(self.order_ids[n])) as fh:
+                self.assertEqual(fh.read(), self.contents[n])
+        self.assertEqual(split_stored_path(self._db_path(self.order_ids[0]))[0],
+                         split_stored_path(self._db_path(self.order_ids[1]))[0])
+        # The active order stays live
+        self.assertEqual(self._db_path(self.order_ids[2]), self.paths[2])
+
+    def test_restore_and_recompact(self):
+        self.storage.compact(older_than_days=0)
+        container = split_stored_path(self._db_path(self.order_ids[0]))[0]
+
+        restored = self.storage.restore(self.order_ids[0])
+        self.assertEqual(restored, self.paths[0])
+        self.assertEqual(self._db_path(self.order_ids[0]), self.paths[0])
+        with open(restored, "rb") as fh:
+            self.assertEqual(fh.read(), self.contents[0])
+        self.assertEqual(self.xlsx_mgr.scan_order_file(restored)["pass_count"], 1)
+
+        # Order 2 joins the same month; the restored order's stale copy is dropped
+        self.db.unarchive_order(self.order_ids[0])
+        self.db.archive_order(self.order_ids[2])
+        self.assertEqual(self.storage.compact(older_than_days=0), 1)
+        with zipfile.ZipFile(container) as zf:
+            members = sorted(zf.namelist())
+            self.assertIsNone(zf.testzip())
+        self.assertEqual(members, [f"{self.order_ids[1]}_CLD1.xlsx", f"{self.order_ids[2]}_CLD2.xlsx"])
+        with open_stored(self._db_path(self.order_ids[1])) as fh:
+            self.assertEqual(fh.read(), self.contents[1])
+
+    def test_extract_copy_for_viewing(self):
+        self.assertEqual(extract_copy(self.paths[0]), self.paths[0])
+        self.storage.compact(older_than_days=0)
+        stored = self._db_path(self.order_ids[0])
+        self.assertTrue(stored_exists(stored))
+        self.assertFalse(os.path.exists(stored))
+
+        copy_path = extract_copy(stored, os.path.join(self.test_dir, "view"))
+        self.assertTrue(copy_path.endswith(".xlsx"))
+        with open(copy_path, "rb") as fh:
+            self.assertEqual(fh.read(), self.contents[0])
+        self.assertFalse(os.stat(copy_path).st_mode & stat.S_IWUSR)
+        # Still stored; the copy is never written back
+        self.assertEqual(self._db_path(self.order_ids[0]), stored)
+
+    def test_failed_container_write_keeps_files(self):
+        self.storage._write_container = lambda *a: 1 / 0
+        self.assertEqual(self.storage.compact(older_than_days=0), 0)
+        for n in range(2):
+            self.assertTrue(os.path.exists(self.paths[n]))
+            self.assertEqual(self._db_path(self.order_ids[n]), self.paths[n])
+
+    def test_bundle_reads_from_cold_storage(self):
+        self.storage.compact(older_than_days=0)
+        bundle = os.path.join(self.test_dir, "bundle.zip")
+        manifest = DeliveryBundler(self.db, self.xlsx_mgr).build_bundle(bundle, self.order_ids[:2])
+        self.assertEqual(len(manifest["orders"]), 2)
+        self.assertEqual(verify_bundle(bundle), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
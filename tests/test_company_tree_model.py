@@ -0,0 +1,136 @@
+# tests/test_company_tree_model.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication, QTreeView
+from PyQt5.QtCore import QModelIndex
+from GUI.company_tree_model import CompanyTreeModel, CompanyTreeFilter
+from managers.db_manager import DatabaseManager
+
+
+class CountingDB:
+    """Wraps the DB manager to record which queries the tree makes."""
+
+    def __init__(self, db):
+        self.db = db
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.db, name)
+
+        def call(*args, **kwargs):
+            self.calls.append(name)
+            return method(*args, **kwargs)
+        return call
+
+
+class TestCompanyTreeModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_company("Acme", os.path.join(self.test_dir, "Acme"))
+        self.db.add_company("Globex", os.path.join(self.test_dir, "Globex"))
+        self.acme, self.globex = [c[0] for c in self.db.get_companies()]
+        self.db.add_board(self.acme, "PCB-100", os.path.join(self.test_dir, "Acme", "PCB-100"))
+        self.db.add_board(self.acme, "PCB-200", os.path.join(self.test_dir, "Acme", "PCB-200"))
+        self.board_100, self.board_200 = [b[0] for b in self.db.get_boards_by_company(self.acme)]
+        for n in range(5):
+            self.db.add_order(f"A{n}", self.acme, self.board_100, f"a{n}.xlsx", 1)
+        self.db.add_order("LOOSE", self.acme, None, "loose.xlsx", 1)
+        self.db.add_order("G0", self.globex, None, "g0.xlsx", 1)
+        self.db.archive_order(self.db.get_order_id_by_file("g0.xlsx"))
+
+        self.counting = CountingDB(self.db)
+        self.model = CompanyTreeModel(self.counting, page_size=2)
+        self.model.set_companies(self.db.get_companies(), self.db.get_company_order_counts())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def texts(self, parent):
+        return [self.model.index(r, 1, parent).data() for r in range(self.model.rowCount(parent))]
+
+    def test_badges_from_group_by(self):
+        self.assertEqual(self.db.get_company_order_counts(), {self.acme: (6, 6), self.globex: (1, 0)})
+        self.assertEqual(self.texts(QModelIndex()), ["6 orders (6 open)", "1 orders (0 open)"])
+        self.assertEqual(self.counting.calls, [])
+
+    def test_company_fetched_on_expand_and_orders_paged(self):
+        acme = self.model.index(0, 0)
+        self.assertTrue(self.model.hasChildren(acme))
+        self.assertEqual(self.model.rowCount(acme), 0)
+        self.assertTrue(self.model.canFetchMore(acme))
+        self.model.fetchMore(acme)
+        self.assertFalse(self.model.canFetchMore(acme))
+        self.assertEqual(self.texts(acme), ["PCB-100 (5)", "PCB-200 (0)", "Order: LOOSE [Pending]"])
+        self.assertFalse(self.model.hasChildren(self.model.index(1, 0, acme)))
+
+        board = self.model.index(0, 0, acme)
+        self.model.fetchMore(board)
+        self.assertEqual(self.texts(board), ["Order: A4 [Pending]", "Order: A3 [Pending]", "Show more… (3 not shown)"])
+        self.model.load_more(self.model.index(2, 0, board))
+        self.model.load_more(self.model.index(4, 0, board))
+        self.assertEqual([t.split()[1] for t in self.texts(board)], ["A4", "A3", "A2", "A1", "A0"])
+        self.assertEqual(self.counting.calls.count("get_orders_page"), 4)
+
+    def test_patches_keep_other_nodes(self):
+        acme = self.model.index(0, 0)
+        self.model.fetchMore(acme)
+        board = self.model.index(0, 0, acme)
+        self.model.fetchMore(board)
+        self.counting.calls.clear()
+
+        order_id = self.db.add_order("A5", self.acme, self.board_100, "a5.xlsx", 1)
+        self.model.insert_order(self.db.get_order(order_id))
+        self.assertEqual(self.texts(board)[0], "Order: A5 [Pending]")
+        self.assertEqual(self.model.index(0, 1, acme).data(), "PCB-100 (6)")
+        self.model.update_order(order_id, "Archived")
+        self.assertEqual(self.texts(board)[0], "Order: A5 [Archived]")
+        self.db.delete_order_permanently(order_id)
+        self.model.remove_order(order_id)
+        self.assertEqual(self.texts(board)[0], "Order: A4 [Pending]")
+
+        self.model.insert_board(self.acme, 99, "PCB-900")
+        self.model.rename_board(self.acme, 99, "PCB-901")
+        self.assertEqual(self.texts(acme)[2], "PCB-901 (0)")
+        self.model.set_counts({self.acme: (7, 6)})
+        self.assertEqual(self.texts(QModelIndex()), ["7 orders (6 open)", "0 orders (0 open)"])
+        self.assertEqual(self.counting.calls, [])
+
+        self.model.insert_company((5, "Initech"))
+        self.model.remove_company(self.globex)
+        self.assertEqual([self.model.index(r, 0).data() for r in range(2)], ["Acme", "Initech"])
+        self.model.reload_company(self.acme)
+        self.assertEqual(self.texts(acme), ["PCB-100 (5)", "PCB-200 (0)", "Order: LOOSE [Pending]"])
+
+    def test_filter_matches_names_and_ancestors(self):
+        proxy = CompanyTreeFilter(self.model)
+        view = QTreeView()
+        view.setModel(proxy)
+        proxy.fetchMore(proxy.index(0, 0))
+        proxy.set_search(" glob ")
+        self.assertEqual(proxy.rowCount(), 1)
+        self.assertEqual(proxy.index(0, 0).data(), "Globex")
+        proxy.set_search("pcb-1")
+        acme = proxy.index(0, 0)
+        self.assertEqual((proxy.rowCount(), acme.data()), (1, "Acme"))
+        self.assertEqual(proxy.rowCount(acme), 1)
+        proxy.set_search("acme")
+        self.assertEqual(proxy.rowCount(proxy.index(0, 0)), 3)
+
+        view.expand(proxy.index(0, 0))
+        self.assertEqual(self.model.expanded_company_ids(view, proxy), [self.acme])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
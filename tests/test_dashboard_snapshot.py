@@ -0,0 +1,134 @@
+# tests/test_dashboard_snapshot.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication
+from GUI.background import LoadJob
+from managers.dashboard_snapshot import DashboardSnapshot, file_stamp
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+from tests.test_background_loader import settle
+
+
+class TestDashboardSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.snapshot = DashboardSnapshot(cache_dir=self.test_dir)
+        self.db_path = os.path.join(self.test_dir, "test.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        orders = [(1, "A1", "Acme", "N/A", "Active", "/x/a1.xlsx", 10, 123)]
+        companies = [(7, "Acme", 1, 1)]
+        self.assertTrue(self.snapshot.save(self.db_path, orders, companies))
+        self.assertFalse(os.path.exists(self.snapshot.path + ".tmp"))
+        loaded = self.snapshot.load(self.db_path)
+        self.assertEqual(loaded["orders"], orders)
+        self.assertEqual(loaded["companies"], companies)
+        self.assertIsNotNone(loaded["saved_at"])
+
+    def test_other_database_or_corrupt_file_ignored(self):
+        self.assertIsNone(self.snapshot.load(self.db_path))
+        self.snapshot.save(self.db_path, [], [])
+        self.assertIsNone(self.snapshot.load(os.path.join(self.test_dir, "other.db")))
+        with open(self.snapshot.path, "w") as f:
+            f.write("{not json")
+        self.assertIsNone(self.snapshot.load(self.db_path))
+
+    def test_file_stamp(self):
+        self.assertIsNone(file_stamp(os.path.join(self.test_dir, "missing.xlsx")))
+        self.assertIsNone(file_stamp(None))
+        with open(self.db_path, "w") as f:
+            f.write("abc")
+        self.assertEqual(file_stamp(self.db_path)[0], 3)
+
+
+class TestAdminWarmStart(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("ws_admin", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("ws_admin", "password123")[0]
+        company_id = self.db.add_company("Warm Co", os.path.join(self.test_dir, "WarmCo"))
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.files = []
+        for n in range(3):
+            file_path, _ = self.xlsx_mgr.create_order_file(order_number=f"WS{n}", created_by=self.user_id,
+                                                           user_id=self.user_id, company_id=company_id,
+                                                           serial_prefix=f"WS{n}-", serial_count=2)
+            self.files.append(file_path)
+        self.order_ids = [self.db.get_order_id_by_file(f) for f in self.files]
+        self.snapshot = DashboardSnapshot(cache_dir=os.path.join(self.test_dir, "cache"))
+        self.windows = []
+
+    def tearDown(self):
+        for window in self.windows:
+            window.loader.cancel_all()
+            window.loader.wait(5000)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def open_window(self):
+        from GUI.admin_window import AdminWindow
+        window = AdminWindow("ws_admin", self.user_id, self.db, self.xlsx_mgr, dashboard_snapshot=self.snapshot)
+        self.windows.append(window)
+        return window
+
+    def statuses(self, window):
+        return [window.await_model.value(r, 4) for r in range(window.await_model.rowCount())]
+
+    def test_saved_dashboard_shown_then_only_changed_orders_rescanned(self):
+        first = self.open_window()
+        first.save_snapshot()
+        self.assertIsNone(self.snapshot.load(self.db.full_db_path))
+        for index in (1, 3):
+            first.show_panel(index)
+            settle(self.app, first.loader)
+        self.assertTrue(first.snapshot_label.isHidden())
+        first.save_snapshot()
+        self.assertEqual(self.statuses(first), ["Pending", "Pending", "Pending"])
+
+        # A serial tested on the last order between sessions
+        self.xlsx_mgr.update_order_rows(self.files[2], {2: {"pass_fail": "Pass",
+                                                            "timestamp": "Oct 01, 2025 09:00 AM"}})
+
+        second = self.open_window()
+        second.show_panel(1)
+        second.show_panel(3)
+        # Shown from the snapshot before any load has finished
+        self.assertEqual(self.statuses(second), ["Pending", "Pending", "Pending"])
+        self.assertFalse(second.snapshot_label.isHidden())
+        self.assertEqual(second.company_tree_model.companies(), [(self.db.get_companies()[0][0], "Warm Co", 3, 3)])
+
+        rows, keys, scans, files = second._fetch_awaiting_orders(LoadJob("t", None, None),
+                                                                 dict(second._order_state))
+        self.assertEqual(scans, [(self.order_ids[2], self.files[2])])
+        self.assertEqual(len(files), 3)
+
+        settle(self.app, second.loader)
+        self.assertTrue(second.snapshot_label.isHidden())
+        self.assertEqual(self.statuses(second), ["Pending", "Pending", "Active"])
+        second.save_snapshot()
+
+        # Panels not opened in a session keep what was saved before
+        third = self.open_window()
+        third.show_panel(1)
+        settle(self.app, third.loader)
+        third.save_snapshot()
+        self.assertEqual([o[4] for o in self.snapshot.load(self.db.full_db_path)["orders"]],
+                         ["Pending", "Pending", "Active"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
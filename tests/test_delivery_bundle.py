@@ -0,0 +1,80 @@
+# tests/test_delivery_bundle.py
+import unittest
+import os
+import sys
+import json
+import hashlib
+import zipfile
+from datetime import date
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from managers.delivery_bundle import DeliveryBundler, BundleError, verify_bundle, MANIFEST_NAME
+from tests.order_fixtures import OrderTestCase, TS
+
+
+class TestDeliveryBundle(OrderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.order_ids = [
+            self.make_order(f"BND{n}", 2, results={2: {"pass_fail": "Pass", "timestamp": TS}})[1]
+            for n in range(3)
+        ]
+        self.bundler = DeliveryBundler(self.db, self.xlsx_mgr, workers=2)
+        self.bundle_path = os.path.join(self.test_dir, "out", "bundle.zip")
+
+    def test_select_orders(self):
+        self.assertEqual(self.bundler.select_orders(company_id=self.company_id), [])
+        for order_id in self.order_ids[:2]:
+            self.db.archive_order(order_id)
+        self.assertEqual(self.bundler.select_orders(company_id=self.company_id), self.order_ids[:2])
+        self.assertEqual(self.bundler.select_orders(company_id=self.company_id, end=date(2000, 1, 1)), [])
+        self.assertEqual(self.bundler.select_orders(order_ids=[self.order_ids[2]]), [self.order_ids[2]])
+
+    def test_bundle_contents_and_manifest(self):
+        manifest = self.bundler.build_bundle(self.bundle_path, self.order_ids)
+
+        with zipfile.ZipFile(self.bundle_path) as zf:
+            self.assertEqual(json.loads(zf.read(MANIFEST_NAME)), manifest)
+            for entry in manifest["orders"]:
+                data = zf.read(entry["member"])
+                details = self.db.get_order_details(entry["order_id"])
+                with open(details[3], "rb") as fh:
+                    self.assertEqual(data, fh.read())
+                self.assertEqual(entry["sha256"], hashlib.sha256(data).hexdigest())
+                self.assertEqual(entry["counts"], {"total": 2, "pass": 1, "fail": 0, "pending": 1})
+        self.assertEqual(verify_bundle(self.bundle_path), [])
+
+    def test_verify_detects_tampering(self):
+        self.bundler.build_bundle(self.bundle_path, self.order_ids)
+        tampered = os.path.join(self.test_dir, "tampered.zip")
+        with zipfile.ZipFile(self.bundle_path) as src, zipfile.ZipFile(tampered, "w") as dst:
+            for info in src.infolist():
+                data = src.read(info.filename)
+                if info.filename == "orders/BND1.xlsx":
+                    data += b"x"
+                if info.filename != "orders/BND2.xlsx":
+                    dst.writestr(info, data)
+
+        problems = verify_bundle(tampered)
+        self.assertEqual(sorted(problems), ["orders/BND1.xlsx does not match the manifest",
+                                            "orders/BND2.xlsx missing"])
+
+    def test_missing_file_leaves_no_bundle(self):
+        os.remove(self.db.get_order_details(self.order_ids[1])[3])
+        with self.assertRaises(BundleError):
+            self.bundler.build_bundle(self.bundle_path, self.order_ids)
+        self.assertFalse(os.path.exists(self.bundle_path))
+
+    def test_unreadable_file_fails_cleanly(self):
+        path = self.db.get_order_details(self.order_ids[1])[3]
+        os.remove(path)
+        os.makedirs(path)  # exists, but cannot be read
+        with self.assertRaises(BundleError):
+            self.bundler.build_bundle(self.bundle_path, self.order_ids)
+        self.assertEqual(os.listdir(os.path.dirname(self.bundle_path)), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,77 @@
+# tests/test_delta_export.py
+import unittest
+import os
+import sys
+import csv
+import json
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import load_workbook
+from managers.delta_export import DeltaExporter, DeliveryConflict
+from tests.order_fixtures import OrderTestCase, TS
+
+
+class TestDeltaExport(OrderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.out_dir = os.path.join(self.test_dir, "out")
+        self.file_path, self.order_id = self.make_order("DLT1", 4, serial_prefix="DLT-")
+        self.exporter = DeltaExporter(self.db, self.xlsx_mgr)
+
+    def _csv_serials(self, path):
+        with open(path, newline="", encoding="utf-8") as fh:
+            return [row[0] for row in list(csv.reader(fh))[1:]]
+
+    def test_only_changes_since_last_delivery(self):
+        path, count = self.exporter.export_changes(self.order_id, dest_dir=self.out_dir)
+        self.assertEqual(count, 4)  # first delivery has every serial
+
+        self.assertEqual(self.exporter.export_changes(self.order_id, dest_dir=self.out_dir), (None, 0))
+
+        self.xlsx_mgr.update_order_rows(self.file_path, {3: {"pass_fail": "Pass", "timestamp": TS}})
+        self.xlsx_mgr.update_order_rows(self.file_path, {5: {"pass_fail": "Fail", "timestamp": TS}})
+        path, count = self.exporter.export_changes(self.order_id, dest_dir=self.out_dir)
+        self.assertEqual(count, 2)
+        self.assertEqual(self._csv_serials(path), ["DLT-00002", "DLT-00004"])
+
+    def test_jsonl_and_xlsx(self):
+        self.exporter.export_changes(self.order_id, dest_dir=self.out_dir)
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"operator": "op1", "pass_fail": "Pass", "timestamp": TS}})
+        path, _ = self.exporter.export_changes(self.order_id, fmt="jsonl", dest_dir=self.out_dir)
+        with open(path, encoding="utf-8") as fh:
+            records = [json.loads(line) for line in fh]
+        self.assertEqual(records, [{"serial": "DLT-00001", "operator": "op1", "pass_fail": "Pass",
+                                    "timestamp": TS, "failure": None, "fix": None}])
+
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"fix": "reworked"}})
+        path, _ = self.exporter.export_changes(self.order_id, fmt="xlsx", dest_dir=self.out_dir)
+        rows = list(load_workbook(path).active.iter_rows(values_only=True))
+        self.assertEqual(rows[1][0], "DLT-00001")
+        self.assertEqual(rows[1][-1], "reworked")
+
+    def test_watermark_kept_when_write_fails(self):
+        self.exporter._write_csv = lambda fh, rows: 1 / 0
+        with self.assertRaises(ZeroDivisionError):
+            self.exporter.export_changes(self.order_id, dest_dir=self.out_dir)
+        self.assertEqual(self.db.get_delivery_watermark(self.company_id, self.order_id)[0], 0)
+        self.assertEqual(os.listdir(self.out_dir), [])
+
+    def test_concurrent_delivery_conflict(self):
+        since = self.db.get_delivery_watermark(self.company_id, self.order_id)[0]
+        self.assertTrue(self.db.advance_delivery_watermark(self.company_id, self.order_id, since, 1, "other.csv"))
+        self.assertFalse(self.db.advance_delivery_watermark(self.company_id, self.order_id, since, 1, "mine.csv"))
+
+        # An export racing with another station's does not leave its file behind
+        original = self.db.advance_delivery_watermark
+        self.db.advance_delivery_watermark = lambda *a: False
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"pass_fail": "Pass", "timestamp": TS}})
+        with self.assertRaises(DeliveryConflict):
+            self.exporter.export_changes(self.order_id, dest_dir=self.out_dir)
+        self.assertEqual(os.listdir(self.out_dir), [])
+        self.db.advance_delivery_watermark = original
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,101 @@
+# tests/test_file_lock.py
+import unittest
+import tempfile
+import os
+import sys
+import json
+import time
+import shutil
+import threading
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from managers.file_lock import FileLockManager, LockTimeout
+
+
+class TestFileLockManager(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.test_dir, "ORD1.xlsx")
+        self.lock_path = FileLockManager.lock_path(self.file_path)
+        self.locks = FileLockManager(owner="tester", timeout=0.5, stale_after=30,
+                                     base_delay=0.01, max_delay=0.05)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _foreign_lock(self):
+        """Lock file left by another station"""
+        with open(self.lock_path, "w", encoding="utf-8") as fh:
+            json.dump({"owner": "op2", "host": "STATION-2", "pid": 1, "token": "other"}, fh)
+
+    def test_lock_file_lifecycle(self):
+        with self.locks.locked(self.file_path):
+            with open(self.lock_path, encoding="utf-8") as fh:
+                info = json.load(fh)
+            self.assertEqual(info["owner"], "tester")
+            # Re-entrant for the same thread
+            with self.locks.locked(self.file_path):
+                pass
+            self.assertTrue(os.path.exists(self.lock_path))
+        self.assertFalse(os.path.exists(self.lock_path))
+        self.assertEqual(self.locks.stats()["acquisitions"], 1)
+
+    def test_conflict_times_out(self):
+        self._foreign_lock()
+        with self.assertRaises(LockTimeout) as ctx:
+            with self.locks.locked(self.file_path):
+                pass
+        self.assertIn("op2", str(ctx.exception))
+        stats = self.locks.stats()
+        self.assertEqual(stats["conflicts"], 1)
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertTrue(os.path.exists(self.lock_path))
+
+    def test_stale_lock_recovered(self):
+        self._foreign_lock()
+        old = time.time() - 120
+        os.utime(self.lock_path, (old, old))
+        with self.locks.locked(self.file_path):
+            with open(self.lock_path, encoding="utf-8") as fh:
+                self.assertEqual(json.load(fh)["owner"], "tester")
+        self.assertEqual(self.locks.stats()["stale_recoveries"], 1)
+
+    def test_waiters_are_serialized(self):
+        locks = FileLockManager(owner="tester", timeout=5, base_delay=0.01, max_delay=0.05)
+        inside = []
+        overlaps = []
+
+        def worker():
+            with locks.locked(self.file_path):
+                if inside:
+                    overlaps.append(True)
+                inside.append(True)
+                time.sleep(0.02)
+                inside.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(overlaps, [])
+        self.assertEqual(locks.stats()["acquisitions"], 5)
+
+    def test_retry_io_backs_off(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(True)
+            if len(attempts) < 3:
+                raise PermissionError(5, "Access is denied")
+            return "done"
+
+        self.assertEqual(self.locks.retry_io(flaky, self.file_path), "done")
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual(self.locks.stats()["conflicts"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -92,6 +92,38 @@ class TestGUIValidation(unittest.TestCase):
         self.assertTrue(ok)
         self.assertEqual(self.window.current_serial, present_sn)
 
+    def test_order_switch_waits_only_for_current_order(self):
+        from managers.result_journal import ResultJournal
+        journal = ResultJournal(self.xlsx_mgr, journal_dir=os.path.join(self.test_dir, "cache"))
+        window = UserWindow("test_user", self.user_id, self.db, self.xlsx_mgr, result_journal=journal)
+        self.assertTrue(window.flush_timer.isActive())
+        window.order_input.setText(self.order_number)
+        window.load_order_info()
+        # A result for an order on a share that is offline right now
+        offline = os.path.join(self.test_dir, "offline", "other.xlsx")
+        journal.record(offline, 2, {"pass_fail": "Pass"})
+        journal.record(self.file_path, 2, {"pass_fail": "Pass"})
+
+        window.load_order_info()
+        self.assertEqual(window.current_order_file, self.file_path)
+        self.assertEqual(journal.pending_count(self.file_path), 0)
+        self.assertEqual(journal.pending_count(offline), 1)
+        window.flush_timer.stop()
+
+    def test_quarantined_results_reported_not_saved(self):
+        from unittest import mock
+        from managers.result_journal import ResultJournal
+        journal = ResultJournal(self.xlsx_mgr, journal_dir=os.path.join(self.test_dir, "cache"))
+        window = UserWindow("test_user", self.user_id, self.db, self.xlsx_mgr, result_journal=journal)
+        window.flush_timer.stop()
+        journal.record(os.path.join(self.test_dir, "deleted.xlsx"), 2, {"pass_fail": "Pass"})
+
+        with mock.patch("GUI.standard_user_window.QMessageBox.critical") as critical:
+            self.assertFalse(window.flush_pending_results())
+        critical.assert_called_once()
+        self.assertIn("NOT saved", window.save_status_label.text())
+        self.assertTrue(window.flush_pending_results())
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+# tests/test_order_mirror.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+from unittest import mock
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import load_workbook
+from managers.order_mirror import OrderMirror
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+
+
+class TestOrderMirror(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.share = os.path.join(self.test_dir, "share")
+        os.makedirs(self.share)
+        self.mirror = OrderMirror(mirror_dir=os.path.join(self.test_dir, "mirror"), max_bytes=250)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _remote(self, name, content):
+        path = os.path.join(self.share, name)
+        with open(path, "wb") as fh:
+            fh.write(content)
+        return path
+
+    def _copy(self, path):
+        return self.mirror._local_path(self.mirror._key(path))
+
+    def test_hit_until_remote_changes(self):
+        path = self._remote("A.xlsx", b"a" * 100)
+        self.assertEqual(self.mirror.read(path), (b"a" * 100, OrderMirror.remote_fingerprint(path)))
+        self.assertNotEqual(self._copy(path), path)
+        self.assertEqual(self.mirror.read(path)[0], b"a" * 100)
+        self.assertEqual(self.mirror.stats()["hits"], 1)
+
+        self._remote("A.xlsx", b"b" * 120)
+        data, fp = self.mirror.read(path)
+        self.assertEqual(data, b"b" * 120)
+        self.assertEqual(fp[0], 120)
+        self.assertEqual(self.mirror.stats()["misses"], 2)
+
+    def test_lru_eviction(self):
+        a = self._remote("A.xlsx", b"a" * 100)
+        b = self._remote("B.xlsx", b"b" * 100)
+        c = self._remote("C.xlsx", b"c" * 100)
+        self.mirror.read(a)
+        self.mirror.read(b)
+        self.mirror.read(a)  # A is now more recent than B
+        self.mirror.read(c)
+
+        self.assertTrue(os.path.exists(self._copy(a)))
+        self.assertFalse(os.path.exists(self._copy(b)))
+
+    def test_eviction_skips_copy_in_use(self):
+        a = self._remote("A.xlsx", b"a" * 100)
+        b = self._remote("B.xlsx", b"b" * 100)
+        c = self._remote("C.xlsx", b"c" * 100)
+        self.mirror.read(a)
+        self.mirror.read(b)
+        real_remove = os.remove
+
+        def remove(path):
+            if path == self._copy(a):
+                raise PermissionError("in use by another process")
+            real_remove(path)
+
+        with mock.patch("managers.order_mirror.os.remove", side_effect=remove):
+            self.mirror.read(c)
+        # A could not go, so B (next least recently used) went instead; A goes once it is free
+        self.assertTrue(os.path.exists(self._copy(a)))
+        self.assertEqual(self.mirror.read(b)[0], b"b" * 100)
+        self.assertFalse(os.path.exists(self._copy(a)))
+
+    def test_store_refreshes_copy(self):
+        path = self._remote("A.xlsx", b"old")
+        self.mirror.read(path)
+        self._remote("A.xlsx", b"new bytes")
+        self.mirror.store(path, b"new bytes")
+        self.assertEqual(self.mirror.read(path)[0], b"new bytes")
+        self.assertEqual(self.mirror.stats()["hits"], 1)
+
+
+class TestMirroredXLSXManager(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        self.company_id = self.db.get_companies()[0][0]
+        self.mirror = OrderMirror(mirror_dir=os.path.join(self.test_dir, "mirror"))
+        self.xlsx_mgr = XLSXManager(self.db, mirror=self.mirror)
+        self.file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number="MIR1",
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix="MIR-",
+            serial_count=2,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_reads_and_write_through(self):
+        self.assertEqual(self.xlsx_mgr.scan_order_file(self.file_path)["pending_count"], 2)
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"pass_fail": "Pass", "timestamp": "Oct 01, 2025 09:00 AM"}})
+
+        # The write went to the share and the mirror serves the new version without a copy
+        self.assertEqual(load_workbook(self.file_path).active.cell(row=2, column=7).value, "Pass")
+        misses = self.mirror.stats()["misses"]
+        scan = self.xlsx_mgr.scan_order_file(self.file_path)
+        self.assertEqual((scan["pass_count"], scan["pending_count"]), (1, 1))
+        self.assertEqual(self.mirror.stats()["misses"], misses)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
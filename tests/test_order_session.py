@@ -0,0 +1,120 @@
+# tests/test_order_session.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import load_workbook
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+
+
+class TestOrderSession(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        self.company_id = self.db.get_companies()[0][0]
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number="SESS1",
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix="SESS-",
+            serial_count=3,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_row_model(self):
+        session = self.xlsx_mgr.open_session(self.file_path)
+        self.assertEqual(sorted(session.rows), [2, 3, 4])
+        self.assertEqual(session.rows[3][session.layout["serial"]], "SESS-00002")
+        self.assertEqual(session.rows[3][session.layout["pass_fail"]], "Pending")
+
+    def test_write_reuses_memory_copy(self):
+        session = self.xlsx_mgr.open_session(self.file_path)
+        loads = []
+        original_load = session.load
+        session.load = lambda: (loads.append(True), original_load())
+
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"pass_fail": "Pass"}})
+        self.xlsx_mgr.update_order_rows(self.file_path, {3: {"pass_fail": "Fail"}})
+
+        self.assertEqual(loads, [])
+        with open(self.file_path, "rb") as fh:
+            self.assertEqual(fh.read(), session.data)
+        self.assertEqual(session.rows[3][session.layout["pass_fail"]], "Fail")
+        ws = load_workbook(self.file_path).active
+        self.assertEqual(ws.cell(row=2, column=7).value, "Pass")
+        self.assertEqual(ws.cell(row=3, column=7).value, "Fail")
+
+    def test_external_change_is_picked_up(self):
+        session = self.xlsx_mgr.open_session(self.file_path)
+
+        # Another station writes row 4 behind our back
+        wb = load_workbook(self.file_path)
+        wb.active.cell(row=4, column=7).value = "Pass"
+        wb.save(self.file_path)
+
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"pass_fail": "Fail"}})
+        self.assertEqual(session.external_reloads, 1)
+        ws = load_workbook(self.file_path).active
+        self.assertEqual(ws.cell(row=4, column=7).value, "Pass")
+        self.assertEqual(ws.cell(row=2, column=7).value, "Fail")
+
+    def test_concurrent_stations_merge(self):
+        """Two stations with their own sessions saving different serials keep both results"""
+        station_b = XLSXManager(self.db)
+        session_a = self.xlsx_mgr.open_session(self.file_path)
+        session_b = station_b.open_session(self.file_path)
+
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"operator": "op_a", "pass_fail": "Pass"}})
+        station_b.update_order_rows(self.file_path, {3: {"operator": "op_b", "pass_fail": "Fail"}})
+
+        ws = load_workbook(self.file_path).active
+        self.assertEqual((ws.cell(row=2, column=3).value, ws.cell(row=2, column=7).value), ("op_a", "Pass"))
+        self.assertEqual((ws.cell(row=3, column=3).value, ws.cell(row=3, column=7).value), ("op_b", "Fail"))
+        self.assertEqual(session_b.take_external_rows(), {2})
+        self.assertEqual(session_b.take_conflicts(), [])
+
+        # Station A sees B's row on its next save
+        self.xlsx_mgr.update_order_rows(self.file_path, {4: {"pass_fail": "Pass"}})
+        self.assertEqual(session_a.take_external_rows(), {3})
+        self.assertEqual(session_a.value(3, "pass_fail"), "Fail")
+
+    def test_same_serial_conflict_flagged(self):
+        station_b = XLSXManager(self.db)
+        session_a = self.xlsx_mgr.open_session(self.file_path)
+        station_b.open_session(self.file_path)
+
+        station_b.update_order_rows(self.file_path, {2: {"operator": "op_b", "pass_fail": "Fail"}})
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"operator": "op_a", "pass_fail": "Pass"}})
+
+        conflicts = session_a.take_conflicts()
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0]["serial"], "SESS-00001")
+        self.assertEqual(conflicts[0]["theirs"]["pass_fail"], "Fail")
+        self.assertEqual(conflicts[0]["theirs"]["operator"], "op_b")
+        self.assertEqual(conflicts[0]["ours"]["pass_fail"], "Pass")
+        self.assertEqual(conflicts[0]["ours"]["operator"], "op_a")
+        self.assertEqual(load_workbook(self.file_path).active.cell(row=2, column=7).value, "Pass")
+
+    def test_closed_session_not_used(self):
+        self.xlsx_mgr.open_session(self.file_path)
+        self.xlsx_mgr.close_session(self.file_path)
+        self.assertIsNone(self.xlsx_mgr.get_session(self.file_path))
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"pass_fail": "Pass"}})
+        self.assertEqual(load_workbook(self.file_path).active.cell(row=2, column=7).value, "Pass")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+# tests/test_order_watcher.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtTest import QTest
+from GUI.order_watcher import OrderWatcher
+from managers.db_manager import DatabaseManager
+from managers.dashboard_snapshot import file_stamp
+from tests.test_background_loader import settle
+
+
+class TestOrderWatcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        company_id = self.db.add_company("Acme", os.path.join(self.test_dir, "Acme"))
+        self.files = {}
+        for n in range(3):
+            file_path = os.path.join(self.test_dir, f"order{n}.xlsx")
+            with open(file_path, "w") as f:
+                f.write("v1")
+            self.files[self.db.add_order(f"W{n}", company_id, None, file_path, 1)] = file_path
+        self.order_ids = list(self.files)
+        self.watcher = OrderWatcher(self.db, file_poll_ms=100, db_poll_ms=100, debounce_ms=50)
+        self.changed = []
+        self.watcher.orders_changed.connect(self.changed.append)
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def touch(self, order_id, text):
+        with open(self.files[order_id], "w") as f:
+            f.write(text)
+
+    def start(self):
+        self.watcher.start()
+        # The first polls record where the files and the DB stand
+        settle(self.app, self.watcher.loader)
+
+    def save_result(self, order_id, serial):
+        self.db.save_serial_results(order_id, [(serial, 2, "op", "Pass", "Oct 01, 2025 09:00 AM", "", "")])
+
+    def test_file_saves_debounced_into_one_notification(self):
+        self.watcher.watch(self.files.items())
+        self.start()
+        self.touch(self.order_ids[0], "v22")
+        self.touch(self.order_ids[2], "v22")
+        self.watcher.poll_files()
+        self.touch(self.order_ids[0], "v333")
+        QTest.qWait(400)
+        self.assertEqual(self.changed, [[self.order_ids[0], self.order_ids[2]]])
+
+    def test_db_result_writes_for_watched_orders(self):
+        self.watcher.watch([(o, self.files[o]) for o in self.order_ids[:2]])
+        self.start()
+        self.save_result(self.order_ids[1], "SN-1")
+        self.save_result(self.order_ids[2], "SN-2")  # not watched
+        QTest.qWait(400)
+        self.assertEqual(self.changed, [[self.order_ids[1]]])
+
+        self.watcher.unwatch(self.order_ids[1])
+        self.save_result(self.order_ids[1], "SN-3")
+        QTest.qWait(300)
+        self.assertEqual(len(self.changed), 1)
+
+    def test_changes_while_stopped_reported_on_start(self):
+        self.watcher.watch(self.files.items())
+        self.start()
+        self.watcher.stop()
+        self.touch(self.order_ids[1], "changed")
+        self.save_result(self.order_ids[2], "SN-1")
+        QTest.qWait(300)
+        self.assertEqual(self.changed, [])
+        self.watcher.start()
+        QTest.qWait(300)
+        self.assertEqual(self.changed, [[self.order_ids[1], self.order_ids[2]]])
+
+    def test_change_after_scanned_stamp_reported(self):
+        """A save between the caller's scan and the first poll is not taken as the baseline"""
+        self.watcher.watch(self.files.items())
+        self.watcher.mark_seen(self.order_ids[0], file_stamp(self.files[self.order_ids[0]]))
+        self.touch(self.order_ids[0], "saved after the scan")
+        self.touch(self.order_ids[1], "never scanned")
+        self.start()
+        QTest.qWait(300)
+        self.assertEqual(self.changed, [[self.order_ids[0]]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
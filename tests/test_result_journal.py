@@ -0,0 +1,156 @@
+# tests/test_result_journal.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import json
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import load_workbook
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+from managers.result_journal import ResultJournal
+
+
+class TestResultJournal(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        self.company_id = self.db.get_companies()[0][0]
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number="JRNL1",
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix="JRNL-",
+            serial_count=3,
+        )
+        self.journal_dir = os.path.join(self.test_dir, "cache")
+        self.journal = ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir, max_unflushed=3)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _cell(self, row, col):
+        return load_workbook(self.file_path).active.cell(row=row, column=col).value
+
+    def test_record_does_not_touch_order_file(self):
+        mtime = os.stat(self.file_path).st_mtime_ns
+        self.assertFalse(self.journal.record(self.file_path, 2, {"pass_fail": "Pass"}))
+        self.assertEqual(os.stat(self.file_path).st_mtime_ns, mtime)
+        self.assertEqual(self.journal.pending_count(), 1)
+
+    def test_flush_coalesces_rows(self):
+        """Several results for the same row end up as one merged write"""
+        self.journal.record(self.file_path, 2, {"pass_fail": "Fail", "failure": "short"})
+        self.assertFalse(self.journal.record(self.file_path, 2, {"pass_fail": "Pass", "fix": "reflowed"}))
+        self.assertEqual(self.journal.pending_rows(self.file_path),
+                         {2: {"pass_fail": "Pass", "failure": "short", "fix": "reflowed"}})
+
+        self.assertEqual(self.journal.flush(), 2)
+        self.assertEqual(self._cell(2, 7), "Pass")
+        self.assertEqual(self._cell(2, 9), "short")
+        self.assertEqual(self._cell(2, 10), "reflowed")
+        self.assertEqual(self.journal.pending_count(), 0)
+        self.assertEqual(os.path.getsize(self.journal.journal_path), 0)
+
+    def test_max_unflushed_signals_flush(self):
+        self.journal.record(self.file_path, 2, {"pass_fail": "Pass"})
+        self.journal.record(self.file_path, 3, {"pass_fail": "Pass"})
+        self.assertTrue(self.journal.record(self.file_path, 4, {"pass_fail": "Pass"}))
+
+    def test_replay_after_crash(self):
+        """Entries journaled by a session that never flushed are written on next launch"""
+        self.journal.record(self.file_path, 3, {"operator": "op1", "pass_fail": "Pass"})
+        # Simulate a crash mid-append of the next entry
+        with open(self.journal.journal_path, "a", encoding="utf-8") as fh:
+            fh.write('{"file": "torn')
+
+        restarted = ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir)
+        self.assertEqual(restarted.pending_count(), 1)
+        restarted.record(self.file_path, 4, {"pass_fail": "Fail"})
+        self.assertEqual(ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir).pending_count(), 2)
+
+        self.assertEqual(restarted.replay(), 2)
+        self.assertEqual(self._cell(3, 3), "op1")
+        self.assertEqual(self._cell(4, 7), "Fail")
+        self.assertEqual(self._cell(3, 7), "Pass")
+
+    def _quarantined(self):
+        with open(self.journal.quarantine_path, encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh]
+
+    def test_missing_order_file_quarantined(self):
+        """A deleted or moved order file doesn't hold up the other files"""
+        missing = os.path.join(self.test_dir, "missing.xlsx")
+        self.journal.record(missing, 2, {"pass_fail": "Pass"})
+        self.journal.record(self.file_path, 2, {"pass_fail": "Pass"})
+
+        self.assertEqual(self.journal.flush(), 1)
+        self.assertEqual(self._cell(2, 7), "Pass")
+        self.assertEqual(self.journal.pending_count(), 0)
+        self.assertEqual(ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir).pending_count(), 0)
+        self.assertEqual([(e["file"], e["row"]) for e in self._quarantined()], [(missing, 2)])
+        # Reported once, so the operator is never told everything was saved
+        self.assertEqual(self.journal.take_quarantined(), [(missing, 1, "order file no longer exists")])
+        self.assertEqual(self.journal.take_quarantined(), [])
+
+    def test_failing_file_kept_until_it_saves(self):
+        """Errors other than a missing file (e.g. a flaky share) are retried, never quarantined"""
+        journal = ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir)
+        journal.record(self.file_path, 3, {"pass_fail": "Fail"})
+        original = self.xlsx_mgr.update_order_rows
+
+        def share_error(*args, **kwargs):
+            raise OSError("The specified network name is no longer available")
+
+        self.xlsx_mgr.update_order_rows = share_error
+        for _ in range(15):
+            self.assertEqual(journal.flush(), 0)
+        self.assertEqual(journal.pending_count(), 1)
+        self.assertEqual(journal.take_quarantined(), [])
+        self.assertFalse(os.path.exists(journal.quarantine_path))
+
+        self.xlsx_mgr.update_order_rows = original
+        self.assertEqual(journal.flush(), 1)
+        self.assertEqual(self._cell(3, 7), "Fail")
+
+    def test_replay_with_short_timeout(self):
+        self.journal.record(self.file_path, 2, {"pass_fail": "Pass"})
+        with open(self.xlsx_mgr.lock_manager.lock_path(self.file_path), "w") as fh:
+            json.dump({"owner": "other", "host": "bench2", "token": "x"}, fh)
+        journal = ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir)
+        started = time.monotonic()
+        self.assertEqual(journal.replay(timeout=0.2), 0)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(journal.pending_count(), 1)
+
+    def test_busy_file_gives_up_quickly_and_is_never_quarantined(self):
+        journal = ResultJournal(self.xlsx_mgr, journal_dir=self.journal_dir)
+        journal.record(self.file_path, 2, {"pass_fail": "Pass"})
+        # Another station holds the order file's lock
+        with open(self.xlsx_mgr.lock_manager.lock_path(self.file_path), "w") as fh:
+            json.dump({"owner": "other", "host": "bench2", "token": "x"}, fh)
+
+        started = time.monotonic()
+        for _ in range(3):
+            self.assertEqual(journal.flush(self.file_path, timeout=0.2), 0)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(journal.pending_count(), 1)
+        self.assertFalse(os.path.exists(journal.quarantine_path))
+
+        os.remove(self.xlsx_mgr.lock_manager.lock_path(self.file_path))
+        self.assertEqual(journal.flush(self.file_path, timeout=0.2), 1)
+        self.assertEqual(self._cell(2, 7), "Pass")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
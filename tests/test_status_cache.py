@@ -0,0 +1,59 @@
+# tests/test_status_cache.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from managers.status_cache import StatusCache
+
+
+class TestStatusCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = StatusCache(cache_dir=os.path.join(self.test_dir, "cache"))
+        self.file_path = os.path.join(self.test_dir, "ORD1.xlsx")
+        with open(self.file_path, "wb") as fh:
+            fh.write(b"first version")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_hit_for_unchanged_file(self):
+        """Stored fields are returned while the file is unchanged"""
+        self.assertIsNone(self.cache.get(self.file_path, "ready"))
+        self.cache.put(self.file_path, ready=True)
+        self.cache.put(self.file_path, status=["Complete", 2, 0, 0, 2])
+
+        self.assertTrue(self.cache.get(self.file_path, "ready"))
+        self.assertEqual(self.cache.get(self.file_path, "status"), ["Complete", 2, 0, 0, 2])
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_changed_file_misses(self):
+        """A size/mtime change invalidates the entry"""
+        self.cache.put(self.file_path, ready=True)
+        with open(self.file_path, "wb") as fh:
+            fh.write(b"second, longer version")
+        self.assertIsNone(self.cache.get(self.file_path, "ready"))
+
+    def test_invalidate(self):
+        """Explicit invalidation (after an operator save) drops the entry"""
+        self.cache.put(self.file_path, ready=False)
+        self.cache.invalidate(self.file_path)
+        self.assertIsNone(self.cache.get(self.file_path))
+
+    def test_persists_across_instances(self):
+        """Entries survive a restart of the application"""
+        self.cache.put(self.file_path, ready=True)
+        reopened = StatusCache(cache_dir=self.cache.cache_dir)
+        self.assertTrue(reopened.get(self.file_path, "ready"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+# tests/test_table_models.py
+import unittest
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication, QStyleOptionViewItem
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QPalette
+from GUI.table_models import (
+    RowTableModel, SearchFilterProxy, StatusDelegate, create_table_view, current_source_row, KEY_ROLE,
+)
+
+
+class TestRowTableModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = RowTableModel(["Serial", "Status"])
+        self.model.set_rows([("SN-1", "Pass"), ("SN-2", None)], keys=[11, 12])
+
+    def test_rows_and_keys(self):
+        self.assertEqual((self.model.rowCount(), self.model.columnCount()), (2, 2))
+        self.assertEqual(self.model.data(self.model.index(1, 1)), "")
+        self.assertEqual(self.model.data(self.model.index(1, 0), KEY_ROLE), 12)
+        self.assertEqual(self.model.headerData(1, Qt.Horizontal), "Status")
+        self.assertEqual(self.model.row_for_key(12), 1)
+        self.assertEqual(self.model.row_for_key(99), -1)
+
+    def test_update_row_signals_only_that_row(self):
+        changed = []
+        self.model.dataChanged.connect(lambda tl, br, roles: changed.append((tl.row(), br.row())))
+        self.model.update_row(1, {1: "Fail"})
+        self.assertEqual(self.model.value(1, 1), "Fail")
+        self.assertEqual(changed, [(1, 1)])
+
+    def test_status_delegate_colours(self):
+        view = create_table_view(self.model, status_column=1,
+                                 delegate=StatusDelegate({"Pass": "green"}, default="yellow", bold=True))
+        delegate = view.itemDelegateForColumn(1)
+        for row, colour in ((0, "green"), (1, "yellow")):
+            option = QStyleOptionViewItem()
+            delegate.initStyleOption(option, self.model.index(row, 1))
+            self.assertEqual(option.palette.color(QPalette.Text), QColor(colour))
+            self.assertTrue(option.font.bold())
+
+
+class TestSearchFilterProxy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = RowTableModel(["ID", "Order", "Company", "Status"], search_columns=(1, 2), sort_keys={0: int})
+        self.model.set_rows([(9, "ORD-9", "Acme", "Pending"), (10, "ORD-10", "Globex", "Complete"),
+                             (2, "ORD-2", "Acme West", "Complete")], keys=[9, 10, 2])
+        self.proxy = SearchFilterProxy(self.model)
+
+    def keys(self):
+        return [self.proxy.index(r, 0).data(KEY_ROLE) for r in range(self.proxy.rowCount())]
+
+    def test_search_terms_and_column_filter(self):
+        self.proxy.set_search("  ACME ")
+        self.assertEqual(self.keys(), [9, 2])
+        self.proxy.set_search("acme west")
+        self.assertEqual(self.keys(), [2])
+        self.proxy.set_search("complete")  # status is not a search column
+        self.assertEqual(self.keys(), [])
+
+        self.proxy.set_search("")
+        self.proxy.set_column_filter(3, "Complete")
+        self.assertEqual(self.keys(), [10, 2])
+        self.model.update_row(0, {3: "Complete"})
+        self.assertEqual(self.keys(), [9, 10, 2])
+        self.proxy.set_column_filter(3, None)
+        self.assertEqual(self.proxy.rowCount(), 3)
+
+    def test_sorting_uses_sort_keys_and_keeps_selection(self):
+        view = create_table_view(self.proxy, sortable=True)
+        self.assertEqual(self.keys(), [9, 10, 2])
+        view.setCurrentIndex(self.proxy.index(0, 0))
+        view.sortByColumn(0, Qt.AscendingOrder)
+        self.assertEqual(self.keys(), [2, 9, 10])
+        self.assertEqual(self.model.key(current_source_row(view)), 9)
+        view.sortByColumn(2, Qt.DescendingOrder)
+        self.assertEqual(self.keys(), [10, 2, 9])
+        self.assertEqual(self.model.row_for_key(9), 2)
+
+        # Reloading keeps the chosen order
+        self.model.set_rows([(1, "ORD-1", "Acme", "Pending"), (3, "ORD-3", "Zeta", "Pending")], keys=[1, 3])
+        self.assertEqual(self.keys(), [3, 1])
+
+    def test_insert_and_remove_rows_in_place(self):
+        self.model.sort(0, Qt.DescendingOrder)
+        self.proxy.set_search("acme")
+        self.assertEqual(self.model.insert_row((5, "ORD-5", "Acme", "Pending"), key=5), 2)
+        self.assertEqual(self.model.insert_row((1, "ORD-1", "Acme", "Pending"), key=1), 4)
+        self.model.insert_row((7, "ORD-7", "Globex", "Pending"), key=7)
+        self.assertEqual(self.keys(), [9, 5, 2, 1])
+        self.model.remove_row(self.model.row_for_key(9))
+        self.assertEqual(self.keys(), [5, 2, 1])
+        self.assertEqual(self.model.rows_where({2: "Acme", 3: "Pending"}), [2, 4])
+        self.model.sort(1, Qt.AscendingOrder)
+        self.assertEqual(self.keys(), [1, 2, 5])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
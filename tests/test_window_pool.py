@@ -0,0 +1,147 @@
+# tests/test_window_pool.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+from unittest import mock
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from PyQt5.QtWidgets import QApplication
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+from tests.test_background_loader import settle
+
+
+class WindowPoolTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        for name, role in (("pool_admin", "admin"), ("pool_admin2", "admin"), ("op1", "user"), ("op2", "user")):
+            self.db.add_user(name, "password123", role=role)
+        self.users = {name: self.db.authenticate_user(name, "password123")
+                      for name in ("pool_admin", "pool_admin2", "op1", "op2")}
+        company_id = self.db.add_company("Pool Co", os.path.join(self.test_dir, "PoolCo"))
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.files = []
+        for n in range(2):
+            file_path, _ = self.xlsx_mgr.create_order_file(
+                order_number=f"PL{n}", created_by=self.users["op1"][0], user_id=self.users["op1"][0],
+                company_id=company_id, serial_prefix=f"PL{n}-", serial_count=2)
+            self.files.append(file_path)
+        self.windows = []
+
+    def tearDown(self):
+        for window in self.windows:
+            if hasattr(window, "loader"):
+                window.loader.cancel_all()
+                window.loader.wait(5000)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+
+class TestUserWindowReuse(WindowPoolTestCase):
+    def load_order(self, window, number):
+        window.order_input.setText(number)
+        window.load_order_info()
+
+    def test_next_operator_starts_clean_with_order_kept_warm(self):
+        from GUI.standard_user_window import UserWindow
+        window = UserWindow("op1", self.users["op1"][0], self.db, self.xlsx_mgr)
+        self.windows.append(window)
+        self.load_order(window, "PL0")
+        session = self.xlsx_mgr.get_session(self.files[0])
+        self.assertEqual(window.order_model.rowCount(), 2)
+
+        window.close()
+        window.start_session("op2", self.users["op2"][0])
+        self.assertEqual((window.username, window.user_label.text()), ("op2", "Operator: op2"))
+        self.assertIsNone(window.current_order_id)
+        self.assertEqual(window.order_model.rowCount(), 0)
+        self.assertEqual(window.company_label.text(), "Company: ---")
+        self.assertEqual(window.current_step, 0)
+
+        # Same order again: the copy in memory is reused, names come from the cache
+        with mock.patch.object(self.db, "get_companies_all", wraps=self.db.get_companies_all) as companies_all:
+            self.load_order(window, "PL0")
+        self.assertIs(self.xlsx_mgr.get_session(self.files[0]), session)
+        self.assertEqual(companies_all.call_count, 0)
+        self.assertEqual(window.order_model.value(0, 1), "Pool Co")
+
+        # Another order drops it
+        window.start_session("op1", self.users["op1"][0])
+        self.load_order(window, "PL1")
+        self.assertIsNone(self.xlsx_mgr.get_session(self.files[0]))
+        self.assertIsNotNone(self.xlsx_mgr.get_session(self.files[1]))
+
+
+class TestAdminWindowReuse(WindowPoolTestCase):
+    def test_next_admin_starts_on_create_order_with_panels_kept(self):
+        from GUI.admin_window import AdminWindow
+        window = AdminWindow("pool_admin", self.users["pool_admin"][0], self.db, self.xlsx_mgr)
+        self.windows.append(window)
+        for index in (1, 5, 3):
+            window.show_panel(index)
+            settle(self.app, window.loader)
+        panel = window.panel_awaiting
+        window.await_search_input.setText("PL1")
+        window.order_number_input.setText("half typed")
+
+        window.close()
+        self.db.add_user("late_user", "password123")
+        window.start_session("pool_admin2", self.users["pool_admin2"][0])
+        self.assertEqual(window.user_label.text(), "Admin: pool_admin2")
+        self.assertEqual(window.content_stack.currentIndex(), 0)
+        self.assertEqual((window.order_number_input.text(), window.await_search_input.text()), ("", ""))
+        self.assertIs(window.panel_awaiting, panel)
+        self.assertEqual(window._stale_loads, {"company_tree", "users"})
+
+        # Data refreshed when a panel is next shown; unchanged orders are not rescanned
+        window.show_panel(5)
+        settle(self.app, window.loader)
+        with mock.patch.object(window, "calculate_order_status", wraps=window.calculate_order_status) as scan:
+            window.show_panel(3)
+            settle(self.app, window.loader)
+        self.assertEqual(scan.call_count, 0)
+        self.assertEqual(window.await_model.rowCount(), 2)
+        with self.db.get_connection() as conn:
+            users = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        self.assertEqual(window.user_table.rowCount(), users)
+
+
+class TestAppControllerPool(WindowPoolTestCase):
+    def test_role_windows_and_login_window_reused(self):
+        from GUI.app import AppController
+        with mock.patch("GUI.app.QApplication", return_value=self.app):
+            controller = AppController(self.db, self.xlsx_mgr)
+        login = controller.current_window
+        login.username_input.setText("pool_admin")
+        login.password_input.setText("password123")
+
+        controller.handle_login_success(self.users["pool_admin"])
+        admin = controller.current_window
+        self.windows.append(admin)
+        admin.handle_logout()
+        self.assertIs(controller.current_window, login)
+        self.assertEqual((login.username_input.text(), login.password_input.text()), ("", ""))
+
+        controller.handle_login_success(self.users["op1"])
+        operator = controller.current_window
+        operator.handle_logout()
+        controller.handle_login_success(self.users["pool_admin2"])
+        self.assertIs(controller.current_window, admin)
+        self.assertEqual(admin.username, "pool_admin2")
+        admin.handle_logout()
+        controller.handle_login_success(self.users["op2"])
+        self.assertIs(controller.current_window, operator)
+        self.assertEqual(operator.username, "op2")
+        operator.close()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
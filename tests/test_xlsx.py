@@ -271,5 +271,86 @@ class TestXLSXManager(unittest.TestCase):
         self.assertIsNone(ws_fail.cell(row=2, column=8).value)
 
 
+class TestOrderScanner(unittest.TestCase):
+    """Shared single-pass scanner used by the dashboard and readiness checks"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        self.company_id = self.db.get_companies()[0][0]
+        self.xlsx_mgr = XLSXManager(self.db)
+
+        self.file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number="SCAN1",
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix="SCAN-",
+            serial_count=3,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _set_results(self, results):
+        """results: {excel_row: (pass_fail, timestamp)}"""
+        wb = load_workbook(self.file_path)
+        ws = wb.active
+        for row, (pf, ts) in results.items():
+            ws.cell(row=row, column=7).value = pf
+            ws.cell(row=row, column=8).value = ts
+        wb.save(self.file_path)
+
+    def test_new_order_is_pending(self):
+        scan = self.xlsx_mgr.scan_order_file(self.file_path)
+        self.assertEqual(scan["status"], "Pending")
+        self.assertEqual(scan["pending_count"], 3)
+        self.assertEqual(scan["total_count"], 3)
+        self.assertFalse(scan["ready"])
+        self.assertFalse(self.xlsx_mgr.is_order_ready_for_confirmation(self.file_path))
+
+    def test_active_order_counts(self):
+        self._set_results({
+            2: ("Pass", "Oct 01, 2025 09:00 AM"),
+            3: ("Fail", "Oct 02, 2025 10:30 AM"),
+        })
+        scan = self.xlsx_mgr.scan_order_file(self.file_path)
+        self.assertEqual(scan["status"], "Active")
+        self.assertEqual((scan["pass_count"], scan["fail_count"], scan["pending_count"]), (1, 1, 1))
+        self.assertEqual(scan["first_fail_row"], 3)
+        self.assertEqual(scan["last_timestamp"], "Oct 02, 2025 10:30 AM")
+        self.assertFalse(scan["ready"])
+
+    def test_complete_order_is_ready(self):
+        self._set_results({row: ("Pass", "Oct 01, 2025 09:00 AM") for row in (2, 3, 4)})
+        scan = self.xlsx_mgr.scan_order_file(self.file_path)
+        self.assertEqual(scan["status"], "Complete")
+        self.assertTrue(scan["ready"])
+        self.assertTrue(self.xlsx_mgr.is_order_ready_for_confirmation(self.file_path))
+
+    def test_pass_without_timestamp_not_ready(self):
+        self._set_results({row: ("Pass", None) for row in (2, 3, 4)})
+        scan = self.xlsx_mgr.scan_order_file(self.file_path)
+        self.assertEqual(scan["status"], "Complete")
+        self.assertFalse(scan["ready"])
+
+    def test_fast_reader_matches_openpyxl(self):
+        self._set_results({
+            2: ("Pass", "Oct 01, 2025 09:00 AM"),
+            4: ("Fail", "Oct 03, 2025 11:00 AM"),
+        })
+        slow = XLSXManager(self.db, use_fast_reader=False).scan_order_file(self.file_path)
+        fast = self.xlsx_mgr.scan_order_file(self.file_path)
+        self.assertEqual(fast, slow)
+
+    def test_missing_file(self):
+        scan = self.xlsx_mgr.scan_order_file(os.path.join(self.test_dir, "missing.xlsx"))
+        self.assertEqual(scan["status"], "Unknown")
+        self.assertFalse(scan["ready"])
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
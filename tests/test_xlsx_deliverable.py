@@ -0,0 +1,80 @@
+# tests/test_xlsx_deliverable.py
+import unittest
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from managers.xlsx_manager import ORDER_HEADERS, DELIVERABLE_DIR
+from tests.order_fixtures import OrderTestCase, TS
+
+
+class TestDeliverableExport(OrderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_path, self.order_id = self.make_order("DEL1", 3, serial_prefix="DEL-")
+
+    def _rows(self, path):
+        return [list(r) for r in load_workbook(path).active.iter_rows(values_only=True)]
+
+    def test_deliverable_matches_working_file(self):
+        self.xlsx_mgr.update_order_rows(self.file_path, {
+            2: {"operator": "op1", "pass_fail": "Pass", "timestamp": TS},
+            3: {"operator": "op1", "pass_fail": "Fail", "timestamp": TS, "failure": "short on U3"},
+        })
+
+        # Built from the DB alone while the DB is current
+        self.xlsx_mgr.read_order_bytes = None
+        path, count = self.xlsx_mgr.export_deliverable(self.order_id)
+
+        self.assertEqual(path, os.path.join(self.client_path, DELIVERABLE_DIR, "DEL1.xlsx"))
+        self.assertEqual(count, 3)
+        self.assertEqual(self._rows(path), self._rows(self.file_path))
+        self.assertEqual(load_workbook(path).active.title, "DEL1 Tracking")
+
+    def test_resyncs_when_db_is_behind(self):
+        # Edited by hand in Excel: nothing went through update_order_rows
+        wb = load_workbook(self.file_path)
+        wb.active.cell(row=4, column=7).value = "Pass"
+        wb.save(self.file_path)
+
+        path, _ = self.xlsx_mgr.export_deliverable(self.order_id, os.path.join(self.test_dir, "out.xlsx"))
+        self.assertEqual(self._rows(path)[3][6], "Pass")
+
+    def test_resyncs_hand_edit_with_same_counts(self):
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"pass_fail": "Pass", "timestamp": TS}})
+        self.assertFalse(self.xlsx_mgr._results_behind(self.order_id, self.file_path))
+
+        # Pass moved to another serial and a note added: pass/fail/pending totals unchanged
+        wb = load_workbook(self.file_path)
+        wb.active.cell(row=2, column=7).value = None
+        wb.active.cell(row=3, column=7).value = "Pass"
+        wb.active.cell(row=3, column=9).value = "reseated J2"
+        wb.save(self.file_path)
+        self.assertTrue(self.xlsx_mgr._results_behind(self.order_id, self.file_path))
+
+        path, _ = self.xlsx_mgr.export_deliverable(self.order_id, os.path.join(self.test_dir, "out.xlsx"))
+        self.assertEqual(self._rows(path)[1:3], self._rows(self.file_path)[1:3])
+        self.assertFalse(self.xlsx_mgr._results_behind(self.order_id, self.file_path))
+
+    def test_legacy_order_without_results(self):
+        legacy = os.path.join(self.client_path, "OLD1.xlsx")
+        wb = Workbook()
+        wb.active.append(ORDER_HEADERS)
+        wb.active.append([self.user_id, TS, "op", self.company_id, None, "OLD-1", "Pass", TS, None, None])
+        wb.save(legacy)
+        order_id = self.db.add_order("OLD1", self.company_id, None, legacy, self.user_id)
+
+        path, count = self.xlsx_mgr.export_deliverable(order_id)
+        self.assertEqual(count, 1)
+        self.assertEqual(self._rows(path)[1][5:8], ["OLD-1", "Pass", TS])
+
+    def test_delete_order_drops_results(self):
+        self.db.delete_order_permanently(self.order_id)
+        self.assertEqual(self.db.get_serial_result_counts(self.order_id), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
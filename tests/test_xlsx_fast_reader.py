@@ -0,0 +1,103 @@
+# tests/test_xlsx_fast_reader.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import zipfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from managers.xlsx_fast_reader import FastSheetReader, FastReaderUnsupported, column_index, column_letter
+
+WORKBOOK_XML = (
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<bookViews><workbookView activeTab="1"/></bookViews>'
+    '<sheets><sheet name="Other" sheetId="1" r:id="rId1"/><sheet name="Orders" sheetId="2" r:id="rId2"/></sheets>'
+    '</workbook>'
+)
+RELS_XML = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet2.xml"/>'
+    '</Relationships>'
+)
+SST_XML = (
+    '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<si><t>Serial Number</t></si><si><t>pass/fail</t></si>'
+    '<si><r><t>SN-</t></r><r><t>0001</t></r></si><si><t>Pass</t></si>'
+    '</sst>'
+)
+SHEET2_XML = (
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+    '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+    '<row r="2"><c r="A2" t="s"><v>2</v></c><c r="B2" t="s"><v>3</v></c><c r="C2"><v>42</v></c></row>'
+    '<row><c t="inlineStr"><is><t>SN-0002</t></is></c><c t="b"><v>1</v></c></row>'
+    '</sheetData></worksheet>'
+)
+
+
+class TestFastSheetReader(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _excel_style_file(self):
+        """Hand-built workbook using shared strings, rich text and a non-first active sheet"""
+        path = os.path.join(self.test_dir, "excel_style.xlsx")
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("xl/workbook.xml", WORKBOOK_XML)
+            zf.writestr("xl/_rels/workbook.xml.rels", RELS_XML)
+            zf.writestr("xl/sharedStrings.xml", SST_XML)
+            zf.writestr("xl/worksheets/sheet1.xml", "<worksheet/>")
+            zf.writestr("xl/worksheets/sheet2.xml", SHEET2_XML)
+        return path
+
+    def test_column_helpers(self):
+        for idx in (0, 6, 25, 26, 701, 702):
+            self.assertEqual(column_index(column_letter(idx) + "12"), idx)
+
+    def test_reads_active_sheet_with_shared_strings(self):
+        with FastSheetReader(self._excel_style_file()) as reader:
+            self.assertEqual(reader.header(), ("Serial Number", "pass/fail"))
+            rows = list(reader.iter_rows(min_row=2))
+        self.assertEqual(rows, [
+            (2, ["SN-0001", "Pass", 42]),
+            (3, ["SN-0002", True]),
+        ])
+
+    def test_selected_columns_only(self):
+        with FastSheetReader(self._excel_style_file()) as reader:
+            rows = list(reader.iter_rows(columns=[1], min_row=2))
+        self.assertEqual(rows, [(2, [None, "Pass"]), (3, [None, True])])
+
+    def test_matches_openpyxl(self):
+        path = os.path.join(self.test_dir, "openpyxl_style.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Serial Number", "pass/fail", "pass/fail timestamp", "qty"])
+        ws.append(["SN-1", "Pass", "Oct 01, 2025 09:00 AM", 3])
+        ws.append(["SN-2", None, None, 2.5])
+        ws.append(["SN-3", "Fail", "Oct 02, 2025 09:00 AM", None])
+        wb.save(path)
+
+        expected = [list(r) for r in load_workbook(path, read_only=True).active.iter_rows(values_only=True)]
+        with FastSheetReader(path) as reader:
+            actual = [values + [None] * (4 - len(values)) for _, values in reader.iter_rows()]
+        self.assertEqual(actual, expected)
+
+    def test_not_a_workbook(self):
+        path = os.path.join(self.test_dir, "broken.xlsx")
+        with open(path, "wb") as fh:
+            fh.write(b"not a zip")
+        with self.assertRaises(FastReaderUnsupported):
+            FastSheetReader(path)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+# tests/test_xlsx_row_patcher.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+import zipfile
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Alignment, Font
+from managers.xlsx_row_patcher import patch_sheet_rows, patch_workbook_rows, RowPatchUnsupported
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager
+
+
+class TestRowPatcher(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.test_dir, "order.xlsx")
+        self.dest = os.path.join(self.test_dir, "patched.xlsx")
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Serial Number", "pass/fail", "pass/fail timestamp", "Failure Explanation"])
+        for i in range(1, 6):
+            ws.append([f"SN-{i}", "Pending", None, None])
+        for row in range(2, 7):
+            ws.cell(row=row, column=4).alignment = Alignment(wrap_text=True)
+        ws.cell(row=1, column=1).font = Font(bold=True)
+        wb.save(self.src)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_patches_only_requested_rows(self):
+        patch_workbook_rows(self.src, self.dest, {
+            3: {1: "Pass", 2: "Oct 01, 2025 09:00 AM"},
+            5: {1: "Fail", 2: "Oct 01, 2025 09:05 AM", 3: "Bad <solder> & flux"},
+        })
+
+        ws = load_workbook(self.dest).active
+        self.assertEqual([c.value for c in ws[3]], ["SN-2", "Pass", "Oct 01, 2025 09:00 AM", None])
+        self.assertEqual([c.value for c in ws[5]], ["SN-4", "Fail", "Oct 01, 2025 09:05 AM", "Bad <solder> & flux"])
+        # Untouched rows and existing styles survive
+        self.assertEqual([c.value for c in ws[2]], ["SN-1", "Pending", None, None])
+        self.assertEqual(ws.max_row, 6)
+        self.assertTrue(ws.cell(row=5, column=4).alignment.wrap_text)
+        self.assertTrue(ws.cell(row=1, column=1).font.bold)
+
+    def test_other_members_copied_verbatim(self):
+        patch_workbook_rows(self.src, self.dest, {2: {1: "Pass"}})
+        with zipfile.ZipFile(self.src) as a, zipfile.ZipFile(self.dest) as b:
+            self.assertEqual(a.namelist(), b.namelist())
+            for name in a.namelist():
+                if name != "xl/worksheets/sheet1.xml":
+                    self.assertEqual(a.read(name), b.read(name))
+            self.assertIsNone(b.testzip())
+
+    def test_missing_row_unsupported(self):
+        with self.assertRaises(RowPatchUnsupported):
+            patch_sheet_rows(b'<worksheet><sheetData><row r="1"/></sheetData></worksheet>', {9: {0: "x"}})
+
+    def test_self_closing_row_gets_cells(self):
+        xml = b'<worksheet><sheetData><row r="1" spans="1:2"/><row r="10"/></sheetData></worksheet>'
+        patched = patch_sheet_rows(xml, {1: {1: 5}})
+        self.assertIn(b'<row r="1"><c r="B1" t="n"><v>5</v></c></row><row r="10"/>', patched)
+
+
+class TestUpdateOrderRows(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        self.company_id = self.db.get_companies()[0][0]
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number="PATCH1",
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix="PATCH-",
+            serial_count=2,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_operator_results_saved(self):
+        ts = "Oct 01, 2025 09:00 AM"
+        self.xlsx_mgr.update_order_rows(self.file_path, {
+            2: {"operator": "op1", "pass_fail": "Pass", "timestamp": ts},
+            3: {"operator": "op1", "pass_fail": "Pass", "timestamp": ts},
+        })
+
+        ws = load_workbook(self.file_path).active
+        self.assertEqual(ws.cell(row=2, column=3).value, "op1")
+        self.assertEqual(ws.cell(row=3, column=7).value, "Pass")
+        self.assertEqual(ws.cell(row=3, column=8).value, ts)
+        self.assertEqual(ws.cell(row=2, column=6).value, "PATCH-00001")
+        self.assertTrue(self.xlsx_mgr.is_order_ready_for_confirmation(self.file_path))
+        self.assertEqual(
+            [f for f in os.listdir(os.path.dirname(self.file_path)) if f.startswith("lt_tmp_")], [])
+
+    def test_falls_back_to_openpyxl(self):
+        """Workbooks the patcher rejects are still saved through openpyxl"""
+        with zipfile.ZipFile(self.file_path) as zin:
+            members = {name: zin.read(name) for name in zin.namelist()}
+        sheet = members["xl/worksheets/sheet1.xml"]
+        # Drop row 3 so the patcher cannot find it
+        start = sheet.index(b'<row r="3"')
+        members["xl/worksheets/sheet1.xml"] = sheet[:start] + sheet[sheet.index(b"</row>", start) + 6:]
+        with zipfile.ZipFile(self.file_path, "w", zipfile.ZIP_DEFLATED) as zout:
+            for name, data in members.items():
+                zout.writestr(name, data)
+
+        self.xlsx_mgr.update_order_rows(self.file_path, {3: {"pass_fail": "Fail"}})
+        self.assertEqual(load_workbook(self.file_path).active.cell(row=3, column=7).value, "Fail")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
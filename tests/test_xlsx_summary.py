@@ -0,0 +1,105 @@
+# tests/test_xlsx_summary.py
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from openpyxl import Workbook, load_workbook
+from managers.db_manager import DatabaseManager
+from managers.xlsx_manager import XLSXManager, ORDER_HEADERS
+from managers.xlsx_summary import read_workbook_summary
+
+TS = "Oct 01, 2025 09:00 AM"
+
+
+class TestWorkbookSummary(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(db_path=os.path.join(self.test_dir, "db"), db_name="test.db")
+        self.db.add_user("test_user", "password123", role="admin")
+        self.user_id = self.db.authenticate_user("test_user", "password123")[0]
+        self.db.add_company("Test Company", os.path.join(self.test_dir, "TestCompany"))
+        self.company_id = self.db.get_companies()[0][0]
+        self.xlsx_mgr = XLSXManager(self.db)
+        self.file_path, _ = self.xlsx_mgr.create_order_file(
+            order_number="SUM1",
+            created_by=self.user_id,
+            user_id=self.user_id,
+            company_id=self.company_id,
+            serial_prefix="SUM-",
+            serial_count=3,
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _full_scan(self):
+        return self.xlsx_mgr._scan_from_summary(self.file_path, self.xlsx_mgr._tally_source(self.file_path, ""))
+
+    def _summary_scan(self):
+        summary = read_workbook_summary(self.file_path)
+        self.assertIsNotNone(summary)
+        return self.xlsx_mgr._scan_from_summary(self.file_path, summary)
+
+    def test_new_order_has_summary(self):
+        summary = read_workbook_summary(self.file_path)
+        self.assertEqual((summary["total_count"], summary["pending_count"]), (3, 3))
+        self.assertEqual(summary["updated_by"], "test_user")
+        self.assertEqual(load_workbook(self.file_path).active.max_row, 4)
+
+    def test_saves_keep_summary_in_step(self):
+        self.xlsx_mgr.update_order_rows(self.file_path, {2: {"operator": "op1", "pass_fail": "Pass", "timestamp": TS}})
+        self.xlsx_mgr.update_order_rows(self.file_path, {3: {"pass_fail": "Fail", "timestamp": TS}})
+        self.assertEqual(self._summary_scan(), self._full_scan())
+        self.assertEqual(self._summary_scan()["first_fail_row"], 3)
+
+        # Repair of the failed board, then the last one passes
+        self.xlsx_mgr.update_order_rows(self.file_path, {
+            3: {"pass_fail": "Pass", "timestamp": "Oct 02, 2025 10:00 AM", "fix": "reflowed"},
+            4: {"pass_fail": "Pass", "timestamp": TS},
+        })
+        scan = self._summary_scan()
+        self.assertEqual(scan, self._full_scan())
+        self.assertEqual(scan["status"], "Complete")
+        self.assertTrue(scan["ready"])
+        self.assertIsNone(scan["first_fail_row"])
+        self.assertEqual(scan["last_timestamp"], "Oct 02, 2025 10:00 AM")
+
+    def test_status_check_skips_rows(self):
+        self.xlsx_mgr._tally_source = None  # would raise if the rows were scanned
+        self.assertEqual(self.xlsx_mgr.scan_order_file(self.file_path)["pending_count"], 3)
+
+    def test_external_edit_invalidates_summary(self):
+        wb = load_workbook(self.file_path)
+        wb.active.cell(row=2, column=7).value = "Fail"
+        wb.save(self.file_path)
+
+        self.assertIsNone(read_workbook_summary(self.file_path))
+        self.assertEqual(self.xlsx_mgr.scan_order_file(self.file_path)["fail_count"], 1)
+
+        # The next save rebuilds it
+        self.xlsx_mgr.update_order_rows(self.file_path, {3: {"pass_fail": "Pass", "timestamp": TS}})
+        self.assertEqual(self._summary_scan(), self._full_scan())
+        self.assertEqual(self._summary_scan()["fail_count"], 1)
+
+    def test_legacy_file_gains_summary(self):
+        legacy = os.path.join(self.test_dir, "legacy.xlsx")
+        wb = Workbook()
+        wb.active.append(ORDER_HEADERS)
+        wb.active.append([1, TS, "op", 1, None, "OLD-1", "Pending", None, None, None])
+        wb.save(legacy)
+        self.assertIsNone(read_workbook_summary(legacy))
+
+        self.xlsx_mgr.update_order_rows(legacy, {2: {"pass_fail": "Pass", "timestamp": TS}})
+        summary = read_workbook_summary(legacy)
+        self.assertEqual((summary["pass_count"], summary["timestamped_passes"]), (1, 1))
+        props = {p.name: p.value for p in load_workbook(legacy).custom_doc_props}
+        self.assertEqual(props["lt_pass_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)